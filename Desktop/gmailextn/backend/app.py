@@ -1,10 +1,19 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
 from flask_cors import CORS
 from services.skill_extractor import SkillExtractor
 from services.boolean_generator import BooleanGenerator
+from services.email_normalizer import NORMALIZE_EMAIL, normalize_email
+from services.experiments import get_experiments, skill_agreement
+from services.multi_posting import analyze_posting, analyze_postings, split_postings
+from services.pipeline_config import PipelineRun, active_config, pinned
+from services.shadow import get_shadow_runner
+from services.skill_record import skills_to_dicts
+from services.traffic_capture import get_traffic_capture
 from dotenv import load_dotenv
 import os
 import json
+import time
+from functools import partial
 from datetime import datetime
 
 load_dotenv()
@@ -13,6 +22,23 @@ app = Flask(__name__)
 skill_extractor = SkillExtractor()
 CORS(app)
 analytics_data = []
+traffic_capture = get_traffic_capture()
+shadow_runner = get_shadow_runner(skill_extractor)
+experiments = get_experiments()
+
+@app.before_request
+def start_capture():
+    # Sampled request/response capture for replay_traffic.py (FIRKI_CAPTURE_DIR)
+    if traffic_capture and traffic_capture.should_capture(request.path):
+        g.capture_start = time.perf_counter()
+
+@app.after_request
+def finish_capture(response):
+    start = g.pop('capture_start', None)
+    if start is not None:
+        traffic_capture.record(request.path, request.get_json(silent=True), response.status_code,
+                               response.get_json(silent=True), (time.perf_counter() - start) * 1000)
+    return response
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -75,6 +101,18 @@ def get_analytics_summary():
         print(f"Error getting analytics summary: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/shadow/summary', methods=['GET'])
+def get_shadow_summary():
+    if not shadow_runner:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **shadow_runner.summary()})
+
+@app.route('/experiments', methods=['GET'])
+def get_experiment_results():
+    if not experiments:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, 'experiments': experiments.summary(request.args.get('name'))})
+
 @app.route('/api/detect-job-email', methods=['POST'])
 def detect_job_email():
     """
@@ -89,25 +127,47 @@ def detect_job_email():
         if not email_content:
             return jsonify({'error': 'Email content is required'}), 400
         
+        # Drop markup, quoted history, signatures and footers before analysis
+        if NORMALIZE_EMAIL:
+            email_content = normalize_email(email_content)
+        
         from services.job_email_detector import JobEmailDetector
         detector = JobEmailDetector()
         
         is_job, confidence, details = detector.is_job_email(email_content, subject, sender)
         context = detector.get_job_context(email_content)
         
-        return jsonify({
-            'success': True,
-            'data': {
-                'is_job_email': is_job,
-                'confidence': confidence,
-                'context': context,
-                'detection_details': details
-            }
-        })
+        data = {
+            'is_job_email': is_job,
+            'confidence': confidence,
+            'context': context,
+            'detection_details': details
+        }
+        # Agency emails listing several openings: one context per role
+        postings = split_postings(email_content) if is_job else []
+        if len(postings) > 1:
+            data['roles'] = []
+            for posting in postings:
+                role_context = detector.get_job_context(posting.text)
+                role_context['job_title'] = posting.title or role_context['job_title']
+                data['roles'].append(role_context)
+        
+        return jsonify({'success': True, 'data': data})
     except Exception as e:
         print(f"Error detecting job email: {e}")
         return jsonify({'error': str(e)}), 500
 
+def _posting_data(result):
+    """Response fields for one analysed posting"""
+    return {
+        'skills': skills_to_dicts(result['skills']),
+        'boolean_search': result['boolean_search'],
+        'extraction_method': result['extraction_method'],
+        'ai_context': result['ai_context'],
+        'ai_boolean_used': bool(result['ai_boolean']),
+        'ai_questions': result['ai_questions']
+    }
+
 @app.route('/api/analyze-jd', methods=['POST'])
 def analyze_job_description():
     try:
@@ -118,41 +178,56 @@ def analyze_job_description():
         if not job_description:
             return jsonify({'error': 'Job description is required'}), 400
         
-        skills = skill_extractor.extract_skills(job_description, job_title)
-        ai_context = ""
-        ai_boolean = ""
+        if NORMALIZE_EMAIL:
+            job_description = normalize_email(job_description)
         
+        postings = split_postings(job_description)
+        
+        # Experiment arm (sticky per session or JD); its pipeline config holds for the whole request, every role included
+        arm = experiments.assign(data, request.headers) if experiments else None
+        config = active_config()
+        run = PipelineRun(arm.config_for(config) if arm else config)
+        request_start = time.perf_counter()
         try:
-            from services.dynamic_recruiter import DynamicRecruiterTool
-            dynamic_tool = DynamicRecruiterTool()
-            ai_result = dynamic_tool.analyze_job_dynamically(job_description, job_title)
-            
-            if ai_result.get('extractionMethod') == 'ai_dynamic_analysis':
-                ai_context = ai_result.get('keySkillContext', '')
-                ai_boolean = ai_result.get('booleanString', '')
-                ai_questions = ai_result.get('aiQuestions', [])
-        except Exception as e:
-            print(f"Dynamic recruiter tool failed: {e}")
-            ai_questions = []
-        
-        if ai_boolean:
-            boolean_search = ai_boolean
-        else:
-            boolean_generator = BooleanGenerator()
-            boolean_search = boolean_generator.generate_boolean_search(skills, job_title)
-        
-        response = {
-            'success': True,
-            'data': {
-                'skills': skills,
-                'boolean_search': boolean_search,
-                'extraction_method': skill_extractor.last_method_used,
-                'ai_context': ai_context,
-                'ai_boolean_used': bool(ai_boolean),
-                'ai_questions': ai_questions
-            }
-        }
-        return jsonify(response)
+            with pinned(run.config, run):
+                if len(postings) > 1:
+                    # Several openings in one email: analyse each role on its own, concurrently
+                    from services.job_email_detector import JobEmailDetector
+                    roles = analyze_postings(postings, skill_extractor, BooleanGenerator(), JobEmailDetector())
+                    results = [role for role in roles if 'error' not in role]
+                    if not results:
+                        raise RuntimeError(roles[0]['error'])
+                else:
+                    roles = None
+                    results = [analyze_posting(job_description, job_title, skill_extractor, BooleanGenerator())]
+        except Exception:
+            if arm:
+                arm.metrics.record((time.perf_counter() - request_start) * 1000, run, error=True)
+            raise
+        
+        # Top-level fields describe the first role, as for a single posting
+        response = {'success': True, 'data': _posting_data(results[0])}
+        if roles is not None:
+            response['data']['roles'] = [
+                role if 'error' in role else {'job_title': role['job_title'], **_posting_data(role),
+                                              'context': role['context']}
+                for role in roles
+            ]
+        if arm:
+            # Proxy quality: agreement with the dynamic analysis skills, averaged over the roles where it answered
+            scores = [skill_agreement([skill.name for skill in result['skills']], result['ai_skills'],
+                                      skill_extractor.taxonomy.canonical_key)
+                      for result in results if result['ai_skills'] is not None]
+            quality = sum(scores) / len(scores) if scores else None
+            arm.metrics.record((time.perf_counter() - request_start) * 1000, run, quality)
+            response['data']['experiment'] = {'name': arm.experiment, 'arm': arm.name}
+        response = jsonify(response)
+        # Alternate pipeline on the same inputs, once the response has been sent
+        if shadow_runner and shadow_runner.should_shadow():
+            for result in results:
+                response.call_on_close(partial(shadow_runner.submit, result['text'], result['job_title'],
+                                               result['skills'], result['extraction_method'], result['extract_ms']))
+        return response
     except Exception as e:
         print(f"Error analyzing job description: {e}")
         return jsonify({'error': str(e)}), 500
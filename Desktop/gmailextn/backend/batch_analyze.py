@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Run skill extraction and boolean generation over a JSONL corpus.
+
+Each input line is {"id": ..., "title": ..., "description": ...}. Records
+are sent in batches to a process pool; every worker builds its own
+SkillExtractor and BooleanGenerator once and reuses them. Output is one
+JSON line per record with its skills, boolean string and extraction
+method, in input order unless --unordered.
+
+Usage:
+    python batch_analyze.py INPUT.jsonl OUTPUT.jsonl [--processes N] [--batch-size 16] [--unordered] [--local-only]
+
+--local-only runs the pattern/keyword strategies and rule-based boolean
+generation only, with no provider calls.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from dotenv import load_dotenv
+
+# Services of this worker process, built once by _init_worker
+_extractor = None
+_boolean_generator = None
+
+
+def _init_worker(local_only: bool, verbose: bool):
+    global _extractor, _boolean_generator
+    load_dotenv()
+    if not verbose:
+        # The services log every step; keep worker output off the terminal
+        sys.stdout = open(os.devnull, 'w')
+    from services.boolean_generator import BooleanGenerator
+    from services.skill_extractor import SkillExtractor
+    _extractor = SkillExtractor()
+    if local_only:
+        _extractor.extraction_mode = 'local'
+    _boolean_generator = BooleanGenerator(local_only=local_only)
+
+
+def _analyze_line(line: str) -> dict:
+    from services.skill_record import skills_to_dicts
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return {'id': None, 'error': f"invalid JSON: {e}"}
+    record_id = record.get('id')
+    title = record.get('title') or ''
+    try:
+        skills = _extractor.extract_skills(record.get('description') or '', title)
+        return {
+            'id': record_id,
+            'title': title,
+            'skills': skills_to_dicts(skills),
+            'boolean_search': _boolean_generator.generate_boolean_search(skills, title),
+            'extraction_method': _extractor.last_method_used,
+        }
+    except Exception as e:
+        print(f"Error analyzing record {record_id}: {e}")
+        return {'id': record_id, 'error': str(e)}
+
+
+def _analyze_batch(lines):
+    return [_analyze_line(line) for line in lines]
+
+
+def _batches(path: str, batch_size: int):
+    with open(path, 'r', encoding='utf-8') as f:
+        batch = []
+        for line in f:
+            if line.strip():
+                batch.append(line)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _count_records(path: str) -> int:
+    with open(path, 'rb') as f:
+        return sum(1 for line in f if line.strip())
+
+
+class Progress:
+    """Records done, rate and ETA on stderr, at most every `interval` seconds"""
+
+    def __init__(self, total: int, interval: float = 2.0):
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.started = time.perf_counter()
+        self._last = 0.0
+
+    def update(self, count: int, final: bool = False):
+        self.done += count
+        elapsed = time.perf_counter() - self.started
+        if not final and elapsed - self._last < self.interval:
+            return
+        self._last = elapsed
+        rate = self.done / elapsed if elapsed else 0.0
+        eta = (self.total - self.done) / rate if rate else 0.0
+        print(f"\r{self.done}/{self.total} records  {rate:.1f}/s  ETA {eta:.0f} s ", end='', file=sys.stderr)
+        if final:
+            print(file=sys.stderr)
+
+
+def run(args) -> Counter:
+    total = _count_records(args.input)
+    progress = Progress(total)
+    stats = Counter()
+    # Bounded number of batches in flight keeps memory flat on big corpora
+    max_in_flight = args.processes * 4
+
+    with open(args.output, 'w', encoding='utf-8') as out, \
+            ProcessPoolExecutor(max_workers=args.processes, initializer=_init_worker,
+                                initargs=(args.local_only, args.verbose)) as executor:
+
+        def write(results):
+            for result in results:
+                stats['error' if 'error' in result else result['extraction_method']] += 1
+                out.write(json.dumps(result) + '\n')
+            progress.update(len(results))
+
+        pending = deque()
+        for batch in _batches(args.input, args.batch_size):
+            pending.append(executor.submit(_analyze_batch, batch))
+            if len(pending) < max_in_flight:
+                continue
+            if args.unordered:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    write(future.result())
+            else:
+                write(pending.popleft().result())
+
+        while pending:
+            write(pending.popleft().result())
+
+    progress.update(0, final=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='JSONL with id, title, description')
+    parser.add_argument('output', help='JSONL results')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--batch-size', type=int, default=16, help='records per task sent to a worker')
+    parser.add_argument('--unordered', action='store_true', help='write results as they finish')
+    parser.add_argument('--local-only', action='store_true', help='no provider calls (patterns, keywords, rules)')
+    parser.add_argument('--verbose', action='store_true', help='keep the services\' debug output')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = run(args)
+    elapsed = time.perf_counter() - started
+
+    records = sum(stats.values())
+    print(f"{records} records in {elapsed:.1f} s ({records / elapsed:.1f} records/s, "
+          f"{args.processes} processes) -> {args.output}")
+    print("methods: " + ', '.join(f"{method} {count}" for method, count in stats.most_common()))
+
+
+if __name__ == "__main__":
+    main()
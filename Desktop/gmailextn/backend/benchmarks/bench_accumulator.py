@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark SkillAccumulator against the previous list-based dedupe.
+
+Before the accumulator every strategy did
+`skill['name'] not in [s['name'] for s in skills]` per candidate (O(n^2)
+per JD) and _deduplicate_and_rank then deduped again by lowercase and
+sorted the full list. This script replays both on synthetic JDs with
+hundreds of candidate mentions (case variants and aliases included).
+
+Run from the backend directory:
+    python benchmarks/bench_accumulator.py [--mentions 100 500 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.skill_accumulator import SkillAccumulator
+from services.taxonomy import get_taxonomy
+
+SOURCES = [('direct_tech', 0.9), ('tech_context', 0.8), ('role_tech', 0.7),
+           ('bullet_tech', 0.6), ('keyword_match', 0.5)]
+
+
+def build_mentions(count: int, seed: int):
+    """Candidate mentions the way strategies emit them: repeats, case and alias variants"""
+    taxonomy = get_taxonomy()
+    rng = random.Random(seed)
+    names = [skill['name'] for skill in taxonomy.skills.values()]
+    # Plus the long tail of phrases that aren't in the taxonomy
+    names += [f"Internal Tool {i}" for i in range(count // 4)]
+
+    mentions = []
+    for _ in range(count):
+        name = rng.choice(names)
+        name = rng.choice([name, name.lower(), name.upper()])
+        source, confidence = rng.choice(SOURCES)
+        mentions.append({'name': name, 'confidence': confidence, 'source': source})
+    return mentions
+
+
+def legacy_dedupe(mentions, k=5):
+    skills = []
+    for skill in mentions:
+        if skill['name'] not in [s['name'] for s in skills]:
+            skills.append(skill)
+
+    seen = set()
+    unique_skills = []
+    for skill in skills:
+        skill_name = skill['name'].lower()
+        if skill_name not in seen:
+            seen.add(skill_name)
+            unique_skills.append(skill)
+    unique_skills.sort(key=lambda x: x['confidence'], reverse=True)
+    return unique_skills[:k]
+
+
+def accumulator_dedupe(mentions, k=5):
+    skills = SkillAccumulator()
+    skills.extend(mentions)
+    return skills.top(k)
+
+
+def bench(fn, mentions, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(mentions)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mentions', type=int, nargs='+', default=[100, 500, 2000])
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'mentions':>9} {'legacy ms':>10} {'accumulator ms':>15} {'speedup':>8} {'legacy uniq':>12} {'acc uniq':>9}")
+    for count in args.mentions:
+        mentions = build_mentions(count, args.seed)
+        legacy_ms = bench(legacy_dedupe, mentions, args.repeats)
+        acc_ms = bench(accumulator_dedupe, mentions, args.repeats)
+
+        # How many distinct skills each approach believes it saw
+        legacy_unique = len({m['name'].lower() for m in mentions})
+        acc = SkillAccumulator()
+        acc.extend(mentions)
+
+        print(f"{count:>9} {legacy_ms:>10.2f} {acc_ms:>15.2f} {legacy_ms / acc_ms:>7.1f}x "
+              f"{legacy_unique:>12} {len(acc):>9}")
+
+
+if __name__ == "__main__":
+    main()
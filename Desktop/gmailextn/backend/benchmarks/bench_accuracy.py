@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Precision, recall, F1 and latency (p50/p95) of each skill extraction
+strategy on the gold-labeled JDs in gold_samples.py.
+
+Skills match gold labels through the taxonomy's canonical keys; scores
+are micro-averaged over the corpus. The LLM strategies run against stub
+providers (--llm-latency seconds per call) that answer with the taxonomy
+skills in the prompt plus a few non-skill lines. Their scores measure
+the prompt compaction and response parsing/filtering, not the model.
+`extract_skills` is the full cascade with the dynamic analysis skipped
+and the stub Gemini answering.
+
+--json writes a machine-readable report (commit, taxonomy version, corpus
+digest, per-strategy scores and latencies) to track across releases.
+
+Run from the backend directory:
+    python benchmarks/bench_accuracy.py [--repeats 5] [--llm-latency 0.02] [--json report.json]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import providers
+from services.skill_extractor import SkillExtractor
+from gold_samples import GOLD_JDS
+
+# Lines a real model adds that the response filter should drop
+STUB_NOISE = ["Strong communication skills", "Interview Process - Prescreen", "Develop"]
+
+
+def stub_answer(taxonomy, prompt):
+    """What the stub model replies: one line per taxonomy skill in the prompt's JD, then noise"""
+    job_text = prompt.split('Job Description:', 1)[-1].split('IMPORTANT:', 1)[0]
+    names = [taxonomy.name_for(skill_id) for skill_id in taxonomy.find_in_text(job_text)]
+    return '\n'.join([f"- {name}" for name in names] + STUB_NOISE)
+
+
+class StubGeminiModel:
+    def __init__(self, taxonomy, latency):
+        self.taxonomy = taxonomy
+        self.latency = latency
+
+    def generate_content(self, prompt):
+        time.sleep(self.latency)
+        return SimpleNamespace(text=stub_answer(self.taxonomy, prompt))
+
+
+class StubChatCompletion:
+    taxonomy = None
+    latency = 0.0
+
+    @classmethod
+    def create(cls, model, messages, **kwargs):
+        time.sleep(cls.latency)
+        content = stub_answer(cls.taxonomy, messages[-1]['content'])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def score(extractor, strategy, repeats):
+    tp = fp = fn = 0
+    latencies = []
+    for _, title, jd, gold in GOLD_JDS:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                skills = strategy(jd, title)
+            latencies.append((time.perf_counter() - start) * 1000)
+        found = {extractor.taxonomy.canonical_key(skill.name) for skill in skills}
+        expected = {extractor.taxonomy.canonical_key(name) for name in gold}
+        tp += len(found & expected)
+        fp += len(found - expected)
+        fn += len(expected - found)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        'precision': round(precision, 4),
+        'recall': round(recall, 4),
+        'f1': round(f1, 4),
+        'tp': tp,
+        'fp': fp,
+        'fn': fn,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50), 3),
+            'p95': round(percentile(latencies, 95), 3),
+            'mean': round(sum(latencies) / len(latencies), 3),
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def corpus_digest():
+    digest = hashlib.sha256()
+    for jd_id, title, jd, gold in GOLD_JDS:
+        digest.update(json.dumps([jd_id, title, jd, sorted(gold)]).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=5, help='timed runs per JD and strategy')
+    parser.add_argument('--llm-latency', type=float, default=0.02, help='seconds per stub provider call')
+    parser.add_argument('--json', help='write the report to this file')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    extractor.gemini_model = StubGeminiModel(extractor.taxonomy, args.llm_latency)
+    StubChatCompletion.taxonomy, StubChatCompletion.latency = extractor.taxonomy, args.llm_latency
+    providers.openai.ChatCompletion = StubChatCompletion
+
+    def no_dynamic_analysis(job_description, job_title):
+        raise RuntimeError("dynamic analysis skipped in benchmark")
+
+    extractor._extract_with_dynamic_analysis = no_dynamic_analysis
+
+    strategies = {
+        'intelligent_patterns': lambda jd, title: extractor._extract_intelligent_patterns(jd),
+        'basic_extraction': lambda jd, title: extractor._basic_skill_extraction(jd),
+        'nlp': extractor._extract_with_nlp,
+        'gemini_stub': extractor._extract_with_gemini,
+        'openai_stub': extractor._extract_with_openai,
+        'extract_skills': extractor.extract_skills,
+    }
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'taxonomy_version': extractor.taxonomy.version,
+        'spacy_pipeline': extractor.nlp.pipe_names,
+        'corpus': {'jds': len(GOLD_JDS), 'gold_skills': sum(len(gold) for *_, gold in GOLD_JDS),
+                   'digest': corpus_digest()},
+        'repeats': args.repeats,
+        'llm_stub_latency_s': args.llm_latency,
+        'strategies': {},
+    }
+
+    print(f"{'strategy':<22} {'P':>6} {'R':>6} {'F1':>6} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, strategy in strategies.items():
+        result = score(extractor, strategy, args.repeats)
+        report['strategies'][name] = result
+        latency = result['latency_ms']
+        print(f"{name:<22} {result['precision']:>6.2f} {result['recall']:>6.2f} {result['f1']:>6.2f} "
+              f"{latency['p50']:>8.2f} {latency['p95']:>8.2f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Deterministic pipeline timings from a recorded LLM cassette.
+
+--record runs analyze_job_dynamically, _extract_with_gemini and
+_generate_context_with_gemini over the sample JDs against the configured
+providers (live keys, or the stub server via FIRKI_GEMINI_ENDPOINT) and
+writes every prompt, response and latency to the cassette. Without
+--record the same calls are replayed from the cassette, offline: the
+answers are identical on every run, so differences in the timings come
+from the pipeline code. --latency-scale 1 replays with the recorded
+provider latency, 0 (default) without it.
+
+Prints p50/p95 per function and the cassette's hits and misses. A miss
+means a prompt changed since recording; re-record the cassette.
+
+Run from the backend directory:
+    python benchmarks/bench_cassette.py --record [--cassette benchmarks/cassettes/sample_jds.jsonl.gz]
+    python benchmarks/bench_cassette.py [--repeats 20] [--latency-scale 0]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Add the backend directory to Python path
+sys.path.append(BACKEND_DIR)
+
+DEFAULT_CASSETTE = os.path.join(BACKEND_DIR, 'benchmarks', 'cassettes', 'sample_jds.jsonl.gz')
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cassette', default=DEFAULT_CASSETTE)
+    parser.add_argument('--record', action='store_true', help='call the providers and (re)write the cassette')
+    parser.add_argument('--repeats', type=int, default=20, help='replay runs per JD and function')
+    parser.add_argument('--latency-scale', type=float, default=0.0, help='replay sleep, x recorded latency')
+    args = parser.parse_args()
+
+    if args.record:
+        os.makedirs(os.path.dirname(os.path.abspath(args.cassette)), exist_ok=True)
+        if os.path.exists(args.cassette):
+            os.remove(args.cassette)
+    elif not os.path.exists(args.cassette):
+        raise SystemExit(f"{args.cassette} not found; record it first with --record")
+    # Read by services.cassette at import
+    os.environ['FIRKI_CASSETTE'] = args.cassette
+    os.environ['FIRKI_CASSETTE_MODE'] = 'record' if args.record else 'replay'
+    os.environ['FIRKI_CASSETTE_LATENCY_SCALE'] = str(args.latency_scale)
+    os.environ.setdefault('GEMINI_API_KEY', 'replay')
+
+    from services.cassette import get_cassette
+    from services.context_analyzer import ContextAnalyzer
+    from services.dynamic_recruiter import DynamicRecruiterTool
+    from services.skill_extractor import SkillExtractor
+    from samples import SAMPLE_JDS
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        recruiter = DynamicRecruiterTool()
+        extractor = SkillExtractor()
+        analyzer = ContextAnalyzer()
+
+    def context_for_jd(jd, title):
+        names = [extractor.taxonomy.name_for(i) for i in extractor.taxonomy.find_in_text(jd)][:3]
+        return [analyzer._generate_context_with_gemini(name) for name in names]
+
+    functions = {
+        'analyze_job_dynamically': lambda jd, title: recruiter.analyze_job_dynamically(jd, title),
+        '_extract_with_gemini': extractor._extract_with_gemini,
+        '_generate_context_with_gemini': context_for_jd,
+    }
+
+    # Recording calls each prompt once; replay repeats from the one recording
+    repeats = 1 if args.record else args.repeats
+    failures = 0
+    print(f"{'function':<32} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, fn in functions.items():
+        latencies = []
+        for title, jd in SAMPLE_JDS:
+            for _ in range(repeats):
+                start = time.perf_counter()
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        fn(jd, title)
+                except Exception:
+                    failures += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+        print(f"{name:<32} {len(latencies):>6} {percentile(latencies, 50):>9.2f} {percentile(latencies, 95):>9.2f}")
+
+    cassette = get_cassette()
+    cassette.close()
+    if args.record:
+        print(f"\nRecorded {cassette.recorded} calls to {args.cassette} ({os.path.getsize(args.cassette)} bytes)")
+    else:
+        print(f"\nCassette hits {cassette.hits}, misses {cassette.misses}; failed calls {failures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Wall-clock time of one whole-document LLM extraction vs. the chunked
+map-reduce path, as the JD grows.
+
+The LLM is simulated: each call sleeps base + per-token latency for the
+text it is given (input processing dominates for long prompts) and returns
+the taxonomy skills found in that text. The whole-document time is one
+such call plus the local strategies. The chunked time is
+SkillExtractor._extract_skills_chunked end to end.
+
+Run from the backend directory:
+    python benchmarks/bench_chunked.py [--base 0.3] [--per-token-ms 0.4]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.chunking import split_into_chunks
+from services.skill_accumulator import SkillAccumulator
+from services.skill_extractor import SkillExtractor
+from services.skill_record import Skill, SkillSource
+from services.tokens import estimate_tokens
+from samples import SAMPLE_JDS
+
+SIZES_KB = [8, 20, 40, 80]
+
+
+def concatenated_postings(target_bytes):
+    """Several postings pasted into one email, the way digest emails arrive"""
+    parts = []
+    i = 0
+    while sum(len(p) for p in parts) < target_bytes:
+        title, jd = SAMPLE_JDS[i % len(SAMPLE_JDS)]
+        parts.append(f"Job Title: {title} (req {i})\n{jd.strip()}")
+        i += 1
+    return '\n\n'.join(parts)
+
+
+def llm_answer(extractor, text):
+    """What the simulated model answers: up to 7 known skills in the text"""
+    names = [extractor.taxonomy.name_for(i) for i in extractor.taxonomy.find_in_text(text)]
+    return [Skill(name, 0.9, SkillSource.GEMINI) for name in names[:7]]
+
+
+def simulated_llm(extractor, base, per_token):
+    def extract(job_description, job_title):
+        time.sleep(base + per_token * estimate_tokens(job_description))
+        return llm_answer(extractor, job_description)
+    return extract
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base', type=float, default=0.3, help='seconds per LLM call')
+    parser.add_argument('--per-token-ms', type=float, default=0.4, help='ms per input token')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    llm = simulated_llm(extractor, args.base, args.per_token_ms / 1000)
+    extractor._extract_with_gemini = llm
+
+    print(f"{'KB':>4} {'tokens':>7} {'chunks':>7} {'whole s':>8} {'chunked s':>10} {'distinct skills whole/chunked':>30}")
+    for kb in SIZES_KB:
+        text = concatenated_postings(kb * 1024)
+
+        start = time.perf_counter()
+        whole = SkillAccumulator(extractor.taxonomy)
+        whole.extend(llm(text, ""))
+        whole.extend(extractor._extract_intelligent_patterns(text))
+        whole.extend(extractor._keyword_skills(text))
+        whole_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            extractor._extract_skills_chunked(text, "")
+        chunked_s = time.perf_counter() - start
+
+        # Skills the reduce step saw, before top-k ranking
+        chunked = SkillAccumulator(extractor.taxonomy)
+        for chunk in split_into_chunks(text):
+            chunked.extend(llm_answer(extractor, chunk))
+            chunked.extend(extractor._extract_intelligent_patterns(chunk))
+            chunked.extend(extractor._keyword_skills(chunk))
+
+        print(f"{kb:>4} {estimate_tokens(text):>7} {len(split_into_chunks(text)):>7} {whole_s:>8.2f} "
+              f"{chunked_s:>10.2f} {f'{len(whole)}/{len(chunked)}':>30}")
+
+
+if __name__ == "__main__":
+    main()
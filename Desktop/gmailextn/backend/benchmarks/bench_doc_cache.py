@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Reanalysis cost with and without the on-disk spaCy doc cache.
+
+Runs NLP skill extraction over a set of distinct JDs three times: without
+a cache, with an empty cache (parse + store), and again with the warm
+cache (load only). It also reports the bytes on disk per doc and checks
+that skills from cached docs match skills from fresh parses.
+
+Run from the backend directory:
+    python benchmarks/bench_doc_cache.py [--docs 300]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.doc_cache import DocCache
+from services.skill_extractor import SkillExtractor
+from samples import SAMPLE_JDS
+
+
+def timed(extractor, texts):
+    start = time.perf_counter()
+    results = [extractor._extract_with_nlp(text, "") for text in texts]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=300)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+
+    # Distinct texts, so every first pass is a genuine miss
+    texts = [f"{SAMPLE_JDS[i % len(SAMPLE_JDS)][1]}\nReq #{i}" for i in range(args.docs)]
+
+    cache_dir = tempfile.mkdtemp(prefix='firki-doc-cache-')
+    try:
+        extractor.doc_cache = None
+        fresh_s, fresh = timed(extractor, texts)
+
+        extractor.doc_cache = DocCache(extractor.nlp, cache_dir)
+        cold_s, _ = timed(extractor, texts)
+        warm_s, warm = timed(extractor, texts)
+
+        disk = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(cache_dir) for name in names)
+    finally:
+        shutil.rmtree(cache_dir)
+
+    print(f"pipeline: {extractor.nlp.pipe_names}")
+    print(f"{args.docs} docs, {disk / args.docs / 1024:.1f} KB on disk per doc")
+    for label, seconds in (('no cache', fresh_s), ('cold cache', cold_s), ('warm cache', warm_s)):
+        print(f"{label:>10}: {args.docs / seconds:>8.1f} docs/s  ({fresh_s / seconds:.2f}x)")
+    print(f"cache hits={extractor.doc_cache.hits} misses={extractor.doc_cache.misses}")
+    print(f"warm-cache skills match fresh parses: {warm == fresh}")
+
+
+if __name__ == "__main__":
+    main()
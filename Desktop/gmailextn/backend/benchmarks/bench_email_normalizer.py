@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Bytes, estimated LLM tokens and local analysis latency for raw recruiter
+emails vs. the same emails after normalize_email().
+
+"Analysis" here is the local path the API runs on every request: job
+email detection, job context, and the pattern + keyword skill strategies.
+The normalized column includes the time spent normalizing. The token
+columns estimate the JD text an LLM prompt would carry.
+
+Run from the backend directory:
+    python benchmarks/bench_email_normalizer.py [--repeats 50]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.email_normalizer import normalize_email
+from services.job_email_detector import JobEmailDetector
+from services.skill_accumulator import SkillAccumulator
+from services.skill_extractor import SkillExtractor
+from services.tokens import estimate_tokens
+from email_samples import RAW_EMAILS
+
+
+def analyse(detector, extractor, content):
+    is_job, confidence, _ = detector.is_job_email(content)
+    detector.get_job_context(content)
+    skills = SkillAccumulator(extractor.taxonomy)
+    skills.extend(extractor._extract_intelligent_patterns(content))
+    skills.extend(extractor._keyword_skills(content))
+    return is_job, confidence, skills.names()
+
+
+def per_call_ms(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=50)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    detector = JobEmailDetector()
+
+    totals = {'raw_bytes': 0, 'norm_bytes': 0, 'raw_tokens': 0, 'norm_tokens': 0, 'raw_ms': 0.0, 'norm_ms': 0.0}
+    print(f"{'email':<26} {'bytes':>12} {'tokens':>11} {'analysis ms':>16} {'norm ms':>8}  same verdict / skills lost")
+    for label, jd, raw in RAW_EMAILS:
+        normalized = normalize_email(raw)
+        raw_bytes, norm_bytes = len(raw.encode('utf-8')), len(normalized.encode('utf-8'))
+        raw_tokens, norm_tokens = estimate_tokens(raw), estimate_tokens(normalized)
+
+        normalize_ms = per_call_ms(lambda: normalize_email(raw), args.repeats)
+        raw_ms = per_call_ms(lambda: analyse(detector, extractor, raw), args.repeats)
+        norm_ms = normalize_ms + per_call_ms(lambda: analyse(detector, extractor, normalized), args.repeats)
+
+        raw_job, _, raw_skills = analyse(detector, extractor, raw)
+        norm_job, _, norm_skills = analyse(detector, extractor, normalized)
+        # Skills the JD itself yields that normalization lost
+        jd_skills = set(analyse(detector, extractor, jd)[2])
+        lost = sorted(jd_skills - set(norm_skills))
+
+        print(f"{label:<26} {raw_bytes:>5}->{norm_bytes:<5} {raw_tokens:>4}->{norm_tokens:<5} "
+              f"{raw_ms:>7.2f}->{norm_ms:<7.2f} {normalize_ms:>8.3f}  {raw_job == norm_job} / {lost or '-'}")
+
+        for key, value in (('raw_bytes', raw_bytes), ('norm_bytes', norm_bytes), ('raw_tokens', raw_tokens),
+                           ('norm_tokens', norm_tokens), ('raw_ms', raw_ms), ('norm_ms', norm_ms)):
+            totals[key] += value
+
+    print(f"\nbytes  -{1 - totals['norm_bytes'] / totals['raw_bytes']:.0%}   "
+          f"tokens -{1 - totals['norm_tokens'] / totals['raw_tokens']:.0%}   "
+          f"local analysis {totals['raw_ms']:.2f} ms -> {totals['norm_ms']:.2f} ms "
+          f"({totals['norm_ms'] / totals['raw_ms'] - 1:+.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Latency of the serial cascade vs. the fan-out extraction mode.
+
+The remote strategies are replaced by simulated providers that sleep for
+a configurable time and then either return skills or raise, so no API
+keys or network are needed. Each scenario reports wall time and the
+method that produced the answer for both modes.
+
+Run from the backend directory:
+    python benchmarks/bench_fanout.py [--deadline 1.5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.fanout import FanOutPolicy
+from services.skill_extractor import SkillExtractor
+from services.skill_record import Skill, SkillSource
+from samples import WEB_DEVELOPER_JD
+
+AI_SKILLS = ['React', 'TypeScript', 'Shopify', 'Contentful', 'AWS']
+
+# name -> {strategy: (latency seconds, skill count or None to fail)}
+SCENARIOS = {
+    'all providers healthy': {
+        'dynamic': (0.6, 5), 'gemini': (0.5, 5), 'openai': (0.8, 5)},
+    'dynamic slow, gemini healthy': {
+        'dynamic': (3.0, 5), 'gemini': (0.5, 5), 'openai': (0.8, 5)},
+    'providers erroring': {
+        'dynamic': (0.3, None), 'gemini': (0.4, None), 'openai': (0.5, None)},
+    'providers hanging': {
+        'dynamic': (4.0, 5), 'gemini': (4.0, 5), 'openai': (4.0, 5)},
+    'thin AI answers': {
+        'dynamic': (0.4, 1), 'gemini': (0.5, 1), 'openai': (0.6, 1)},
+}
+
+
+def simulated(latency, count, source):
+    def strategy(job_description, job_title):
+        time.sleep(latency)
+        if count is None:
+            raise RuntimeError("simulated provider error")
+        return [Skill(name, 0.9, source) for name in AI_SKILLS[:count]]
+    return strategy
+
+
+def install(extractor, scenario):
+    extractor._extract_with_dynamic_analysis = simulated(*scenario['dynamic'], SkillSource.AI_DYNAMIC_ANALYSIS)
+    extractor._extract_with_gemini = simulated(*scenario['gemini'], SkillSource.GEMINI)
+    extractor._extract_with_openai = simulated(*scenario['openai'], SkillSource.OPENAI)
+    extractor.remote_strategies = [
+        ("ai_dynamic_analysis", extractor._extract_with_dynamic_analysis),
+        ("gemini_ai", extractor._extract_with_gemini),
+        ("openai_ai", extractor._extract_with_openai),
+    ]
+
+
+def run(extractor, mode):
+    extractor.extraction_mode = mode
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        skills = extractor.extract_skills(WEB_DEVELOPER_JD, "Web Developer")
+    return time.perf_counter() - start, extractor.last_method_used, len(skills)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--deadline', type=float, default=1.5, help='fan-out AI deadline in seconds')
+    parser.add_argument('--min-ai-skills', type=int, default=3)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    extractor.fanout_policy = FanOutPolicy(args.min_ai_skills, args.deadline)
+
+    print(f"{'scenario':<30} {'cascade s':>10} {'method':<22} {'fanout s':>9} {'method':<22}")
+    for name, scenario in SCENARIOS.items():
+        install(extractor, scenario)
+        cascade_s, cascade_method, _ = run(extractor, 'cascade')
+        fanout_s, fanout_method, _ = run(extractor, 'fanout')
+        print(f"{name:<30} {cascade_s:>10.2f} {cascade_method:<22} {fanout_s:>9.2f} {fanout_method:<22}")
+
+
+if __name__ == "__main__":
+    main()
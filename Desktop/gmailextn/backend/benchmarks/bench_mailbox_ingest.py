@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Mailbox backfill throughput, peak memory and resume correctness.
+
+Builds synthetic mbox files (one recruiter email in three, the rest
+personal mail) of growing size and runs MailboxIngest over them with a
+simulated LLM (--latency seconds per extraction). Peak traced memory
+should stay flat as the mailbox grows. The last run is interrupted at a
+checkpoint and resumed; its output must match an uninterrupted run.
+
+Run from the backend directory:
+    python benchmarks/bench_mailbox_ingest.py [--latency 0.05] [--workers 8]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from email.message import EmailMessage
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.job_email_detector import JobEmailDetector
+from services.mailbox_ingest import MailboxIngest
+from services.skill_extractor import SkillExtractor
+from services.skill_record import Skill, SkillSource
+from samples import SAMPLE_JDS
+
+SIZES = [300, 3000]
+PERSONAL = "From my side, Friday lunch works.\n>From the last thread: bring the slides.\nSee you!"
+
+
+def write_mbox(path, count):
+    with open(path, 'wb') as f:
+        for i in range(count):
+            msg = EmailMessage()
+            recruiter = i % 3 == 0
+            msg['From'] = 'talent@agency.example' if recruiter else 'friend@example.com'
+            msg['Subject'] = f'Job opportunity #{i}' if recruiter else f'Lunch #{i}'
+            msg['Message-ID'] = f'<msg-{i}@example.com>'
+            msg.set_content(SAMPLE_JDS[i % len(SAMPLE_JDS)][1] if recruiter else PERSONAL)
+            body = msg.as_bytes().replace(b'\nFrom ', b'\n>From ')
+            f.write(b'From sender@example.com Mon Jan  1 00:00:00 2024\n' + body + b'\n')
+
+
+def simulated_extractor(latency):
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+
+    def extract(job_description, job_title):
+        time.sleep(latency)
+        names = [extractor.taxonomy.name_for(i) for i in extractor.taxonomy.find_in_text(job_description)]
+        return [Skill(name, 0.95, SkillSource.AI_DYNAMIC_ANALYSIS) for name in names[:7]]
+
+    extractor._extract_with_dynamic_analysis = extract
+    return extractor
+
+
+class Interrupt(Exception):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds per simulated extraction')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    extractor = simulated_extractor(args.latency)
+    detector = JobEmailDetector()
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, 'w') as devnull:
+        print(f"{'messages':>8} {'mbox KB':>8} {'job':>5} {'seconds':>8} {'msg/s':>7} {'peak MB':>8}")
+        for count in SIZES:
+            mbox = os.path.join(tmp, f'{count}.mbox')
+            output = os.path.join(tmp, f'{count}.jsonl')
+            write_mbox(mbox, count)
+
+            ingest = MailboxIngest(mbox, output, extractor, detector, workers=args.workers)
+            tracemalloc.start()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(devnull):
+                stats = ingest.run(resume=False)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{stats['messages']:>8} {os.path.getsize(mbox) // 1024:>8} {stats['job_emails']:>5} "
+                  f"{elapsed:>8.2f} {stats['messages'] / elapsed:>7.0f} {peak / 1e6:>8.1f}")
+
+        # Kill a run after its third checkpoint, then resume it
+        with open(output, 'rb') as f:
+            expected = f.read()
+        interrupted = MailboxIngest(mbox, output, extractor, detector, workers=args.workers, checkpoint_every=250)
+        original_save = interrupted._save_checkpoint
+        saves = []
+
+        def save_then_interrupt(position, output_offset):
+            original_save(position, output_offset)
+            saves.append(position)
+            if len(saves) == 3:
+                raise Interrupt()
+
+        interrupted._save_checkpoint = save_then_interrupt
+        with contextlib.redirect_stdout(devnull):
+            try:
+                interrupted.run(resume=False)
+            except Interrupt:
+                pass
+            resumed = MailboxIngest(mbox, output, extractor, detector, workers=args.workers, checkpoint_every=250)
+            stats = resumed.run()
+        with open(output, 'rb') as f:
+            actual = f.read()
+        print(f"\nresumed after checkpoint at byte {saves[-1]}: {stats['messages']} messages, "
+              f"output {'identical to' if actual == expected else 'DIFFERS from'} an uninterrupted run")
+
+
+if __name__ == "__main__":
+    main()
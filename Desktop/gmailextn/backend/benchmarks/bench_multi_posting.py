@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Multi-posting emails analysed as one blended JD vs. split into roles,
+sequentially and concurrently.
+
+The LLM is simulated: skill extraction and boolean generation each sleep
+--latency seconds and answer from the taxonomy; the other providers are
+offline. Prints the roles the
+splitter found, wall-clock time per mode, and each role's top skills next
+to the blended top 5.
+
+Run from the backend directory:
+    python benchmarks/bench_multi_posting.py [--latency 0.8]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.boolean_generator import BooleanGenerator
+from services.job_email_detector import JobEmailDetector
+from services.multi_posting import _analyze_role, analyze_postings, split_postings
+from services.skill_extractor import SkillExtractor
+from services.skill_record import Skill, SkillSource
+from samples import MULTI_POSTING_EMAILS
+
+
+def simulated_services(latency):
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+        boolean_generator = BooleanGenerator()
+
+    def extract(job_description, job_title):
+        time.sleep(latency)
+        names = [extractor.taxonomy.name_for(i) for i in extractor.taxonomy.find_in_text(job_description)]
+        return [Skill(name, 0.95, SkillSource.AI_DYNAMIC_ANALYSIS) for name in names[:7]]
+
+    def generate(skills, job_title):
+        time.sleep(latency)
+        return boolean_generator._generate_with_rules(skills, job_title)
+
+    def offline(*args):
+        raise RuntimeError("provider offline in benchmark")
+
+    extractor._extract_with_dynamic_analysis = extract
+    extractor._extract_with_gemini = extractor._extract_with_openai = offline
+    boolean_generator._generate_with_gemini = generate
+    boolean_generator._generate_with_openai = offline
+    return extractor, boolean_generator
+
+
+def timed(fn):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.8, help='seconds per simulated LLM call')
+    args = parser.parse_args()
+
+    extractor, boolean_generator = simulated_services(args.latency)
+    detector = JobEmailDetector()
+
+    for label, email, expected in MULTI_POSTING_EMAILS:
+        postings, split_s = timed(lambda: split_postings(email))
+        titles = [p.title for p in postings]
+        print(f"\n{label}: {len(postings)} role(s) {titles} "
+              f"({'as expected' if titles == expected else f'expected {expected}'}), split {split_s * 1000:.2f} ms")
+
+        def blended():
+            skills = extractor.extract_skills(email, "")
+            return skills, boolean_generator.generate_boolean_search(skills, "")
+
+        (blended_skills, _), blended_s = timed(blended)
+        sequential, sequential_s = timed(
+            lambda: [_analyze_role(p, extractor, boolean_generator, detector) for p in postings])
+        roles, concurrent_s = timed(lambda: analyze_postings(postings, extractor, boolean_generator, detector))
+
+        print(f"  blended {blended_s:.2f} s   per-role sequential {sequential_s:.2f} s   "
+              f"per-role concurrent {concurrent_s:.2f} s")
+        print(f"  {'blended top 5':<24} {[s.name for s in blended_skills]}")
+        for role in roles:
+            print(f"  {role['job_title'][:24] or '(untitled)':<24} {[s.name for s in role.get('skills', [])]}")
+
+
+if __name__ == "__main__":
+    main()
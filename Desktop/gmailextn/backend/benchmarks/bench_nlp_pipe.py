@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+docs/second for NLP skill extraction: one nlp() call per JD vs. nlp.pipe.
+
+Compares three setups over the same stream of sample JDs:
+  single   - full en_core_web_sm pipeline, one nlp(text) call per JD
+  trimmed  - the extractor's pipeline (unused components excluded), nlp(text)
+  batched  - trimmed pipeline through extract_skills_nlp_batch (nlp.pipe)
+
+Run from the backend directory:
+    python benchmarks/bench_nlp_pipe.py [--docs 500] [--batch-size 64] [--n-process 1]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import spacy
+
+from services.skill_extractor import SkillExtractor
+from samples import SAMPLE_JDS
+
+
+def docs_per_second(fn, texts):
+    start = time.perf_counter()
+    results = fn(texts)
+    elapsed = time.perf_counter() - start
+    return len(texts) / elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--docs', type=int, default=500)
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--n-process', type=int, default=1)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    full_nlp = spacy.load("en_core_web_sm")
+    print(f"full pipeline:    {full_nlp.pipe_names}")
+    print(f"trimmed pipeline: {extractor.nlp.pipe_names}")
+
+    texts = [SAMPLE_JDS[i % len(SAMPLE_JDS)][1] for i in range(args.docs)]
+
+    def single(batch):
+        return [extractor._skills_from_doc(full_nlp(text)) for text in batch]
+
+    def trimmed(batch):
+        return [extractor._extract_with_nlp(text, "") for text in batch]
+
+    def batched(batch):
+        return list(extractor.extract_skills_nlp_batch(batch, args.batch_size, args.n_process))
+
+    rates = {}
+    outputs = {}
+    for label, fn in (('single', single), ('trimmed', trimmed), ('batched', batched)):
+        rates[label], outputs[label] = docs_per_second(fn, texts)
+
+    same = outputs['trimmed'] == outputs['batched']
+    print(f"{args.docs} docs, batch_size={args.batch_size}, n_process={args.n_process}")
+    for label, rate in rates.items():
+        print(f"{label:>8}: {rate:>8.1f} docs/s  ({rate / rates['single']:.2f}x)")
+    print(f"batched output matches per-doc output: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Prompt tokens for the JD part of extraction prompts: whole text, content
+sections only, and content sections compacted to the token budget. Also
+checks which taxonomy skills mentioned in the JD survive compaction.
+
+Includes a ~20 KB posting (long company blurb, benefits and a pasted
+thread) on top of the sample JDs and raw emails.
+
+Run from the backend directory:
+    python benchmarks/bench_prompt_budget.py [--budget 1500]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.email_normalizer import normalize_email
+from services.prompt_budget import job_text_for_prompt
+from services.sectionizer import sectionize
+from services.taxonomy import get_taxonomy
+from services.tokens import estimate_tokens
+from email_samples import RAW_EMAILS
+from samples import NETWORK_AUTOMATION_JD, SAMPLE_JDS
+
+BLURB = ("Founded in 1998, our client is a global leader in specialty manufacturing with offices in 14 countries "
+         "and a culture built on integrity, curiosity and customer obsession. ")
+BENEFIT = "- Comprehensive medical, dental and vision coverage with a generous employer contribution"
+THREAD_LINE = "> Just circling back on the candidates from last week, let me know if any of them are still active."
+
+
+def long_posting(target_bytes=20000):
+    parts = ["About the company:", BLURB * 12, NETWORK_AUTOMATION_JD.strip(), "Benefits:"]
+    parts += [BENEFIT] * 30
+    parts += ["Tech Stack:", "- Python, Go, Ansible, Terraform, Kubernetes, Grafana, Prometheus"]
+    text = '\n'.join(parts)
+    while len(text) < target_bytes:
+        text += '\n' + THREAD_LINE
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget', type=int, default=1500)
+    args = parser.parse_args()
+
+    taxonomy = get_taxonomy()
+    corpus = [(title, jd) for title, jd in SAMPLE_JDS]
+    # Emails reach the prompts normalized, as the API does it
+    corpus += [(label, normalize_email(raw)) for label, _, raw in RAW_EMAILS]
+    corpus += [('20 KB posting', long_posting())]
+    # A tight budget too, so compaction has to choose
+    budgets = [args.budget, 150]
+
+    print(f"{'input':<34} {'raw':>6} {'sections':>9} " + ' '.join(f"{f'budget {b}':>11}" for b in budgets)
+          + f" {'ms':>6}  skills lost ({budgets[0]} / {budgets[-1]})")
+    for label, text in corpus:
+        raw_tokens = estimate_tokens(text)
+        section_tokens = estimate_tokens(sectionize(text).text())
+        compacted = []
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for budget in budgets:
+                compacted.append(job_text_for_prompt('benchmark', text, budget))
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(budgets)
+
+        mentioned = set(taxonomy.find_in_text(sectionize(text).text()))
+        lost = [sorted(mentioned - set(taxonomy.find_in_text(c))) for c in compacted]
+        print(f"{label[:34]:<34} {raw_tokens:>6} {section_tokens:>9} "
+              + ' '.join(f"{estimate_tokens(c):>11}" for c in compacted)
+              + f" {elapsed_ms:>6.2f}  {' / '.join(', '.join(names) or '-' for names in lost)}")
+
+
+if __name__ == "__main__":
+    main()
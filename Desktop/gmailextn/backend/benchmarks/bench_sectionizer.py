@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+What the sectionizer saves: characters scanned by the pattern strategies,
+characters sent in LLM prompts, and the pattern-extraction time, each
+with and without sectioning. Also reports how long the split takes.
+
+Run from the backend directory:
+    python benchmarks/bench_sectionizer.py [--repeats 200]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import sectionizer, skill_extractor
+from services.sectionizer import REQUIREMENTS, ROLE_DETAILS, TECH_STACK
+from services.skill_extractor import SkillExtractor
+from samples import SAMPLE_JDS
+
+
+def per_call_ms(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def unsectioned(job_description):
+    # Everything in one overview section, i.e. the old whole-text behaviour
+    return sectionizer.Sections(job_description, [(sectionizer.OVERVIEW, job_description)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+
+    print(f"{'sample':<36} {'chars':>6} {'prompt':>7} {'scanned':>8} {'split ms':>9} {'patterns ms':>12} {'sectioned ms':>13}")
+    for title, jd in SAMPLE_JDS:
+        sections = sectionizer.sectionize(jd)
+        prompt_chars = len(sections.text())
+        # Five pattern groups: three scan content text, two scan narrower slices
+        scanned = 3 * len(sections.text()) + len(sections.text((TECH_STACK, ROLE_DETAILS, REQUIREMENTS))) \
+            + len(sections.text((REQUIREMENTS, ROLE_DETAILS)))
+
+        split_ms = per_call_ms(lambda: sectionizer.sectionize.__wrapped__(jd), args.repeats)
+
+        try:
+            skill_extractor.sectionize = unsectioned
+            whole_ms = per_call_ms(lambda: extractor._extract_intelligent_patterns(jd), args.repeats)
+        finally:
+            skill_extractor.sectionize = sectionizer.sectionize
+        sectioned_ms = per_call_ms(lambda: extractor._extract_intelligent_patterns(jd), args.repeats)
+
+        print(f"{title[:36]:<36} {len(jd):>6} {prompt_chars / len(jd):>6.0%} {scanned / (5 * len(jd)):>7.0%} "
+              f"{split_ms:>9.3f} {whole_ms:>12.3f} {sectioned_ms:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
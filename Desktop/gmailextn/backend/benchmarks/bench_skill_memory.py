@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Memory per batch of extracted skills: slotted Skill records vs. dicts.
+
+Runs the local extraction strategies (pattern + taxonomy keyword match,
+merged through SkillAccumulator) over N job descriptions cycled from the
+samples and keeps every result alive, the way a batch job or result cache
+would. tracemalloc then reports the retained size twice: once holding
+Skill records, once holding the dicts extract_skills used to return
+(fresh name strings from the regex matches, one dict per skill).
+
+Run from the backend directory:
+    python benchmarks/bench_skill_memory.py [--jds 10000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.skill_accumulator import SkillAccumulator
+from services.skill_extractor import SkillExtractor
+from samples import SAMPLE_JDS
+
+
+def extract_local(extractor: SkillExtractor, jd: str):
+    skills = SkillAccumulator(extractor.taxonomy)
+    skills.extend(extractor._extract_intelligent_patterns(jd))
+    skills.extend(extractor._keyword_skills(jd))
+    return skills.to_list()
+
+
+def as_legacy_dict(skill):
+    # Regex matches hand back a new string object per mention
+    name = (skill.name + ' ')[:-1]
+    return {'name': name, 'confidence': skill.confidence, 'source': skill.source.label}
+
+
+def retained(build):
+    """Bytes still allocated after build() returns, and its wall time"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jds', type=int, default=10000)
+    args = parser.parse_args()
+
+    extractor = SkillExtractor()
+    # Warm the classifier cache and compiled regexes so they aren't counted
+    for _, jd in SAMPLE_JDS:
+        extract_local(extractor, jd)
+
+    jds = [SAMPLE_JDS[i % len(SAMPLE_JDS)][1] for i in range(args.jds)]
+
+    records, record_bytes, record_s = retained(lambda: [extract_local(extractor, jd) for jd in jds])
+    count = sum(len(r) for r in records)
+    dicts, dict_bytes, _ = retained(lambda: [[as_legacy_dict(s) for s in r] for r in records])
+
+    print(f"{args.jds} JDs, {count} skills retained, extraction {record_s * 1000 / args.jds:.2f} ms/JD")
+    print(f"{'':>8} {'total KB':>10} {'bytes/skill':>12} {'KB per 10k JDs':>15}")
+    for label, size in (('records', record_bytes), ('dicts', dict_bytes)):
+        print(f"{label:>8} {size / 1024:>10.0f} {size / count:>12.1f} {size / args.jds * 10000 / 1024:>15.0f}")
+    print(f"dicts use {dict_bytes / record_bytes:.1f}x the memory of records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Fixtures for the pytest-benchmark hot path suite (test_hot_paths.py).
+
+Every hot path's median is compared with the stored baseline in
+baselines/hot_paths.json; a test fails when it is more than
+--hot-path-threshold percent (FIRKI_HOT_PATH_THRESHOLD, default 25)
+slower. Baselines are machine-specific: refresh them on the machine that
+runs the suite with --hot-path-update-baseline.
+"""
+
+import json
+import os
+import platform
+import sys
+import warnings
+
+import pytest
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Backend services and the shared samples module
+sys.path.append(os.path.dirname(BENCHMARKS_DIR))
+sys.path.append(BENCHMARKS_DIR)
+
+BASELINE_PATH = os.path.join(BENCHMARKS_DIR, 'baselines', 'hot_paths.json')
+DEFAULT_THRESHOLD = float(os.getenv('FIRKI_HOT_PATH_THRESHOLD', '25'))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('hot paths')
+    group.addoption('--hot-path-threshold', type=float, default=DEFAULT_THRESHOLD,
+                    help='fail a hot path more than this many percent slower than its baseline')
+    group.addoption('--hot-path-update-baseline', action='store_true',
+                    help='write this run\'s medians to baselines/hot_paths.json')
+
+
+@pytest.fixture(scope='session')
+def hot_path_baseline(request):
+    """{test name: median microseconds}; rewritten at session end when updating"""
+    try:
+        with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {}
+    medians = dict(stored.get('median_us', {}))
+    yield medians
+
+    if request.config.getoption('--hot-path-update-baseline'):
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        baseline = {
+            'machine': f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+            'python': platform.python_version(),
+            'median_us': dict(sorted(medians.items())),
+        }
+        tmp_path = f"{BASELINE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        os.replace(tmp_path, BASELINE_PATH)
+
+
+@pytest.fixture
+def hot_path(benchmark, hot_path_baseline, request):
+    """
+    Benchmark fn(*args) and check its median against the baseline.
+    `setup` runs untimed before every round (e.g. to clear a cache).
+    """
+    threshold = request.config.getoption('--hot-path-threshold')
+    updating = request.config.getoption('--hot-path-update-baseline')
+    name = request.node.name
+
+    def run(fn, *args, setup=None, rounds=200):
+        if setup is None:
+            result = benchmark(fn, *args)
+        else:
+            result = benchmark.pedantic(fn, args=args, setup=setup, rounds=rounds, warmup_rounds=5)
+        if benchmark.disabled or benchmark.stats is None:
+            return result
+
+        median_us = benchmark.stats.stats.median * 1e6
+        if updating:
+            hot_path_baseline[name] = round(median_us, 3)
+            return result
+        baseline_us = hot_path_baseline.get(name)
+        if baseline_us is None:
+            warnings.warn(f"No baseline for {name}; run with --hot-path-update-baseline")
+            return result
+        slowdown = (median_us / baseline_us - 1) * 100
+        assert slowdown <= threshold, (
+            f"{name}: median {median_us:.2f} us is {slowdown:.0f}% slower than the "
+            f"{baseline_us:.2f} us baseline (threshold {threshold:.0f}%)")
+        return result
+
+    return run
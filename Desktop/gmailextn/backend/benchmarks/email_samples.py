@@ -0,0 +1,96 @@
+"""
+Raw recruiter emails the way the extension sends them: Gmail HTML, quoted
+reply chains, forwarded headers, signatures and legal footers wrapped
+around the job descriptions from samples.py.
+"""
+
+import html
+
+from samples import FRONTEND_CLOJURE_JD, NETWORK_AUTOMATION_JD, NORDIC_NATURALS_EMAIL, WEB_DEVELOPER_JD
+
+DISCLAIMER = (
+    "CONFIDENTIALITY NOTICE: This e-mail message, including any attachments, is for the sole use of the "
+    "intended recipient(s) and may contain confidential and privileged information. Any unauthorized review, "
+    "use, disclosure or distribution is prohibited. If you are not the intended recipient, please contact the "
+    "sender by reply e-mail and destroy all copies of the original message."
+)
+
+SIGNATURE = """Thanks,
+Priya Raman
+Senior Technical Recruiter | Apex Talent Partners
+Direct: (555) 014-2231 | priya.raman@apextalent.example
+www.apextalent.example"""
+
+EARLIER_THREAD = [
+    ("Mon, Aug 18, 2025 at 9:12 AM", "Dana Lee <dana@client.example>",
+     "Hi Priya, following up on the open web role. We pushed interviews back a week because the hiring "
+     "manager is travelling. Can you confirm the candidates are still available? Also the bill rate "
+     "approval came through from finance, so we can move forward once we pick a slot."),
+    ("Fri, Aug 15, 2025 at 4:40 PM", "Priya Raman <priya.raman@apextalent.example>",
+     "Hi Dana, attaching the three profiles we discussed. All three have Shopify Plus and Hydrogen "
+     "experience, and two have worked with Contentful. Let me know which ones you want to meet. "
+     "Availability for next week is Tuesday and Thursday afternoons."),
+]
+
+
+def _html_paragraphs(text):
+    return ''.join(f"<div>{html.escape(line) or '<br>'}</div>" for line in text.strip().split('\n'))
+
+
+def gmail_html_reply(jd):
+    """HTML reply with the JD on top, a Gmail signature and a quoted thread"""
+    quoted = ''
+    for when, sender, body in reversed(EARLIER_THREAD):
+        quoted = (f'<div class="gmail_quote"><div dir="ltr" class="gmail_attr">On {when} {html.escape(sender)} '
+                  f'wrote:<br></div><blockquote class="gmail_quote" style="margin:0px 0px 0px 0.8ex">'
+                  f'<div dir="ltr">{html.escape(body)}</div>{quoted}</blockquote></div>')
+    return (
+        '<html><head><style>.x{color:red}</style></head><body><div dir="ltr">'
+        '<div>Hi team,</div><div><br></div><div>Here is the updated requirement from the client:</div>'
+        f'{_html_paragraphs(jd)}'
+        f'<div><br></div>-- <br><div dir="ltr" class="gmail_signature">{_html_paragraphs(SIGNATURE)}'
+        f'<div style="font-size:9px">{html.escape(DISCLAIMER)}</div></div></div><br>{quoted}</body></html>'
+    )
+
+
+def plain_forward(jd):
+    """Plain-text forward: a one-line note, forwarded headers, the JD and a footer"""
+    return (
+        "FYI - new req from the client, can you start sourcing?\n\n"
+        "---------- Forwarded message ---------\n"
+        "From: Dana Lee <dana@client.example>\n"
+        "Date: Tue, Aug 19, 2025 at 10:03 AM\n"
+        "Subject: New requirement\n"
+        "To: Priya Raman <priya.raman@apextalent.example>\n\n"
+        f"{jd.strip()}\n\n{SIGNATURE}\n\n{DISCLAIMER}\n"
+    )
+
+
+def plain_reply_with_history(jd):
+    """Plain-text reply: the JD, a sign-off, then '>'-quoted history"""
+    history = '\n'.join(f"> {line}" for _, _, body in EARLIER_THREAD for line in body.split('. '))
+    return (
+        f"{jd.strip()}\n\n{SIGNATURE}\n\n"
+        "On Mon, Aug 18, 2025 at 9:12 AM Dana Lee <dana@client.example>\nwrote:\n\n"
+        f"{history}\n>\n> {DISCLAIMER}\n"
+    )
+
+
+def see_below_reply(jd):
+    """Short reply whose only job content is the quoted message"""
+    quoted = '\n'.join(f"> {line}" for line in jd.strip().split('\n'))
+    return (
+        "Please see the JD below and send me anyone who fits.\n\n"
+        "On Tue, Aug 19, 2025 at 10:03 AM Dana Lee <dana@client.example> wrote:\n"
+        f"{quoted}\n> \n> {DISCLAIMER}\n"
+    )
+
+
+# (label, job description inside, raw email)
+RAW_EMAILS = [
+    ('gmail html reply', WEB_DEVELOPER_JD, gmail_html_reply(WEB_DEVELOPER_JD)),
+    ('gmail html reply (nordic)', NORDIC_NATURALS_EMAIL, gmail_html_reply(NORDIC_NATURALS_EMAIL)),
+    ('plain forward', NETWORK_AUTOMATION_JD, plain_forward(NETWORK_AUTOMATION_JD)),
+    ('plain reply + history', FRONTEND_CLOJURE_JD, plain_reply_with_history(FRONTEND_CLOJURE_JD)),
+    ('see-below reply', NETWORK_AUTOMATION_JD, see_below_reply(NETWORK_AUTOMATION_JD)),
+]
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic corpus of job descriptions and recruiter emails,
+with ground-truth labels, for scale testing extraction, detection and
+caching.
+
+Records are built from templates and skills drawn from the taxonomy and
+streamed to disk one at a time, so millions of records need no more
+memory than one. Record i depends only on (--seed, i): any slice of the
+corpus can be regenerated on its own, and a duplicate is just record j
+regenerated, so no history is kept.
+
+Kinds: a bare JD, a recruiter email wrapping one or more roles (greeting,
+Position: headers, signature, quoted reply, footer, HTML), or a non-job
+email (negatives for job email detection).
+
+Output:
+- jsonl (default): one record per line, {"id", "kind", "title",
+  "description", "subject", "sender", "labels"}. It can be fed straight
+  to batch_analyze.py.
+- mbox: the emails only (not bare JDs). Labels go to OUTPUT.labels.jsonl,
+  keyed by Message-ID.
+
+labels = {"is_job", "skills", "roles": [{"title", "skills"}], "duplicate_of", "noise"}
+
+Run from the backend directory:
+    python benchmarks/generate_corpus.py corpus.jsonl --count 1000000 [--seed 7]
+        [--length 1500] [--skills 8] [--duplicates 0.1] [--multi-role 0.15]
+        [--noise 0.5] [--non-job 0.2] [--format jsonl|mbox]
+"""
+
+import argparse
+import contextlib
+import html
+import io
+import json
+import os
+import random
+import sys
+import time
+from email.message import EmailMessage
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.email_normalizer import normalize_email
+from services.multi_posting import split_postings
+from services.taxonomy import get_taxonomy
+
+# Role families: titles and the taxonomy skills their JDs draw on
+FAMILIES = {
+    'frontend': (['Frontend Developer', 'Senior Frontend Engineer', 'UI Engineer', 'Web Developer'],
+                 ['React', 'TypeScript', 'JavaScript', 'Next.js', 'Vue', 'Angular', 'HTML', 'CSS', 'SASS',
+                  'Webpack', 'Babel', 'GraphQL', 'Node.js', 'Git', 'Jira']),
+    'backend': (['Backend Engineer', 'Java Developer', 'Python Developer', 'Software Engineer'],
+                ['Java', 'Spring', 'Hibernate', 'Python', 'Django', 'Flask', 'Go', 'PostgreSQL', 'MySQL',
+                 'Redis', 'MongoDB', 'Microservices', 'REST API', 'gRPC', 'Docker', 'Kubernetes', 'Maven']),
+    'devops': (['DevOps Engineer', 'Site Reliability Engineer', 'Cloud Engineer', 'Platform Engineer'],
+               ['AWS', 'Azure', 'GCP', 'Terraform', 'Ansible', 'Kubernetes', 'Docker', 'Jenkins', 'GitLab',
+                'CI/CD', 'Linux', 'Puppet', 'Chef', 'CloudFormation', 'Splunk', 'Nagios']),
+    'data': (['Data Engineer', 'Data Analyst', 'Analytics Engineer', 'BI Developer'],
+             ['SQL', 'Python', 'Pandas', 'NumPy', 'ETL', 'Tableau', 'Power BI', 'Scala', 'PostgreSQL',
+              'Elasticsearch', 'AWS', 'S3', 'Lambda', 'R']),
+    'network': (['Network Automation Engineer', 'Network Engineer', 'Network Security Engineer'],
+                ['Cisco', 'Juniper', 'Arista', 'Ansible', 'Python', 'Nornir', 'NETCONF', 'RESTCONF', 'YANG',
+                 'SD-WAN', 'F5', 'Load Balancers', 'Netbox', 'Nautobot', 'CCNP', 'gNMI']),
+    'enterprise': (['Salesforce Developer', 'Workday Consultant', 'ServiceNow Developer'],
+                   ['Salesforce', 'Apex', 'SOQL', 'Visualforce', 'Lightning', 'Workday', 'HCM', 'HRIS',
+                    'Data Migration', 'Data Conversion', 'ServiceNow', 'JavaScript', 'SQL']),
+}
+
+# Filler contains no taxonomy skill mentions (checked by --check)
+COMPANY_BLURBS = [
+    "Our client is a national healthcare network serving millions of patients every year.",
+    "The client is a fast growing retail brand with stores across the country and a busy online shop.",
+    "This team builds the systems behind a large insurance provider's claims and billing operations.",
+    "Our client is a logistics company modernizing how freight moves between warehouses.",
+    "The client is a public university upgrading the tools used by students and faculty.",
+]
+RESPONSIBILITIES = [
+    "Partner with product managers and designers to plan and deliver features.",
+    "Review code from teammates and keep quality high across the codebase.",
+    "Write clear documentation for the systems you own.",
+    "Take part in planning meetings and estimate upcoming work.",
+    "Troubleshoot production issues and follow them through to a fix.",
+    "Mentor junior engineers and share knowledge across the team.",
+    "Improve monitoring and alerting so problems are caught early.",
+    "Work with stakeholders to turn requirements into working software.",
+]
+LOGISTICS = [
+    "Location: Remote (US)", "Location: Hybrid - Dallas, TX", "Location: Onsite - Boston, MA",
+    "Duration: 6 months, extension likely", "Duration: 12 months contract to hire",
+    "Bill Rate: 65-75/hr", "Pay rate: $80/hr W2", "Interview: 2 rounds, video",
+]
+BENEFITS = [
+    "Comprehensive medical, dental and vision coverage.",
+    "Paid time off and paid holidays from day one.",
+    "A yearly budget for training and certifications.",
+]
+SKILL_LINES = [
+    "- {years}+ years of experience with {a}",
+    "- Hands-on experience with {a} and {b}",
+    "- Strong knowledge of {a}",
+    "- Familiarity with {a}, {b} or {c}",
+    "- Production experience building with {a}",
+]
+GREETINGS = ["Hi there,", "Hello,", "Hi team,", "Good morning,"]
+INTROS = [
+    "I came across your profile and wanted to share an opening with one of our clients.",
+    "We have a new requirement from a long-standing client and think you could be a great fit.",
+    "Sharing the details of an open contract role below, please let me know if you are interested.",
+]
+MULTI_INTROS = [
+    "We have several openings with the same client this week, details below.",
+    "Sharing a few open requirements, please send matching profiles by Friday.",
+]
+SIGNATURES = [
+    "Thanks,\nJordan Reyes\nTechnical Recruiter | Northwind Staffing\nPhone: (555) 010-4411",
+    "Best regards,\nSam Patel\nTalent Acquisition Partner\nsam.patel@bluepeak.example",
+]
+FOOTER = ("CONFIDENTIALITY NOTICE: This message is for the intended recipient only and may contain "
+          "privileged information. If you received it in error, please delete it and notify the sender.")
+QUOTED = ["> Hi, just checking whether the candidates from last week are still available.",
+          "> Let me know a good time to talk about the shortlist."]
+NON_JOB = [
+    ("Lunch on Friday?", "Hey, are we still on for lunch on Friday? The new place near the office opens at noon."),
+    ("Your order has shipped", "Good news! Your order has shipped and should arrive within three business days."),
+    ("Weekend plans", "We are thinking about a hike on Saturday morning if the weather holds. Want to join?"),
+    ("Invoice for March", "Please find the March invoice attached. Payment is due within thirty days."),
+    ("Book club", "This month we are reading a mystery novel. Meeting at the library on Thursday evening."),
+]
+
+
+class CorpusGenerator:
+    """Builds record i from (seed, i) alone; see the module docstring"""
+
+    def __init__(self, seed=7, length=1500, skills=8, duplicates=0.1, multi_role=0.15, noise=0.5, non_job=0.2):
+        self.seed = seed
+        self.length = length
+        self.skills = skills
+        self.duplicates = duplicates
+        self.multi_role = multi_role
+        self.noise = noise
+        self.non_job = non_job
+        self.taxonomy = taxonomy = get_taxonomy()
+        # Canonical names that the text scan finds by themselves, so labels compare exactly
+        self.families = {
+            family: (titles, [taxonomy.canonical_name(name) for name in pool
+                              if taxonomy.find_in_text(name) == [taxonomy.resolve(name)]])
+            for family, (titles, pool) in FAMILIES.items()
+        }
+        self.titles = [(family, title) for family in sorted(self.families) for title in self.families[family][0]]
+
+    def _rng(self, i):
+        return random.Random(f"{self.seed}:{i}")
+
+    def _role(self, rng, family, title):
+        """(title, skills, lines) for one role"""
+        pool = self.families[family][1]
+        count = max(1, min(len(pool), int(rng.gauss(self.skills, self.skills / 4))))
+        skills = rng.sample(pool, count)
+        # Titles like "Python Developer" mention a skill too
+        for skill_id in self.taxonomy.find_in_text(title):
+            name = self.taxonomy.name_for(skill_id)
+            if name not in skills:
+                skills.append(name)
+
+        lines = ["Requirements:"]
+        remaining = list(skills)
+        while remaining:
+            template = rng.choice(SKILL_LINES)
+            take = min(len(remaining), template.count('{') - template.count('{years}'))
+            names, remaining = remaining[:take], remaining[take:]
+            names += [names[-1]] * (3 - len(names))
+            lines.append(template.format(years=rng.randint(2, 8), a=names[0], b=names[1], c=names[2]))
+
+        body = ["Responsibilities:"] + [f"- {line}" for line in rng.sample(RESPONSIBILITIES, 3)]
+        lines = [rng.choice(COMPANY_BLURBS)] + body + lines + rng.sample(LOGISTICS, 2)
+        # Pad towards the target length with skill-free filler
+        while sum(len(line) + 1 for line in lines) < self.length:
+            lines.insert(-2, f"- {rng.choice(RESPONSIBILITIES)}")
+            if rng.random() < 0.3:
+                lines.append(rng.choice(BENEFITS))
+        return title, skills, lines
+
+    def _email(self, rng, roles, noise):
+        parts = [rng.choice(GREETINGS), '', rng.choice(MULTI_INTROS if len(roles) > 1 else INTROS), '']
+        for title, _, lines in roles:
+            if len(roles) > 1:
+                parts.append(f"Position: {title}")
+            parts.extend(lines)
+            parts.append('')
+        if 'signature' in noise:
+            parts.append(rng.choice(SIGNATURES))
+        if 'footer' in noise:
+            parts.extend(['', FOOTER])
+        if 'quoted_reply' in noise:
+            parts.extend(['', "On Mon, Mar 3, 2025 at 9:14 AM Client Team <team@client.example> wrote:"] + QUOTED)
+        text = '\n'.join(parts)
+        if 'html' in noise:
+            text = '<html><body>' + ''.join(f"<div>{html.escape(line) or '<br>'}</div>"
+                                            for line in text.split('\n')) + '</body></html>'
+        return text
+
+    def record(self, i):
+        rng = self._rng(i)
+        if i > 0 and rng.random() < self.duplicates:
+            # Exact copy of an earlier record (cache hits); regenerated, not stored
+            original = self.record(rng.randrange(i))
+            root = original['labels']['duplicate_of']
+            duplicate_of = original['id'] if root is None else root
+            return dict(original, id=f"r{i}", labels=dict(original['labels'], duplicate_of=duplicate_of))
+
+        kind_roll = rng.random()
+        if kind_roll < self.non_job:
+            subject, body = rng.choice(NON_JOB)
+            return {'id': f"r{i}", 'kind': 'other', 'title': '', 'description': body, 'subject': subject,
+                    'sender': 'friend@example.com',
+                    'labels': {'is_job': False, 'skills': [], 'roles': [], 'duplicate_of': None, 'noise': []}}
+
+        is_email = rng.random() < 0.5
+        role_count = rng.randint(2, 5) if is_email and rng.random() < self.multi_role else 1
+        # Distinct titles: the same title twice in one email reads as one role
+        roles = [self._role(rng, family, title) for family, title in rng.sample(self.titles, role_count)]
+        noise = [name for name in ('signature', 'quoted_reply', 'footer', 'html')
+                 if is_email and rng.random() < self.noise] if is_email else []
+
+        if is_email:
+            text = self._email(rng, roles, noise)
+        else:
+            text = f"{roles[0][0]}\n\n" + '\n'.join(roles[0][2])
+        skills = list(dict.fromkeys(skill for _, role_skills, _ in roles for skill in role_skills))
+        return {
+            'id': f"r{i}",
+            'kind': 'email' if is_email else 'jd',
+            'title': roles[0][0] if role_count == 1 else '',
+            'description': text,
+            'subject': f"Opportunity: {roles[0][0]}" if role_count == 1 else f"{role_count} open roles",
+            'sender': 'recruiter@northwind.example' if is_email else '',
+            'labels': {
+                'is_job': True,
+                'skills': skills,
+                'roles': [{'title': title, 'skills': role_skills} for title, role_skills, _ in roles],
+                'duplicate_of': None,
+                'noise': noise,
+            },
+        }
+
+    def records(self, count, start=0):
+        for i in range(start, start + count):
+            yield self.record(i)
+
+
+def write_jsonl(generator, path, count, start):
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in generator.records(count, start):
+            f.write(json.dumps(record) + '\n')
+
+
+def write_mbox(generator, path, count, start):
+    """Emails (and non-job mail) as mbox, labels as a JSONL sidecar keyed by Message-ID"""
+    with open(path, 'wb') as mbox, open(path + '.labels.jsonl', 'w', encoding='utf-8') as labels:
+        for record in generator.records(count, start):
+            if record['kind'] == 'jd':
+                continue
+            message_id = f"<{record['id']}@corpus.example>"
+            msg = EmailMessage()
+            msg['From'] = record['sender']
+            msg['Subject'] = record['subject']
+            msg['Message-ID'] = message_id
+            subtype = 'html' if 'html' in record['labels']['noise'] else 'plain'
+            msg.set_content(record['description'], subtype=subtype)
+            body = msg.as_bytes().replace(b'\nFrom ', b'\n>From ')
+            mbox.write(b'From corpus@example.com Mon Jan  1 00:00:00 2024\n' + body + b'\n')
+            labels.write(json.dumps({'message_id': message_id, 'id': record['id'], **record['labels']}) + '\n')
+
+
+def check(generator, count):
+    """
+    Every labeled skill appears in its text and the text mentions nothing
+    else, once normalized the way the API does (markup and noise removed),
+    and the multi-posting splitter finds the labeled roles of multi-role
+    emails
+    """
+    taxonomy = get_taxonomy()
+    problems = 0
+    multi_role = split_problems = 0
+    for record in generator.records(count):
+        text = normalize_email(record['description'])
+        found = {taxonomy.name_for(skill_id) for skill_id in taxonomy.find_in_text(text)}
+        expected = set(record['labels']['skills'])
+        if found != expected:
+            problems += 1
+            if problems <= 5:
+                print(f"{record['id']}: missing {sorted(expected - found)}, unlabeled {sorted(found - expected)}")
+        roles = [role['title'] for role in record['labels']['roles']]
+        if len(roles) > 1:
+            multi_role += 1
+            with contextlib.redirect_stdout(io.StringIO()):
+                titles = [posting.title for posting in split_postings(text)]
+            if titles != roles:
+                split_problems += 1
+                if split_problems <= 5:
+                    print(f"{record['id']}: split into {titles}, labeled {roles}")
+    print(f"checked {count} records: {problems} with label mismatches")
+    print(f"checked {multi_role} multi-role emails: {split_problems} split differently from their labels")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output')
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--start', type=int, default=0, help='first record index (to regenerate a slice)')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--length', type=int, default=1500, help='target characters per role')
+    parser.add_argument('--skills', type=int, default=8, help='mean skills per role')
+    parser.add_argument('--duplicates', type=float, default=0.1, help='fraction of exact repeats')
+    parser.add_argument('--multi-role', type=float, default=0.15, help='fraction of emails listing 2-5 roles')
+    parser.add_argument('--noise', type=float, default=0.5, help='chance of each email noise type')
+    parser.add_argument('--non-job', type=float, default=0.2, help='fraction of non-job emails')
+    parser.add_argument('--format', choices=('jsonl', 'mbox'), default='jsonl')
+    parser.add_argument('--check', action='store_true', help='verify labels against the taxonomy instead of writing')
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(seed=args.seed, length=args.length, skills=args.skills, duplicates=args.duplicates,
+                                multi_role=args.multi_role, noise=args.noise, non_job=args.non_job)
+    if args.check:
+        check(generator, args.count)
+        return
+
+    start = time.perf_counter()
+    (write_mbox if args.format == 'mbox' else write_jsonl)(generator, args.output, args.count, args.start)
+    elapsed = time.perf_counter() - start
+    print(f"{args.count} records in {elapsed:.1f} s ({args.count / elapsed:.0f}/s), "
+          f"{os.path.getsize(args.output) / 1e6:.1f} MB -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Job descriptions labeled with the skills a recruiter would search for
+("gold" skills), for measuring extraction precision and recall.
+
+Gold names are compared through the taxonomy's canonical keys, so
+aliases ("NodeJS", "k8s") match. Some gold skills are deliberately not
+in the taxonomy (Spark, Selenium, ...) - missing them is a real recall
+gap, not a labeling error.
+"""
+
+from samples import FRONTEND_CLOJURE_JD, NETWORK_AUTOMATION_JD, NORDIC_NATURALS_EMAIL, WEB_DEVELOPER_JD, WORKDAY_JD
+
+DATA_ENGINEER_JD = """
+Senior Data Engineer - 12 month contract, remote
+
+Responsibilities:
+- Build batch and streaming pipelines in Python and Scala on Spark
+- Orchestrate jobs with Airflow and model data in Snowflake with dbt
+- Own data quality checks and alerting
+
+Requirements:
+- 5+ years with SQL and PostgreSQL performance tuning
+- Experience with Kafka and AWS (S3, Lambda)
+- Pandas and NumPy for ad-hoc analysis
+
+Bill Rate: $90/hr
+"""
+
+QA_AUTOMATION_JD = """
+Position: QA Automation Engineer
+Location: Austin, TX (hybrid)
+
+What you'll do:
+- Design UI test suites with Selenium WebDriver and Java
+- Write API tests with RestAssured and Postman
+- Run suites in Jenkins pipelines and report in Jira
+
+Must have:
+- JUnit or TestNG
+- Maven and Git
+- Agile/Scrum teams
+"""
+
+SALESFORCE_DEVELOPER_JD = """
+Our client is looking for a Salesforce Developer to extend their Sales Cloud org.
+
+Requirements:
+- Apex triggers and classes, SOQL
+- Lightning Web Components and Visualforce pages
+- Integrations over REST API
+- Experience with Git-based deployment
+
+Interview: 2 rounds, video
+"""
+
+SRE_JD = """
+Site Reliability Engineer
+
+Tech Stack:
+- Kubernetes, Helm and Terraform on GCP
+- Prometheus, Grafana and Splunk for observability
+- Go and Python tooling
+- Linux (RHEL), Redis
+
+Responsibilities:
+- On-call rotation, incident reviews and capacity planning
+- Automate deployments with GitLab CI/CD
+"""
+
+DOTNET_DEVELOPER_JD = """
+We are hiring a .NET Developer (C#) for a healthcare platform team.
+
+Qualifications:
+- C# and ASP.NET Core Web API
+- Entity Framework with SQL Server
+- Azure App Service and Azure DevOps pipelines
+- Front-end experience with Angular and TypeScript
+
+Duration: 6 months
+"""
+
+IOS_DEVELOPER_JD = """
+iOS Developer
+
+Requirements:
+- Swift and SwiftUI, some Objective-C
+- REST API and GraphQL clients
+- Xcode, CocoaPods, XCTest
+- CI/CD with GitHub Actions
+
+Pay rate: 70-80/hr W2
+"""
+
+# (id, job title, job description, gold skills)
+GOLD_JDS = [
+    ('web-developer', 'Web Developer', WEB_DEVELOPER_JD,
+     ['React', 'TypeScript', 'JavaScript', 'Node.js', 'Shopify', 'Hydrogen', 'Contentful', 'AWS', 'Docker', 'Git',
+      'Jira', 'SQL']),
+    ('nordic-naturals', 'Web Developer', NORDIC_NATURALS_EMAIL,
+     ['WordPress', 'Shopify', 'Gatsby', 'Hydrogen']),
+    ('workday', 'Workday Data Conversion Specialist', WORKDAY_JD,
+     ['Workday', 'HCM', 'Data Conversion', 'Data Migration', 'ETL', 'SQL', 'HRIS']),
+    ('network-automation', 'Network Automation Engineer', NETWORK_AUTOMATION_JD,
+     ['Python', 'Ansible', 'Nornir', 'NETCONF', 'RESTCONF', 'Git', 'CI/CD', 'Docker', 'Kubernetes', 'Cisco',
+      'Juniper', 'Arista', 'Nautobot', 'Netbox', 'SD-WAN', 'F5', 'Splunk', 'Terraform']),
+    ('frontend-clojure', 'Senior Frontend Engineer', FRONTEND_CLOJURE_JD,
+     ['ClojureScript', 'Clojure', 'React', 'TypeScript', 'JavaScript', 'Next.js', 'Docker', 'Git', 'CI/CD']),
+    ('data-engineer', 'Senior Data Engineer', DATA_ENGINEER_JD,
+     ['Python', 'Scala', 'Spark', 'Airflow', 'Snowflake', 'dbt', 'SQL', 'PostgreSQL', 'Kafka', 'AWS', 'S3',
+      'Lambda', 'Pandas', 'NumPy']),
+    ('qa-automation', 'QA Automation Engineer', QA_AUTOMATION_JD,
+     ['Selenium', 'Java', 'RestAssured', 'Postman', 'Jenkins', 'JUnit', 'TestNG', 'Maven', 'Git']),
+    ('salesforce', 'Salesforce Developer', SALESFORCE_DEVELOPER_JD,
+     ['Salesforce', 'Apex', 'SOQL', 'Lightning', 'Visualforce', 'REST API', 'Git']),
+    ('sre', 'Site Reliability Engineer', SRE_JD,
+     ['Kubernetes', 'Helm', 'Terraform', 'GCP', 'Prometheus', 'Grafana', 'Splunk', 'Go', 'Python', 'Linux',
+      'Redis', 'GitLab', 'CI/CD']),
+    ('dotnet', '.NET Developer', DOTNET_DEVELOPER_JD,
+     ['C#', 'ASP.NET Core', 'Entity Framework', 'SQL Server', 'Azure', 'Azure DevOps', 'Angular', 'TypeScript']),
+    ('ios', 'iOS Developer', IOS_DEVELOPER_JD,
+     ['Swift', 'SwiftUI', 'Objective-C', 'GraphQL', 'REST API', 'Xcode', 'XCTest', 'GitHub Actions', 'CI/CD']),
+]
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Open-loop HTTP load test of the Flask app: throughput/latency curve and
+error breakdown for /api/analyze-jd, /api/detect-job-email and /analytics.
+
+Each step sends requests on a fixed schedule at the target rate for
+--duration seconds, whatever the server's response times (open loop), and
+measures latency from each request's scheduled start, so queueing behind a
+slow server counts instead of hiding it. Requests are spread over the
+endpoints by --mix weights and use the sample JDs and emails.
+
+Per step and endpoint it prints achieved requests/second, p50/p95/p99
+latency and errors split into HTTP status, client timeout and connection
+failures. --json writes the whole curve.
+
+--spawn starts the stub LLM server (stub_llm_server.py) and app.py as
+subprocesses, with the app's Gemini/OpenAI clients pointed at the stub;
+--stub-* options are passed through. Without --spawn, --url must name an
+already running app.
+
+Run from the backend directory:
+    python benchmarks/load_test.py --spawn [--rps 2,5,10,20] [--duration 20] [--mix analyze=1,detect=2,analytics=4]
+        [--stub-latency-ms 800] [--stub-error-rate 0.02] [--stub-timeout-rate 0.005] [--json curve.json]
+    python benchmarks/load_test.py --url http://127.0.0.1:5000 --rps 5,10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Add the backend directory to Python path
+sys.path.append(BACKEND_DIR)
+
+from samples import NORDIC_NATURALS_EMAIL, SAMPLE_JDS
+
+ENDPOINTS = {
+    'analyze': '/api/analyze-jd',
+    'detect': '/api/detect-job-email',
+    'analytics': '/analytics',
+}
+
+
+def payload(endpoint, i):
+    title, jd = SAMPLE_JDS[i % len(SAMPLE_JDS)]
+    if endpoint == 'analyze':
+        return {'job_title': title, 'job_description': jd}
+    if endpoint == 'detect':
+        content = NORDIC_NATURALS_EMAIL if i % 2 else jd
+        return {'email_content': content, 'subject': f"{title} opportunity", 'sender': 'recruiter@agency.example'}
+    return {'events': [{'eventName': 'search_generation', 'sessionId': f"load-{i % 50}", 'data': {'i': i}}]}
+
+
+def parse_mix(spec):
+    mix = []
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint {name!r} in --mix (choose from {', '.join(ENDPOINTS)})")
+        mix.extend([name] * int(weight or 1))
+    return mix
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+class StepResult:
+    """Outcomes of one load step, recorded from many worker threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+        self.sent = Counter()
+
+    def record(self, endpoint, latency_ms, error=None):
+        with self._lock:
+            self.sent[endpoint] += 1
+            if error:
+                self.errors[endpoint][error] += 1
+            else:
+                self.latencies[endpoint].append(latency_ms)
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for endpoint in sorted(self.sent):
+            latencies = self.latencies[endpoint]
+            endpoints[endpoint] = {
+                'sent': self.sent[endpoint],
+                'ok': len(latencies),
+                'achieved_rps': round(len(latencies) / elapsed, 2),
+                'p50_ms': _rounded(percentile(latencies, 50)),
+                'p95_ms': _rounded(percentile(latencies, 95)),
+                'p99_ms': _rounded(percentile(latencies, 99)),
+                'errors': dict(self.errors[endpoint]),
+            }
+        return endpoints
+
+
+def _rounded(value):
+    return None if value is None else round(value, 1)
+
+
+def send(session, url, endpoint, body, scheduled, timeout, result):
+    try:
+        response = session.post(url + ENDPOINTS[endpoint], json=body, timeout=timeout)
+        error = None if response.status_code == 200 else f"http_{response.status_code}"
+    except requests.Timeout:
+        error = 'timeout'
+    except requests.ConnectionError:
+        error = 'connection'
+    except requests.RequestException as e:
+        error = type(e).__name__
+    result.record(endpoint, (time.perf_counter() - scheduled) * 1000, error)
+
+
+def run_step(url, rps, duration, mix, timeout, concurrency):
+    result = StepResult()
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount('http://', adapter)
+    total = int(rps * duration)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(total):
+            scheduled = start + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            endpoint = mix[i % len(mix)]
+            pool.submit(send, session, url, endpoint, payload(endpoint, i), scheduled, timeout, result)
+    elapsed = time.perf_counter() - start
+    session.close()
+    return result.summary(elapsed), elapsed
+
+
+def wait_until_up(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(url, timeout=2).status_code < 500:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    raise SystemExit(f"{url} did not come up within {timeout}s")
+
+
+def spawn(args):
+    """Start the stub LLM server and the app; returns (app url, processes)"""
+    stub_url = f"http://127.0.0.1:{args.stub_port}"
+    stub = subprocess.Popen(
+        [sys.executable, os.path.join(BACKEND_DIR, 'benchmarks', 'stub_llm_server.py'),
+         '--port', str(args.stub_port), '--latency-ms', str(args.stub_latency_ms),
+         '--latency-sigma', str(args.stub_latency_sigma), '--error-rate', str(args.stub_error_rate),
+         '--rate-limit-rate', str(args.stub_rate_limit_rate), '--timeout-rate', str(args.stub_timeout_rate)],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL)
+    env = dict(os.environ, PORT=str(args.app_port), GEMINI_API_KEY='stub', OPENAI_API_KEY='stub',
+               FIRKI_GEMINI_ENDPOINT=stub_url, FIRKI_OPENAI_BASE_URL=f"{stub_url}/v1")
+    app = subprocess.Popen([sys.executable, 'app.py'], cwd=BACKEND_DIR, env=env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    processes = [stub, app]
+    try:
+        wait_until_up(f"{stub_url}/stats")
+        url = f"http://127.0.0.1:{args.app_port}"
+        wait_until_up(f"{url}/health")
+    except BaseException:
+        for process in processes:
+            process.terminate()
+        raise
+    return url, processes
+
+
+def stub_stats(args):
+    try:
+        return requests.get(f"http://127.0.0.1:{args.stub_port}/stats", timeout=5).json()
+    except (requests.RequestException, ValueError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='running app (ignored with --spawn)')
+    parser.add_argument('--rps', default='2,5,10,20', help='comma-separated target rates, one step each')
+    parser.add_argument('--duration', type=float, default=20.0, help='seconds per step')
+    parser.add_argument('--mix', default='analyze=1,detect=2,analytics=4', help='endpoint weights')
+    parser.add_argument('--timeout', type=float, default=30.0, help='client timeout per request')
+    parser.add_argument('--concurrency', type=int, default=256, help='max requests in flight')
+    parser.add_argument('--json', help='write the curve to this file')
+    parser.add_argument('--spawn', action='store_true', help='start the stub LLM server and app.py')
+    parser.add_argument('--app-port', type=int, default=5057)
+    parser.add_argument('--stub-port', type=int, default=8089)
+    parser.add_argument('--stub-latency-ms', type=float, default=800.0)
+    parser.add_argument('--stub-latency-sigma', type=float, default=0.4)
+    parser.add_argument('--stub-error-rate', type=float, default=0.0)
+    parser.add_argument('--stub-rate-limit-rate', type=float, default=0.0)
+    parser.add_argument('--stub-timeout-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    rates = [float(rate) for rate in args.rps.split(',')]
+    processes = []
+    url = args.url.rstrip('/')
+    if args.spawn:
+        url, processes = spawn(args)
+    else:
+        wait_until_up(f"{url}/health", timeout=5)
+
+    curve = []
+    try:
+        print(f"{'target':>7} {'endpoint':<10} {'sent':>6} {'ok rps':>7} {'p50 ms':>8} {'p95 ms':>8} "
+              f"{'p99 ms':>8}  errors")
+        for rate in rates:
+            endpoints, elapsed = run_step(url, rate, args.duration, mix, args.timeout, args.concurrency)
+            curve.append({'target_rps': rate, 'elapsed_s': round(elapsed, 2), 'endpoints': endpoints})
+            for endpoint, stats in endpoints.items():
+                errors = ', '.join(f"{kind} {count}" for kind, count in sorted(stats['errors'].items())) or '-'
+                print(f"{rate:>7g} {endpoint:<10} {stats['sent']:>6} {stats['achieved_rps']:>7.2f} "
+                      f"{stats['p50_ms'] or 0:>8.0f} {stats['p95_ms'] or 0:>8.0f} {stats['p99_ms'] or 0:>8.0f}  {errors}")
+        stats = stub_stats(args) if args.spawn else None
+        if stats:
+            print(f"\nStub LLM calls: {sum(stats.values())} "
+                  f"({', '.join(f'{key} {count}' for key, count in sorted(stats.items()))})")
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(timeout=10)
+
+    if args.json:
+        report = {
+            'url': url,
+            'mix': args.mix,
+            'duration_s': args.duration,
+            'stub': {
+                'latency_ms': args.stub_latency_ms,
+                'latency_sigma': args.stub_latency_sigma,
+                'error_rate': args.stub_error_rate,
+                'rate_limit_rate': args.stub_rate_limit_rate,
+                'timeout_rate': args.stub_timeout_rate,
+                'calls': stats,
+            } if args.spawn else None,
+            'curve': curve,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nCurve written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Fuzz/perf suite for the regex-heavy email paths.
+
+Generates adversarial recruiter emails (runaway lines, long capitalized word
+runs, bullets with no tech terms, repeated trigger phrases) and asserts that
+JobEmailDetector and the SkillExtractor pattern strategies stay under a
+worst-case time per KB and scale linearly with input size.
+
+Run from the backend directory:
+    python benchmarks/regex_fuzz.py [--budget-ms-per-kb 2.0] [--seed 7]
+
+The default budget is 2 ms/KB with RE2 and 5 ms/KB on the `re` fallback;
+either way time per KB must not grow with input size.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import safe_regex
+from services.job_email_detector import JobEmailDetector
+from services.skill_extractor import SkillExtractor
+
+SIZES_KB = [4, 16, 64]
+
+# Default worst-case budgets per regex engine
+BUDGET_MS_PER_KB = {'re2': 2.0, 're': 5.0}
+
+WORDS = ['alpha', 'beta', 'gamma', 'delta', 'client', 'summary', 'team', 'role',
+         'looking', 'for', 'senior', 'with', 'experience', 'platform', 'data']
+
+
+def _fill(unit: str, size_kb: int) -> str:
+    return (unit * (size_kb * 1024 // len(unit) + 1))[:size_kb * 1024]
+
+
+def gen_looking_for(rng, size_kb):
+    # "looking for" with no developer/engineer on the same line
+    return _fill('looking for ' + rng.choice(WORDS) + ' ', size_kb)
+
+
+def gen_capitalized_run(rng, size_kb):
+    # Long run of Capitalized Words never followed by a role/tool suffix
+    return _fill(rng.choice(WORDS).title() + ' ', size_kb)
+
+
+def gen_bullet_no_tech(rng, size_kb):
+    # Bullet markers followed by long tech-free bodies
+    marker = rng.choice(['• ', '* ', '- '])
+    return _fill(marker + 'x' * rng.randint(200, 2000) + ' ', size_kb)
+
+
+def gen_dash_storm(rng, size_kb):
+    return _fill('- ' * rng.randint(1, 5) + 'reac ', size_kb)
+
+
+def gen_client_summary(rng, size_kb):
+    return _fill('client summary ' + rng.choice(WORDS) + ' ', size_kb)
+
+
+def gen_experience_with(rng, size_kb):
+    return _fill('experience with ' + rng.choice(WORDS) + ' ', size_kb)
+
+
+def gen_forwarded_thread(rng, size_kb):
+    # Realistic-ish forwarded thread: quoted lines, signatures, no newlines trimmed
+    lines = []
+    while sum(len(l) + 1 for l in lines) < size_kb * 1024:
+        lines.append('> ' * rng.randint(0, 4) + ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 40))))
+    return '\n'.join(lines)[:size_kb * 1024]
+
+
+GENERATORS = [
+    gen_looking_for,
+    gen_capitalized_run,
+    gen_bullet_no_tech,
+    gen_dash_storm,
+    gen_client_summary,
+    gen_experience_with,
+    gen_forwarded_thread,
+]
+
+
+def _time_ms(fn, text, repeats=3):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def run_suite(budget_ms_per_kb: float, max_growth: float, seed: int) -> bool:
+    rng = random.Random(seed)
+    detector = JobEmailDetector()
+    extractor = SkillExtractor()
+
+    def detect(text):
+        detector.is_job_email(text, text[:200])
+        detector.get_job_context(text)
+
+    def patterns(text):
+        extractor._extract_intelligent_patterns(text)
+        for pattern in extractor.technical_patterns:
+            safe_regex.findall(pattern, text, re.IGNORECASE)
+
+    targets = [('detector', detect), ('skill_patterns', patterns)]
+
+    print(f"Regex engine: {'re2' if safe_regex.re2_available() else 're'}")
+    print(f"Budget: {budget_ms_per_kb:.2f} ms/KB, max growth {max_growth:.1f}x\n")
+
+    ok = True
+    for generator in GENERATORS:
+        for target_name, target in targets:
+            per_kb = []
+            for size_kb in SIZES_KB:
+                text = generator(rng, size_kb)
+                per_kb.append(_time_ms(target, text) / size_kb)
+
+            worst = max(per_kb)
+            growth = per_kb[-1] / per_kb[0] if per_kb[0] > 0 else 1.0
+            passed = worst <= budget_ms_per_kb and growth <= max_growth
+            ok = ok and passed
+
+            status = 'PASS' if passed else 'FAIL'
+            print(f"{status} {generator.__name__:<24} {target_name:<15} "
+                  f"worst={worst:.3f} ms/KB growth={growth:.2f}x")
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms-per-kb', type=float, default=None)
+    parser.add_argument('--max-growth', type=float, default=4.0,
+                        help='Allowed ms/KB ratio between the largest and smallest input')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    engine = 're2' if safe_regex.re2_available() else 're'
+    budget = args.budget_ms_per_kb or BUDGET_MS_PER_KB[engine]
+
+    if run_suite(budget, args.max_growth, args.seed):
+        print("\n✅ All adversarial inputs within budget")
+        return 0
+
+    print("\n❌ Pathological input exceeded the time budget")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
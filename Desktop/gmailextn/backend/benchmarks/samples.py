@@ -0,0 +1,158 @@
+"""
+Sample recruiter emails / job descriptions shared by the benchmark scripts.
+"""
+
+WEB_DEVELOPER_JD = """
+Client Need Summary - Web Developer (Part-Time Contract)
+
+Part time Hours: 20 – 30 a week
+Interview times - 2 slots: Tuesday, 8/26 at 2pm and 2:30pm
+
+The client is seeking a senior-level front-end web developer to support their main website, team member.
+
+Future Tech Stack:
+- CMS: Contentful
+- eCommerce: Shopify Plus
+- Frontend: Hydrogen (Shopify's React-based framework)
+
+Role Details:
+- Focus: 75-80% front-end development - JavaScript/Typescript
+- Experience with React/NodeJS/TypeScript
+- Experience with Hydrogen or other CMS is ideal
+- Familiarity with Jira, Git, and independent project work is important
+- Backend DevOps knowledge (AWS, Docker, shell operations)
+- Experience with Atlassian tools
+
+RESPONSIBILITIES:
+- Custom Shopify apps development
+- Marketing and fulfillment tools
+- Backend tools and hosting management
+- SQL/ORM database operations
+"""
+
+NORDIC_NATURALS_EMAIL = """
+Client: Nordic Naturals
+
+Nordic Naturals sells vitamins and supplements including animal oils, fish oils, and marine animal oils. Their products are for the skin, bones, and joints.
+
+Location: 100% remote manager is based in Watsonville
+Duration: 4 - 5 months (could extend)
+Bill Rate: 60 to 65/hr
+Part-time Hours: 20 - 30 a week
+
+Client Need Summary - Web Developer (Part-Time Contract)
+
+The client is seeking a senior-level front-end web developer to support their main website.
+
+Current Tech Stack:
+- CMS: WordPress
+- eCommerce: Shopify
+- Frontend: GatsbyJS - they will be moving to Hydrogen soon
+"""
+
+WORKDAY_JD = """
+We are looking for a Workday Data Conversion Specialist to join our team.
+The ideal candidate will have experience with Workday HCM, data migration,
+ETL processes, and SQL. Knowledge of HRIS systems and business process
+configuration is required. Experience with data validation, testing, and
+documentation is preferred.
+"""
+
+NETWORK_AUTOMATION_JD = """
+Position: Network Automation Engineer
+Location: Hybrid - Charlotte, NC
+Duration: 12 months CTH
+
+Requirements:
+• 5+ years of experience with Python and Ansible
+• 3 years practicing network automation with Nornir, NETCONF and RESTCONF
+• Working knowledge of Git, CI/CD pipelines, Docker and Kubernetes
+• Experience with Cisco, Juniper and Arista platforms
+• Familiarity with Nautobot or Netbox as a source of truth
+
+Responsibilities:
+- Develop and evaluate automation for SD-WAN and Load Balancers (F5)
+- Identify gaps in network monitoring using Splunk and LogicMonitor
+- Coordinate with the infrastructure team on Terraform and AWS deployments
+
+Interview Process - Prescreen, then 2 rounds (phone + onsite)
+"""
+
+FRONTEND_CLOJURE_JD = """
+We're hiring a Senior Frontend Engineer to help migrate our codebase.
+
+What you'll do:
+* Build features in ClojureScript and React with a strong emphasis on TypeScript
+* Contribute to our Next.js migration and evolving tech stack
+* Work closely with backend engineers using Java and Python services on AWS
+
+Minimum qualifications:
+- 5+ years of experience with JavaScript and React
+- Experience with Clojure or another functional language
+- Comfortable with Docker, Git and CI/CD
+
+Pay rate: $85-95 per hour, 6 months contract
+"""
+
+SAMPLE_JDS = [
+    ('Web Developer', WEB_DEVELOPER_JD),
+    ('Web Developer', NORDIC_NATURALS_EMAIL),
+    ('Workday Data Conversion Specialist', WORKDAY_JD),
+    ('Network Automation Engineer', NETWORK_AUTOMATION_JD),
+    ('Senior Frontend Engineer', FRONTEND_CLOJURE_JD),
+]
+
+AGENCY_ROLES_EMAIL = """
+Hi team,
+
+We have three new openings with the same client this week. Please send profiles by Friday.
+
+Client: Meridian Health
+Location: Remote (US)
+Duration: 6 months, extension likely
+
+Position: Senior Java Developer
+Bill Rate: 80/hr
+- 7+ years of Java, Spring Boot and Hibernate
+- Kafka and microservices on AWS
+- Experience with PostgreSQL and Redis
+
+Position: Data Engineer
+Bill Rate: 75/hr
+- Python, Spark and Airflow pipelines
+- Snowflake and dbt modelling
+- SQL performance tuning
+
+Position: Frontend Developer
+Bill Rate: 70/hr
+- React and TypeScript with Redux
+- Jest and Cypress testing
+- Figma handoff and accessibility (WCAG)
+
+Thanks,
+Dana
+"""
+
+REPEATED_STRUCTURE_EMAIL = """
+Two urgent contract roles for our banking client.
+
+DevOps Engineer
+Requirements:
+- Terraform, Ansible and Jenkins
+- Kubernetes and Helm on Azure
+Interview: 2 rounds, video
+
+QA Automation Engineer
+Requirements:
+- Selenium WebDriver with Java
+- API testing with Postman and RestAssured
+Interview: 1 round, video
+"""
+
+# (label, email, role titles the splitter should find)
+MULTI_POSTING_EMAILS = [
+    ('agency, Position: headers', AGENCY_ROLES_EMAIL,
+     ['Senior Java Developer', 'Data Engineer', 'Frontend Developer']),
+    ('repeated structure', REPEATED_STRUCTURE_EMAIL, ['DevOps Engineer', 'QA Automation Engineer']),
+    ('single posting', NETWORK_AUTOMATION_JD, ['']),
+]
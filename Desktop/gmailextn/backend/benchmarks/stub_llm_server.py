@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Gemini and OpenAI HTTP APIs, for load tests.
+
+Answers Gemini REST generateContent and OpenAI chat completions with
+canned responses shaped like the real ones. It recognises the backend's
+prompts: dynamic analysis JSON, skill lists, boolean strings and skill
+context JSON. The skills in an answer are the taxonomy skills found in the
+prompt, so downstream parsing and filtering run as in production.
+
+Latency is lognormal around --latency-ms (--latency-sigma 0 for fixed).
+A request fails with HTTP 500 at --error-rate and 429 at --rate-limit-rate.
+At --timeout-rate it stalls for --timeout-s before answering 504.
+GET /stats returns counts by prompt kind and outcome.
+
+Point the backend at it:
+    FIRKI_GEMINI_ENDPOINT=http://127.0.0.1:8089 FIRKI_OPENAI_BASE_URL=http://127.0.0.1:8089/v1 \\
+    GEMINI_API_KEY=stub OPENAI_API_KEY=stub python app.py
+
+Run from the backend directory:
+    python benchmarks/stub_llm_server.py [--port 8089] [--latency-ms 800] [--latency-sigma 0.4]
+        [--error-rate 0.02] [--rate-limit-rate 0.01] [--timeout-rate 0.005] [--timeout-s 60] [--seed 7]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.taxonomy import get_taxonomy
+
+
+class StubBehaviour:
+    """Latency and failure draws, seeded and shared by all handler threads"""
+
+    def __init__(self, latency_ms=800.0, latency_sigma=0.4, error_rate=0.0, rate_limit_rate=0.0,
+                 timeout_rate=0.0, timeout_s=60.0, seed=7):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_s = timeout_s
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = Counter()
+
+    def draw(self):
+        """(outcome, seconds to wait) for one request"""
+        with self._lock:
+            roll = self._rng.random()
+            latency = self.latency_ms / 1000
+            if self.latency_sigma:
+                latency *= math.exp(self._rng.gauss(0, self.latency_sigma))
+        if roll < self.timeout_rate:
+            return 'timeout', self.timeout_s
+        roll -= self.timeout_rate
+        if roll < self.error_rate:
+            return 'error', latency
+        roll -= self.error_rate
+        if roll < self.rate_limit_rate:
+            return 'rate_limited', 0.0
+        return 'ok', latency
+
+    def count(self, kind, outcome):
+        with self._lock:
+            self.stats[f"{kind}:{outcome}"] += 1
+
+
+def prompt_kind(prompt):
+    if '"booleanString"' in prompt:
+        return 'dynamic_analysis'
+    if 'Extract ONLY technical skills' in prompt:
+        return 'skills'
+    if 'boolean search query' in prompt:
+        return 'boolean'
+    if 'Provide context for the technical skill' in prompt:
+        return 'context'
+    return 'other'
+
+
+def canned_answer(kind, prompt):
+    taxonomy = get_taxonomy()
+    names = [taxonomy.name_for(skill_id) for skill_id in taxonomy.find_in_text(prompt)]
+    # Skills named in the prompt's examples, not the JD
+    names = [name for name in names if name not in ('Python', 'React', 'AWS', 'Docker')] or names
+    top = names[:5] or ['Python']
+    boolean = ' AND '.join(f'"{name}"' for name in top[:2])
+    if len(top) > 2:
+        boolean += ' AND (' + ' OR '.join(f'"{name}"' for name in top[2:]) + ')'
+
+    if kind == 'dynamic_analysis':
+        return json.dumps({
+            'skills': [{'name': name, 'confidence': 0.9, 'source': 'ai_analysis'} for name in top],
+            'keySkillContext': f"Hands-on {top[0]} experience is the critical requirement.",
+            'booleanString': boolean,
+            'aiQuestions': [f"Can you walk me through a recent project where you used {top[0]}?",
+                            "Tell me about a time you had to learn a new tool quickly for a project."],
+            'extractionMethod': 'ai_dynamic_analysis',
+        })
+    if kind == 'skills':
+        return '\n'.join(names[:7] + ['Strong communication skills'])
+    if kind == 'boolean':
+        return boolean
+    if kind == 'context':
+        return json.dumps({
+            'description': f"{top[0]} as used in production systems",
+            'probing_question': f"What was the hardest integration problem you solved with {top[0]}?",
+            'key_areas': top[:3],
+        })
+    return 'OK'
+
+
+def gemini_body(text):
+    return {
+        'candidates': [{
+            'content': {'parts': [{'text': text}], 'role': 'model'},
+            'finishReason': 'STOP',
+            'index': 0,
+            'safetyRatings': [],
+        }],
+        'promptFeedback': {'safetyRatings': []},
+    }
+
+
+def openai_body(text, model):
+    return {
+        'id': 'chatcmpl-stub',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': model,
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    behaviour: StubBehaviour = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.startswith('/stats'):
+            self._send(200, dict(self.behaviour.stats))
+        else:
+            self._send(404, {'error': {'code': 404, 'message': 'not found'}})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send(400, {'error': {'code': 400, 'message': 'invalid JSON'}})
+            return
+
+        path = self.path.split('?', 1)[0]
+        if ':generateContent' in path:
+            prompt = ''.join(part.get('text', '') for content in request.get('contents', [])
+                             for part in content.get('parts', []))
+            provider = 'gemini'
+        elif path.endswith('/chat/completions'):
+            prompt = ''.join(message.get('content') or '' for message in request.get('messages', []))
+            provider = 'openai'
+        else:
+            self._send(404, {'error': {'code': 404, 'message': f'unknown path {path}'}})
+            return
+
+        kind = prompt_kind(prompt)
+        outcome, wait_s = self.behaviour.draw()
+        self.behaviour.count(f"{provider}:{kind}", outcome)
+        time.sleep(wait_s)
+        if outcome == 'timeout':
+            self._send(504, {'error': {'code': 504, 'message': 'stub timeout', 'status': 'DEADLINE_EXCEEDED'}})
+        elif outcome == 'error':
+            self._send(500, {'error': {'code': 500, 'message': 'stub error', 'status': 'INTERNAL'}})
+        elif outcome == 'rate_limited':
+            self._send(429, {'error': {'code': 429, 'message': 'stub rate limit', 'status': 'RESOURCE_EXHAUSTED'}})
+        elif provider == 'gemini':
+            self._send(200, gemini_body(canned_answer(kind, prompt)))
+        else:
+            self._send(200, openai_body(canned_answer(kind, prompt), request.get('model', 'stub')))
+
+
+def serve(port, behaviour):
+    handler = type('BoundStubHandler', (StubHandler,), {'behaviour': behaviour})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency-ms', type=float, default=800.0, help='median response latency')
+    parser.add_argument('--latency-sigma', type=float, default=0.4, help='lognormal spread, 0 for fixed')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction answered HTTP 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='fraction answered HTTP 429')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='fraction that stall --timeout-s')
+    parser.add_argument('--timeout-s', type=float, default=60.0)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    behaviour = StubBehaviour(args.latency_ms, args.latency_sigma, args.error_rate, args.rate_limit_rate,
+                              args.timeout_rate, args.timeout_s, args.seed)
+    server = serve(args.port, behaviour)
+    print(f"Stub LLM server on http://127.0.0.1:{args.port} (latency {args.latency_ms:.0f} ms, "
+          f"errors {args.error_rate:.1%}, 429s {args.rate_limit_rate:.1%}, timeouts {args.timeout_rate:.1%})",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
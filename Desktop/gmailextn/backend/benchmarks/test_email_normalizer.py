@@ -0,0 +1,69 @@
+"""
+Regression tests for email normalization: only real quoted history and
+real signatures end the message.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_email_normalizer.py
+"""
+
+from services.email_normalizer import normalize_email
+
+REPLY = ("Hi Sam, we have an opening on our platform team and I think you would be a great fit for it. "
+         "The team owns the data pipeline and the internal APIs, and is growing this quarter. "
+         "Details of the role are below, let me know if you are interested.")
+JD = "Requirements:\n>5 years Python\n> 3 years of AWS\nKafka and SQL\n--\nNice to have:\nDocker"
+
+
+def test_greater_than_in_requirements_is_not_a_quote():
+    text = normalize_email(f"{REPLY}\n\n{JD}\n")
+    assert ">5 years Python" in text
+    assert "> 3 years of AWS" in text
+    assert "Kafka and SQL" in text
+
+
+def test_bare_double_dash_is_not_a_signature():
+    text = normalize_email(f"{REPLY}\n\n{JD}\n")
+    assert "Docker" in text
+
+
+def test_quoted_history_after_a_reply_is_dropped():
+    text = normalize_email(f"{REPLY}\n\n> Thanks for reaching out,\n> I am open to new roles.\n")
+    assert text == REPLY
+
+
+def test_quoted_jd_below_a_short_note_is_kept():
+    text = normalize_email("See the JD below.\n\n> Requirements:\n> Python and Kafka\n")
+    assert "Python and Kafka" in text
+    assert ">" not in text
+
+
+def test_signature_delimiter_at_the_end_drops_the_signature():
+    text = normalize_email(f"{REPLY}\n-- \nAlex Recruiter\nAcme Corp\n")
+    assert text == REPLY
+
+
+def test_signature_delimiter_before_more_content_is_kept():
+    body = '\n'.join(f"Requirement {i}: Python" for i in range(12))
+    text = normalize_email(f"{REPLY}\n-- \n{body}\n")
+    assert "Requirement 11: Python" in text
+
+
+def _html(text):
+    return ''.join(f"<div>{line}</div>" for line in text.split('\n'))
+
+
+def test_html_signature_delimiter_drops_the_signature():
+    text = normalize_email(_html(f"{REPLY}\n-- \nJohn Smith\nRecruiter"))
+    assert text == REPLY
+
+
+def test_html_bare_double_dash_is_not_a_signature():
+    text = normalize_email(_html(f"{REPLY}\n--\nJohn Smith\nRecruiter"))
+    assert text.endswith("--\nJohn Smith\nRecruiter")
+
+
+def test_html_text_split_across_chunks_keeps_its_spaces():
+    html = _html(f"{REPLY}\n- Production experience building with Kubernetes")
+    split = html.index(' Kubernetes')
+    for chunk_size in (split, split + 1):
+        assert "building with Kubernetes" in normalize_email(html, chunk_size=chunk_size)
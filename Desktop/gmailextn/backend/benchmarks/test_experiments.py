@@ -0,0 +1,60 @@
+"""
+Regression tests for experiment arms across a pipeline config hot reload:
+an override arm is merged over the reloaded config, like the control arm
+that runs it as is.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_experiments.py
+"""
+
+import contextlib
+import io
+import json
+
+import pytest
+
+from services.experiments import load_experiments
+from services.pipeline_config import PipelineConfigSource
+
+EXPERIMENTS = {'experiments': [{'name': 'ai-budget', 'unit': 'content', 'arms': [
+    {'name': 'control', 'weight': 1, 'pipeline': None},
+    {'name': 'treatment', 'weight': 1, 'pipeline': {'limits': {'ai_skills': 5}}},
+]}]}
+
+
+def _write(path, raw):
+    path.write_text(json.dumps(raw), encoding='utf-8')
+
+
+@pytest.fixture
+def arms(tmp_path):
+    pipeline = tmp_path / 'pipeline.json'
+    _write(pipeline, {'limits': {'final_skills': 20}})
+    experiments = tmp_path / 'experiments.json'
+    _write(experiments, EXPERIMENTS)
+    source = PipelineConfigSource(str(pipeline), reload_interval=0)
+    registry = load_experiments(str(experiments), source.current())
+    control, treatment = registry.experiments[0].arms
+    return source, pipeline, control, treatment
+
+
+def _reload(source, pipeline, raw):
+    _write(pipeline, raw)
+    source._stamp = None  # same size and mtime granularity must not hide the change
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert source.check()
+
+
+def test_override_arm_follows_reload(arms):
+    source, pipeline, control, treatment = arms
+    before = treatment.config_for(source.current())
+    assert before.limits['final_skills'] == 20 and before.limits['ai_skills'] == 5
+    assert treatment.config_for(source.current()) is before
+
+    _reload(source, pipeline, {'limits': {'final_skills': 30}})
+    base = source.current()
+    assert control.config_for(base) is base
+    after = treatment.config_for(base)
+    assert after.limits['final_skills'] == 30 and after.limits['ai_skills'] == 5
+    assert after.source == 'ai-budget.treatment'
+
@@ -0,0 +1,108 @@
+"""
+Microbenchmarks for the service hot paths, with baseline checks (see
+conftest.py).
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_hot_paths.py
+    python -m pytest benchmarks/test_hot_paths.py --hot-path-update-baseline
+"""
+
+import contextlib
+import io
+
+import pytest
+
+from services.boolean_generator import BooleanGenerator
+from services.boolean_query import parse_boolean
+from services.context_analyzer import ContextAnalyzer
+from services.job_email_detector import JobEmailDetector
+from services.sectionizer import sectionize
+from services.skill_classifier import default_classifier
+from services.skill_extractor import SkillExtractor
+from services.skill_record import Skill, SkillSource
+from samples import NETWORK_AUTOMATION_JD, NORDIC_NATURALS_EMAIL, WEB_DEVELOPER_JD
+
+CANDIDATE_SKILLS = [
+    'Python', 'Ansible', 'Interview Process - Prescreen', 'Network Enterprise', 'Develop', 'Kubernetes',
+    'React Native', 'Strong communication', 'CI/CD', 'Load Balancers', 'Evaluate', 'Nautobot', 'Team player',
+    'REST API', 'Hydrogen', 'Shopify Plus', 'Attention to detail', 'SD-WAN', 'Juniper', 'Frontend',
+]
+
+CONTEXT_SKILLS = ['Python', 'JS', 'Postgres', 'K8s', 'React Developer', 'Docker', 'Workday HCM', 'Unknown Tool']
+
+BOOLEAN_SEARCH = '("Python" OR "Go") AND "Ansible" AND ("Nornir" OR "NETCONF" OR "RESTCONF") AND "Git"'
+
+
+def _quiet(factory):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return factory()
+
+
+@pytest.fixture(scope='module')
+def extractor():
+    return _quiet(SkillExtractor)
+
+
+@pytest.fixture(scope='module')
+def generator():
+    return _quiet(BooleanGenerator)
+
+
+@pytest.fixture(scope='module')
+def detector():
+    return JobEmailDetector()
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return _quiet(ContextAnalyzer)
+
+
+@pytest.fixture(scope='module')
+def ranked_input():
+    """40 skills with alias duplicates, as _finalize sees them"""
+    names = ['Node.js', 'NodeJS', 'node', 'React', 'ReactJS', 'TypeScript', 'AWS', 'Amazon Web Services',
+             'Docker', 'Git', 'Jira', 'SQL', 'Shopify', 'Hydrogen', 'Contentful', 'JavaScript', 'JS', 'DevOps',
+             'Atlassian', 'Kubernetes']
+    return [Skill(name, 0.5 + (i % 10) / 20, SkillSource.KEYWORD_MATCH) for i, name in enumerate(names * 2)]
+
+
+def test_is_technical_skill(hot_path, extractor):
+    # Uncached: the classifier's LRU is cleared before every round
+    hot_path(lambda: [extractor._is_technical_skill(name) for name in CANDIDATE_SKILLS],
+             setup=default_classifier.cache_clear)
+
+
+def test_extract_intelligent_patterns(hot_path, extractor):
+    # Includes sectioning: the sectionize() cache is cleared before every round
+    hot_path(extractor._extract_intelligent_patterns, NETWORK_AUTOMATION_JD, setup=sectionize.cache_clear)
+
+
+def test_deduplicate_and_rank(hot_path, extractor, ranked_input):
+    hot_path(extractor._deduplicate_and_rank, ranked_input)
+
+
+def test_generate_with_rules(hot_path, generator, ranked_input):
+    hot_path(generator._generate_with_rules, ranked_input[:5], 'Frontend Engineer')
+
+
+def test_validate_boolean_search(hot_path, generator):
+    hot_path(generator.validate_boolean_search, BOOLEAN_SEARCH)
+
+
+def test_parse_boolean(hot_path):
+    # Uncached: the parse memo is cleared before every round
+    hot_path(parse_boolean, BOOLEAN_SEARCH, setup=parse_boolean.cache_clear)
+
+
+def test_is_job_email(hot_path, detector):
+    hot_path(detector.is_job_email, NORDIC_NATURALS_EMAIL, 'Web Developer Position - React/Shopify',
+             'recruiter@agency.example')
+
+
+def test_get_job_context(hot_path, detector):
+    hot_path(detector.get_job_context, WEB_DEVELOPER_JD)
+
+
+def test_get_context_for_skill(hot_path, analyzer):
+    hot_path(lambda: [analyzer._get_context_for_skill(name) for name in CONTEXT_SKILLS])
@@ -0,0 +1,76 @@
+"""
+Regression tests for resuming a mailbox backfill whose output no longer
+matches its checkpoint: the checkpoint is ignored and the run starts over
+instead of padding the output with NUL bytes.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_mailbox_ingest.py
+"""
+
+import contextlib
+import io
+import json
+import os
+from email.message import EmailMessage
+
+import pytest
+
+from services.job_email_detector import JobEmailDetector
+from services.mailbox_ingest import MailboxIngest
+from services.skill_record import Skill, SkillSource
+
+JOB = ("We are hiring a Senior Python Developer for a 12 month contract.\n"
+       "Requirements: Python, Django, PostgreSQL and AWS. Please send your resume.")
+PERSONAL = "Friday lunch works, see you there!"
+COUNT = 6
+
+
+class StubExtractor:
+    last_method_used = 'stub'
+
+    def extract_skills(self, job_description, job_title):
+        return [Skill('Python', 0.9, SkillSource.KEYWORD_MATCH)]
+
+
+@pytest.fixture
+def mbox(tmp_path):
+    path = tmp_path / 'mail.mbox'
+    with open(path, 'wb') as f:
+        for i in range(COUNT):
+            msg = EmailMessage()
+            msg['From'] = 'talent@agency.example' if i % 2 == 0 else 'friend@example.com'
+            msg['Subject'] = f'Job opportunity #{i}' if i % 2 == 0 else f'Lunch #{i}'
+            msg['Message-ID'] = f'<msg-{i}@example.com>'
+            msg.set_content(JOB if i % 2 == 0 else PERSONAL)
+            f.write(b'From sender@example.com Mon Jan  1 00:00:00 2024\n' + msg.as_bytes() + b'\n')
+    return str(path)
+
+
+def _run(mbox, output, resume):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ingest = MailboxIngest(mbox, output, StubExtractor(), JobEmailDetector(), workers=2, checkpoint_every=1)
+        return ingest.run(resume=resume)
+
+
+@pytest.mark.parametrize('damage', ['delete', 'shorten'])
+def test_resume_ignores_checkpoint_past_output(mbox, tmp_path, damage):
+    output = str(tmp_path / 'out.jsonl')
+    fresh = _run(mbox, output, resume=False)
+    assert fresh['job_emails'] and not fresh['errors']
+    with open(output, 'rb') as f:
+        expected = f.read()
+    with open(output + '.checkpoint', 'r', encoding='utf-8') as f:
+        assert json.load(f)['output_offset'] > 0
+
+    if damage == 'delete':
+        os.remove(output)
+    else:
+        with open(output, 'r+b') as f:
+            f.truncate(len(expected) // 2)
+    stats = _run(mbox, output, resume=True)
+
+    with open(output, 'rb') as f:
+        actual = f.read()
+    assert b'\0' not in actual
+    assert actual == expected
+    assert stats == fresh
@@ -0,0 +1,99 @@
+"""
+Regression tests for splitting multi-role emails: one JD with repeated
+header keywords or sections stays one posting, and every role runs under
+the request's pipeline run.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_multi_posting.py
+"""
+
+from services.multi_posting import analyze_postings, split_postings
+from services.pipeline_config import PipelineRun, active_run, load_pipeline_config, pinned
+from samples import MULTI_POSTING_EMAILS
+
+TITLE_AND_POSITION_JD = """
+Title: Senior Java Developer
+- 7+ years of Java and Spring Boot
+- Kafka on AWS
+Position: must be US citizen
+- No sponsorship available
+- Hybrid, 3 days onsite
+"""
+
+SECOND_REQUIREMENTS_JD = """
+Senior Java Developer
+Requirements:
+- Java and Spring Boot
+- Kafka on AWS
+Requirements:
+- Must be a US citizen
+- Bachelor's degree
+"""
+
+SAME_TITLE_JD = """
+Position: Data Engineer
+- Python and Spark
+- Airflow
+Position: Data Engineer
+- Snowflake
+- dbt
+"""
+
+HEADERS_WITHOUT_BODIES = """
+Position: Java Developer
+Bill Rate: 80/hr
+Position: Data Engineer
+Bill Rate: 75/hr
+"""
+
+
+def test_sample_emails_split_into_expected_roles():
+    for label, email, expected in MULTI_POSTING_EMAILS:
+        assert [posting.title for posting in split_postings(email)] == expected, label
+
+
+def test_different_header_keywords_are_one_posting():
+    assert len(split_postings(TITLE_AND_POSITION_JD)) == 1
+
+
+def test_second_requirements_section_is_one_posting():
+    assert len(split_postings(SECOND_REQUIREMENTS_JD)) == 1
+
+
+def test_repeated_title_is_one_posting():
+    assert len(split_postings(SAME_TITLE_JD)) == 1
+
+
+def test_roles_need_their_own_requirements():
+    assert len(split_postings(HEADERS_WITHOUT_BODIES)) == 1
+
+
+class _RecordingExtractor:
+    last_method_used = 'recorded'
+
+    def __init__(self):
+        self.runs = []
+
+    def extract_skills(self, job_description, job_title):
+        self.runs.append(active_run())
+        return []
+
+
+class _Generator:
+    def generate_boolean_search(self, skills, job_title):
+        return ''
+
+
+class _Detector:
+    def get_job_context(self, text):
+        return {'job_title': ''}
+
+
+def test_roles_run_under_the_callers_pipeline_run():
+    postings = split_postings(MULTI_POSTING_EMAILS[0][1])
+    extractor = _RecordingExtractor()
+    run = PipelineRun(load_pipeline_config())
+    with pinned(run.config, run):
+        roles = analyze_postings(postings, extractor, _Generator(), _Detector())
+    assert [role['job_title'] for role in roles] == MULTI_POSTING_EMAILS[0][2]
+    assert extractor.runs == [run] * len(postings)
@@ -0,0 +1,27 @@
+"""
+Regression tests for prompt budgets: a JD within budget reaches the
+prompt unchanged, a longer one is compacted.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_prompt_budget.py
+"""
+
+import contextlib
+import io
+
+from services.prompt_budget import job_text_for_prompt
+from services.tokens import estimate_tokens
+
+JD = "Acme is hiring.\nRequirements:\n- Python and Kafka\nBenefits:\n- Remote\nApply by email."
+
+
+def test_jd_within_budget_is_unchanged():
+    assert job_text_for_prompt('test', JD, budget=1500) == JD
+
+
+def test_jd_over_budget_is_compacted():
+    long_jd = JD + "\n" + "\n".join(f"- Great culture and perks, item {i}" for i in range(200))
+    with contextlib.redirect_stdout(io.StringIO()):
+        text = job_text_for_prompt('test', long_jd, budget=100)
+    assert estimate_tokens(text) <= 100
+    assert "Python and Kafka" in text
@@ -0,0 +1,59 @@
+"""
+Regression tests for JD sectioning: list items are never headings, and
+sectioning never loses skills the whole-text scan finds.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_sectionizer.py
+"""
+
+import contextlib
+import io
+
+import pytest
+
+from services.sectionizer import OVERVIEW, REQUIREMENTS, ROLE_DETAILS, TECH_STACK, heading_label, sectionize
+from services.skill_extractor import SkillExtractor
+
+BULLET_JD = "Requirements:\n- AWS\n- SQL, GCP\n- Python and Django\n* CI/CD"
+
+
+@pytest.fixture(scope='module')
+def local_extractor():
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    extractor.extraction_mode = 'local'
+    return extractor
+
+
+@pytest.mark.parametrize('line', ['- AWS', '- SQL, GCP', '* CI/CD', '• KAFKA', '2) SQL', '1. Requirements:',
+                                  'AWS', 'SQL SERVER', 'AWS, GCP, AZURE', 'Python, Java:'])
+def test_list_items_and_bare_caps_are_not_headings(line):
+    assert heading_label(line) is None
+
+
+@pytest.mark.parametrize('line, label', [
+    ('Requirements:', REQUIREMENTS),
+    ('REQUIREMENTS', REQUIREMENTS),
+    ('TECH STACK', TECH_STACK),
+    ('Who you are:', ROLE_DETAILS),
+])
+def test_headings(line, label):
+    assert heading_label(line) == label
+
+
+def test_bullet_list_stays_in_its_section():
+    sections = sectionize(BULLET_JD)
+    assert sections.get(REQUIREMENTS).splitlines() == ['- AWS', '- SQL, GCP', '- Python and Django', '* CI/CD']
+    assert sections.text() == sections.get(REQUIREMENTS)
+
+
+def test_overview_is_kept_alongside_content_sections():
+    sections = sectionize("Looking for a Kafka engineer\nRequirements:\n- Python")
+    assert sections.get(OVERVIEW) == "Looking for a Kafka engineer"
+    assert "Kafka" in sections.text()
+
+
+def test_bullet_list_skills_are_extracted(local_extractor):
+    with contextlib.redirect_stdout(io.StringIO()):
+        names = {skill.name for skill in local_extractor.extract_skills(BULLET_JD, '')}
+    assert {'AWS', 'SQL', 'Python', 'CI/CD'} <= names
@@ -0,0 +1,45 @@
+"""
+Regression tests for shadow runs: every stage runs on the shadow worker
+thread, so its CPU time is counted against the budget.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_shadow.py
+"""
+
+import contextlib
+import io
+import threading
+import time
+
+from services.shadow import ShadowRunner
+from services.skill_extractor import SkillExtractor
+from services.skill_record import Skill, SkillSource
+
+BURN_SECONDS = 0.2
+
+
+def _burn(threads):
+    def strategy(job_description, job_title):
+        threads.add(threading.current_thread().name)
+        end = time.thread_time() + BURN_SECONDS
+        while time.thread_time() < end:
+            pass
+        return [Skill('Kafka', 0.9, SkillSource.GEMINI)]
+    return strategy
+
+
+def test_fanout_shadow_runs_on_the_worker_and_counts_its_cpu():
+    with contextlib.redirect_stdout(io.StringIO()):
+        extractor = SkillExtractor()
+    threads = set()
+    runner = ShadowRunner(extractor, mode='fanout', sample=1.0, cpu_budget=1.0)
+    runner.extractor.remote_strategies = [('gemini', _burn(threads)), ('openai', _burn(threads))]
+    with contextlib.redirect_stdout(io.StringIO()):
+        runner.submit("Kafka and Python engineer", "", [], 'cascade', 10.0)
+        deadline = time.time() + 10
+        while runner.summary()['counts']['completed'] < 1 and time.time() < deadline:
+            time.sleep(0.05)
+    summary = runner.summary()
+    assert summary['counts']['completed'] == 1
+    assert threads == {'shadow-pipeline'}
+    assert summary['cpu_seconds'] >= 2 * BURN_SECONDS - 0.05
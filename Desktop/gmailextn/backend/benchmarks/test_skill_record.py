@@ -0,0 +1,24 @@
+"""
+Regression tests for Skill records: equal records hash alike, so they
+work in sets and as dict keys.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_skill_record.py
+"""
+
+from services.skill_record import Skill, SkillSource
+
+
+def test_equal_skills_hash_alike():
+    a = Skill('Python', 0.9, SkillSource.KEYWORD_MATCH)
+    b = Skill.from_dict(a.to_dict())
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert {a: 1}[b] == 1
+
+
+def test_different_skills_are_distinct_in_a_set():
+    skills = {Skill('Python', 0.9, 'keyword_match'), Skill('Python', 0.8, 'keyword_match'),
+              Skill('Java', 0.9, 'keyword_match')}
+    assert len(skills) == 3
@@ -0,0 +1,74 @@
+"""
+Regression tests for traffic capture sanitizing: redaction and hashing
+reach nested payloads, in requests and in replies.
+
+Run from the backend directory:
+    python -m pytest benchmarks/test_traffic_capture.py
+"""
+
+import json
+
+from services.traffic_capture import CaptureLog, TrafficCapture, capture_files, hash_value, sanitize
+
+NESTED = {
+    'events': [
+        {'type': 'copy', 'meta': {'sender': 'dana@agency.com', 'note': 'call +1 (555) 123-4567'}},
+        ['see https://jobs.example.com/123', 42],
+    ],
+    'sender': 'dana@agency.com',
+    'count': 2,
+}
+
+
+def test_nested_payload_is_redacted_and_hashed():
+    clean = sanitize(NESTED, hash_fields=['sender'], salt='s')
+    assert clean['sender'] == clean['events'][0]['meta']['sender'] == hash_value('dana@agency.com', 's')
+    assert clean['events'][0]['meta']['note'] == 'call <phone>'
+    assert clean['events'][1] == ['see <url>', 42]
+    assert clean['count'] == 2
+    assert 'dana@agency.com' not in json.dumps(clean)
+    # The original is left alone
+    assert NESTED['events'][0]['meta']['sender'] == 'dana@agency.com'
+
+
+def test_redaction_can_be_turned_off():
+    clean = sanitize(NESTED, redact=False, hash_fields=['sender'])
+    assert clean['events'][0]['meta']['note'] == 'call +1 (555) 123-4567'
+    assert clean['sender'].startswith('sha256:')
+
+
+class _Log:
+    def __init__(self):
+        self.records = []
+
+    def submit(self, record):
+        self.records.append(record)
+
+
+def test_captured_response_is_redacted():
+    log = _Log()
+    capture = TrafficCapture(log, sample=1.0, hash_fields=['sender'])
+    response = {'success': True, 'data': {'context': {'contact': 'dana@agency.com', 'sender': 'dana@agency.com'}}}
+    capture.record('/api/detect-job-email', NESTED, 200, response, 12.34)
+    record = log.records[0]
+    assert record['response']['data']['context']['contact'] == '<email>'
+    assert record['response']['data']['context']['sender'].startswith('sha256:')
+    assert 'dana@agency.com' not in json.dumps(record)
+
+
+def test_logs_sharing_a_directory_only_prune_their_own_files(tmp_path):
+    first = CaptureLog(str(tmp_path), max_bytes=1, keep_files=2)
+    second = CaptureLog(str(tmp_path), max_bytes=1, keep_files=2)
+    try:
+        for n in range(3):
+            second.submit({'n': n})
+        second.flush()
+        kept = set(capture_files(str(tmp_path)))
+        for n in range(5):
+            first.submit({'n': n})
+        first.flush()
+        assert kept <= set(capture_files(str(tmp_path)))
+        assert len(capture_files(str(tmp_path))) == 4
+    finally:
+        first.close()
+        second.close()
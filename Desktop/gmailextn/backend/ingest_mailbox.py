@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Backfill job email analysis from a mailbox export.
+
+Reads an mbox file or a directory of .eml files, keeps the job emails
+(JobEmailDetector) and writes their context and skills as JSONL. Rerun
+the same command to resume an interrupted run from its checkpoint.
+
+Usage:
+    python ingest_mailbox.py MAILBOX OUTPUT.jsonl [--workers 4] [--checkpoint-every 100] [--restart]
+"""
+
+import argparse
+import contextlib
+import os
+import time
+
+from dotenv import load_dotenv
+
+from services.job_email_detector import JobEmailDetector
+from services.mailbox_ingest import MailboxIngest
+from services.skill_extractor import SkillExtractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('mailbox', help='mbox file or directory of .eml files')
+    parser.add_argument('output', help='JSONL file for job email results')
+    parser.add_argument('--workers', type=int, default=4, help='threads running skill extraction')
+    parser.add_argument('--checkpoint', help='checkpoint file (default OUTPUT.checkpoint)')
+    parser.add_argument('--checkpoint-every', type=int, default=100, help='messages between checkpoints')
+    parser.add_argument('--restart', action='store_true', help='ignore an existing checkpoint')
+    parser.add_argument('--verbose', action='store_true', help='keep the services\' debug output')
+    args = parser.parse_args()
+
+    load_dotenv()
+    ingest = MailboxIngest(args.mailbox, args.output, SkillExtractor(), JobEmailDetector(), workers=args.workers,
+                           checkpoint_path=args.checkpoint, checkpoint_every=args.checkpoint_every)
+
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, \
+            contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull):
+        stats = ingest.run(resume=not args.restart)
+    elapsed = time.perf_counter() - start
+
+    print(f"{stats['messages']} messages, {stats['job_emails']} job emails analysed, "
+          f"{stats['errors']} errors -> {args.output} ({elapsed:.1f} s this run)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Replay captured API traffic against another instance and diff the results.
+
+Reads the capture files written when the app runs with FIRKI_CAPTURE_DIR
+(a directory or individual capture-*.jsonl.gz files) and re-sends each
+request to --target, at the original pace sped up --speed times (0 sends
+as fast as --concurrency allows). Each reply is compared with the
+captured one, or with --baseline's reply to the same request when a
+baseline instance is given:
+
+- /api/analyze-jd: skill names (Jaccard overlap, added and removed),
+  boolean string and extraction method
+- /api/detect-job-email: is_job_email and confidence
+- all endpoints: HTTP status, and the latency distributions
+
+Captured requests and replies were redacted (emails, phones, URLs) and
+hashed fields no longer hold the original values, so small differences
+against the captured replies are expected; --baseline compares like with
+like.
+
+Usage:
+    python replay_traffic.py CAPTURES... --target http://candidate:5000 [--baseline http://current:5000]
+        [--speed 10] [--concurrency 16] [--endpoint /api/analyze-jd] [--limit N] [--diffs diffs.jsonl]
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from services.traffic_capture import read_captures
+
+
+def post(session, base_url, record, timeout):
+    """(status, reply JSON, latency ms) for one captured request"""
+    start = time.perf_counter()
+    try:
+        response = session.post(base_url + record['endpoint'], json=record['request'], timeout=timeout)
+        status = response.status_code
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+    except requests.RequestException as e:
+        status, body = type(e).__name__, None
+    return status, body, (time.perf_counter() - start) * 1000
+
+
+def _data(body):
+    return (body or {}).get('data') or {}
+
+
+def diff_replies(endpoint, expected, actual):
+    """Differences between two replies to the same request, {} when they agree"""
+    diff = {}
+    if endpoint == '/api/analyze-jd':
+        before = {skill.get('name', '').lower() for skill in _data(expected).get('skills', [])}
+        after = {skill.get('name', '').lower() for skill in _data(actual).get('skills', [])}
+        if before != after:
+            diff['skills_added'] = sorted(after - before)
+            diff['skills_removed'] = sorted(before - after)
+        diff['skills_jaccard'] = round(len(before & after) / len(before | after), 3) if before | after else 1.0
+        for field in ('boolean_search', 'extraction_method'):
+            if _data(expected).get(field) != _data(actual).get(field):
+                diff[field] = [_data(expected).get(field), _data(actual).get(field)]
+    elif endpoint == '/api/detect-job-email':
+        if _data(expected).get('is_job_email') != _data(actual).get('is_job_email'):
+            diff['is_job_email'] = [_data(expected).get('is_job_email'), _data(actual).get('is_job_email')]
+        confidence = [_data(expected).get('confidence'), _data(actual).get('confidence')]
+        if None not in confidence and abs(confidence[0] - confidence[1]) > 0.01:
+            diff['confidence'] = confidence
+    return diff
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+class ReplayReport:
+    """Per-endpoint agreement and latency, filled in by the worker threads"""
+
+    def __init__(self, diffs_path=None):
+        self._lock = threading.Lock()
+        self.counts = defaultdict(Counter)
+        self.jaccard = defaultdict(list)
+        self.latency = defaultdict(lambda: {'reference': [], 'target': []})
+        self._diffs = open(diffs_path, 'w', encoding='utf-8') if diffs_path else None
+
+    def add(self, record, reference, target):
+        endpoint = record['endpoint']
+        diff = diff_replies(endpoint, reference[1], target[1])
+        if reference[0] != target[0]:
+            diff['status'] = [reference[0], target[0]]
+        jaccard = diff.pop('skills_jaccard', None)
+        with self._lock:
+            counts = self.counts[endpoint]
+            counts['requests'] += 1
+            counts['agree' if not diff else 'differ'] += 1
+            for field in diff:
+                counts[f"differ:{field}"] += 1
+            if jaccard is not None:
+                self.jaccard[endpoint].append(jaccard)
+            self.latency[endpoint]['reference'].append(reference[2])
+            self.latency[endpoint]['target'].append(target[2])
+            if diff and self._diffs:
+                self._diffs.write(json.dumps({'endpoint': endpoint, 'request': record['request'],
+                                              'diff': diff}) + '\n')
+
+    def print_summary(self, reference_name):
+        for endpoint in sorted(self.counts):
+            counts = self.counts[endpoint]
+            print(f"\n{endpoint}: {counts['requests']} requests, {counts['agree']} agree, {counts['differ']} differ")
+            for key in sorted(k for k in counts if k.startswith('differ:')):
+                print(f"  {key[7:]:<20} {counts[key]}")
+            if self.jaccard[endpoint]:
+                values = self.jaccard[endpoint]
+                print(f"  skills Jaccard mean {sum(values) / len(values):.3f}, min {min(values):.3f}")
+            print(f"  {'latency ms':<20} {'p50':>9} {'p95':>9} {'p99':>9}")
+            for name, values in ((reference_name, self.latency[endpoint]['reference']),
+                                 ('target', self.latency[endpoint]['target'])):
+                print(f"  {name:<20} {percentile(values, 50):>9.1f} {percentile(values, 95):>9.1f} "
+                      f"{percentile(values, 99):>9.1f}")
+
+    def close(self):
+        if self._diffs:
+            self._diffs.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('captures', nargs='+', help='capture directories or capture-*.jsonl.gz files')
+    parser.add_argument('--target', required=True, help='instance to replay against')
+    parser.add_argument('--baseline', help='compare with this instance instead of the captured replies')
+    parser.add_argument('--speed', type=float, default=1.0, help='pace multiplier; 0 sends without pauses')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--endpoint', action='append', help='only replay this endpoint (repeatable)')
+    parser.add_argument('--limit', type=int, help='replay at most this many requests')
+    parser.add_argument('--diffs', help='write one JSON line per differing request here')
+    args = parser.parse_args()
+
+    records = [r for r in read_captures(args.captures) if not args.endpoint or r['endpoint'] in args.endpoint]
+    records.sort(key=lambda r: r['ts'])
+    if args.limit:
+        records = records[:args.limit]
+    if not records:
+        sys.exit("No captured requests to replay")
+
+    target = args.target.rstrip('/')
+    baseline = args.baseline.rstrip('/') if args.baseline else None
+    session = requests.Session()
+    session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=args.concurrency))
+    report = ReplayReport(args.diffs)
+
+    def replay(record):
+        reply = post(session, target, record, args.timeout)
+        if baseline:
+            reference = post(session, baseline, record, args.timeout)
+        else:
+            reference = (record['status'], record['response'], record['latency_ms'])
+        report.add(record, reference, reply)
+
+    print(f"Replaying {len(records)} requests against {target}"
+          f" ({f'{args.speed:g}x' if args.speed else 'unpaced'})", file=sys.stderr)
+    first_ts = records[0]['ts']
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for record in records:
+            if args.speed:
+                delay = (record['ts'] - first_ts) / args.speed - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(replay, record)
+    report.close()
+    print(f"Replayed in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    report.print_summary('baseline' if baseline else 'captured')
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,41 @@
-from typing import List, Dict, Any
-import openai
-import google.generativeai as genai
+from typing import List, Dict, Any, Optional, Tuple, Union
+from functools import lru_cache, partial
 import os
-import re
+
+from services.boolean_query import (And, BooleanSyntaxError, Or, QueryCache, Term, any_of, cache_key,
+                                    normalize, parse_boolean, query_from_llm, repair_boolean, tiered_query,
+                                    to_string, walk)
+from services.pipeline_config import active_config, note_cache_lookup, pinned
+from services.prompt_budget import field_for_prompt
+from services.providers import chat_completion, configure_gemini, configure_openai, gemini_model
+from services.skill_record import Skill
+from services.taxonomy import get_taxonomy
+
+# Queries written by Gemini/OpenAI, keyed by provider, job title and the
+# canonical form of the skill set; shared by every generator (app.py builds
+# one per request). 0 disables.
+BOOLEAN_CACHE_SIZE = int(os.getenv('FIRKI_BOOLEAN_CACHE_SIZE', '1024'))
+_model_queries = QueryCache(BOOLEAN_CACHE_SIZE)
+
+LOCATION_TERMS = ('city', 'state', 'country', 'remote', 'onsite', 'hybrid')
 
 class BooleanGenerator:
-    def __init__(self):
+    def __init__(self, local_only: bool = False):
+        # Rule-based generation only, no provider calls (offline batch runs)
+        self.local_only = local_only
+        
         # Initialize OpenAI
-        openai.api_key = os.getenv('OPENAI_API_KEY')
+        configure_openai(os.getenv('OPENAI_API_KEY'))
         
         # Initialize Gemini
-        genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-        self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        configure_gemini(os.getenv('GEMINI_API_KEY'))
+        self.gemini_model = gemini_model('gemini-2.0-flash-exp')
         
-        # Hardcoded patterns for common job titles
-        self.job_title_patterns = {
-            'workday data conversion': '"Workday" AND ("Data Conversion" OR "Data Migration")',
-            'workday developer': '"Workday" AND ("HCM" OR "HRIS" OR "Implementation")',
-            'salesforce developer': '"Salesforce" AND ("Apex" OR "Lightning" OR "SOQL")',
-            'react developer': '"React" AND ("JavaScript" OR "TypeScript" OR "Frontend")',
-            'python developer': '"Python" AND ("Backend" OR "API" OR "Web Development")',
-            'java developer': '"Java" AND ("Spring" OR "Backend" OR "Enterprise")',
-            'devops engineer': '"DevOps" AND ("Docker" OR "Kubernetes" OR "CI/CD")',
-            'data engineer': '"Data Engineering" AND ("SQL" OR "Python" OR "ETL")',
-            'aws engineer': '"AWS" AND ("Cloud" OR "Infrastructure" OR "DevOps")'
-        }
+        # Hand-tuned patterns for common job titles (from the skill taxonomy), parsed and normalized
+        self.job_title_patterns = {pattern: to_string(normalize(parse_boolean(boolean_string)))
+                                   for pattern, boolean_string in get_taxonomy().title_booleans().items()}
 
-    def generate_boolean_search(self, skills: List[Dict[str, Any]], job_title: str = "") -> str:
+    def generate_boolean_search(self, skills: List[Union[Skill, Dict[str, Any]]], job_title: str = "") -> str:
         """Generate boolean search query from extracted skills"""
         print(f"DEBUG: BooleanGenerator.generate_boolean_search called with {len(skills)} skills")
         if not skills:
@@ -40,63 +49,54 @@ class BooleanGenerator:
                     print(f"DEBUG: Found AI boolean string in skill: {skill['ai_boolean_string']}")
                     return skill['ai_boolean_string']
         
-        # Fall back to traditional generation methods
-        try:
-            print(f"DEBUG: Trying Gemini boolean generation")
-            # Try Gemini first
-            result = self._generate_with_gemini(skills, job_title)
-            print(f"DEBUG: Gemini boolean generation successful: {result}")
-            return result
-        except Exception as e:
-            print(f"Gemini generation failed: {e}")
-            try:
-                print(f"DEBUG: Trying OpenAI boolean generation")
-                # Try OpenAI next
-                result = self._generate_with_openai(skills, job_title)
-                print(f"DEBUG: OpenAI boolean generation successful: {result}")
-                return result
-            except Exception as e:
-                print(f"OpenAI generation failed: {e}")
+        with pinned(active_config()) as config:
+            # Configured order (boolean.strategies in the pipeline config); rules only when local
+            strategies = ('rules',) if self.local_only else config.boolean_strategies
+            generators = {
+                'gemini': partial(self._generate_with_model, 'gemini', self._generate_with_gemini),
+                'openai': partial(self._generate_with_model, 'openai', self._generate_with_openai),
+                'rules': self._generate_with_rules,
+            }
+            for name in strategies:
                 try:
-                    print(f"DEBUG: Trying rule-based generation")
-                    # Try rule-based generation
-                    result = self._generate_with_rules(skills, job_title)
-                    print(f"DEBUG: Rule-based generation successful: {result}")
+                    print(f"DEBUG: Trying {name} boolean generation")
+                    result = generators[name](skills, job_title)
+                    print(f"DEBUG: {name} boolean generation successful: {result}")
                     return result
                 except Exception as e:
-                    print(f"Rule-based generation failed: {e}")
-                    # Final fallback
-                    result = self._generate_fallback(skills)
-                    print(f"DEBUG: Fallback generation successful: {result}")
-                    return result
+                    print(f"{name} boolean generation failed: {e}")
+            
+            # Final fallback
+            result = self._generate_fallback(skills)
+            print(f"DEBUG: Fallback generation successful: {result}")
+            return result
 
-    def _generate_with_ai(self, skills: List[Dict[str, Any]], job_title: str) -> str:
-        """Generate boolean search using AI (Gemini first, then OpenAI)"""
-        
-        # Try Gemini first
-        try:
-            return self._generate_with_gemini(skills, job_title)
-        except Exception as e:
-            print(f"Gemini boolean generation failed: {e}")
-        
-        # Fallback to OpenAI
-        try:
-            return self._generate_with_openai(skills, job_title)
-        except Exception as e:
-            print(f"OpenAI boolean generation failed: {e}")
-        
-        return ""
+    def _generate_with_model(self, provider: str, generate, skills: List[Union[Skill, Dict[str, Any]]],
+                             job_title: str) -> str:
+        """A provider's query, from the cache when the same skills and title were asked before"""
+        skill_names = [Skill.coerce(skill).name for skill in skills[:active_config().limits['boolean_skills']]]
+        key = (provider, ' '.join(job_title.casefold().split()), cache_key(any_of(skill_names)))
+        query = _model_queries.get(key)
+        note_cache_lookup(query is not None)
+        if query is None:
+            query = generate(skills, job_title)
+            _model_queries.put(key, query)
+        else:
+            print(f"DEBUG: Cached {provider} boolean query for this skill set")
+        return query
 
-    def _generate_with_gemini(self, skills: List[Dict[str, Any]], job_title: str) -> str:
+    def _generate_with_gemini(self, skills: List[Union[Skill, Dict[str, Any]]], job_title: str) -> str:
         """Generate boolean search using Google Gemini"""
-        # Limit to top 4-5 skills for shorter boolean search
-        skill_names = [skill['name'] for skill in skills[:5]]
+        # Limit to the top few skills (limits.boolean_skills) for a shorter boolean search
+        skill_names = [Skill.coerce(skill).name for skill in skills[:active_config().limits['boolean_skills']]]
+        job_title = field_for_prompt('generate_with_gemini', job_title)
+        skills_text = field_for_prompt('generate_with_gemini', ', '.join(skill_names))
         
         prompt = f"""
         Create a concise boolean search query for a recruiter to find candidates with these skills.
         
         Job Title: {job_title}
-        Skills: {', '.join(skill_names)}
+        Skills: {skills_text}
         
         Requirements:
         - Use ONLY 4-5 skills maximum
@@ -113,24 +113,21 @@ class BooleanGenerator:
         """
         
         response = self.gemini_model.generate_content(prompt)
-        boolean_search = response.text.strip()
-        
-        # Clean up the response
-        boolean_search = re.sub(r'^```.*?\n', '', boolean_search)
-        boolean_search = re.sub(r'\n```$', '', boolean_search)
-        
-        return boolean_search
+        # Parsed and normalized, never passed through as-is; unusable answers raise
+        return to_string(query_from_llm(response.text))
 
-    def _generate_with_openai(self, skills: List[Dict[str, Any]], job_title: str) -> str:
+    def _generate_with_openai(self, skills: List[Union[Skill, Dict[str, Any]]], job_title: str) -> str:
         """Generate boolean search using OpenAI"""
-        # Limit to top 4-5 skills for shorter boolean search
-        skill_names = [skill['name'] for skill in skills[:5]]
+        # Limit to the top few skills (limits.boolean_skills) for a shorter boolean search
+        skill_names = [Skill.coerce(skill).name for skill in skills[:active_config().limits['boolean_skills']]]
+        job_title = field_for_prompt('generate_with_openai', job_title)
+        skills_text = field_for_prompt('generate_with_openai', ', '.join(skill_names))
         
         prompt = f"""
         Create a concise boolean search query for a recruiter to find candidates with these skills.
         
         Job Title: {job_title}
-        Skills: {', '.join(skill_names)}
+        Skills: {skills_text}
         
         Requirements:
         - Use ONLY 4-5 skills maximum
@@ -146,7 +143,7 @@ class BooleanGenerator:
         Return only the boolean search query, no explanations.
         """
         
-        response = openai.ChatCompletion.create(
+        response = chat_completion(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a recruitment expert who creates concise boolean search queries."},
@@ -156,15 +153,10 @@ class BooleanGenerator:
             temperature=0.3
         )
         
-        boolean_search = response.choices[0].message.content.strip()
-        
-        # Clean up the response
-        boolean_search = re.sub(r'^```.*?\n', '', boolean_search)
-        boolean_search = re.sub(r'\n```$', '', boolean_search)
-        
-        return boolean_search
+        # Parsed and normalized, never passed through as-is; unusable answers raise
+        return to_string(query_from_llm(response.choices[0].message.content))
 
-    def _generate_with_rules(self, skills: List[Dict[str, Any]], job_title: str) -> str:
+    def _generate_with_rules(self, skills: List[Union[Skill, Dict[str, Any]]], job_title: str) -> str:
         """Generate boolean search using rule-based logic"""
         
         # Check if we have a hardcoded pattern for this job title
@@ -175,100 +167,90 @@ class BooleanGenerator:
                     return boolean_string
         
         # Rule-based generation based on skill types
-        # Limit to top 4-5 skills for shorter boolean search
-        skill_names = [skill['name'] for skill in skills[:5]]
-        
-        if len(skill_names) == 1:
-            return f'"{skill_names[0]}"'
-        
-        if len(skill_names) == 2:
-            return f'"{skill_names[0]}" AND "{skill_names[1]}"'
-        
-        if len(skill_names) == 3:
-            return f'"{skill_names[0]}" AND "{skill_names[1]}" AND "{skill_names[2]}"'
+        # Limit to the top few skills (limits.boolean_skills) for a shorter boolean search
+        skill_names = [Skill.coerce(skill).name for skill in skills[:active_config().limits['boolean_skills']]]
         
-        # Group related skills with OR, separate groups with AND
-        primary_skills = skill_names[:2]
-        secondary_skills = skill_names[2:]
+        if len(skill_names) <= 3:
+            return tiered_query(tuple((name,) for name in skill_names))
         
-        if secondary_skills:
-            primary_part = f'"{primary_skills[0]}" AND "{primary_skills[1]}"'
-            secondary_part = ' OR '.join([f'"{skill}"' for skill in secondary_skills])
-            return f'{primary_part} AND ({secondary_part})'
-        else:
-            return f'"{primary_skills[0]}" AND "{primary_skills[1]}"'
+        # The top two skills required, the rest as alternatives
+        return tiered_query(((skill_names[0],), (skill_names[1],), tuple(skill_names[2:])))
 
-    def _generate_fallback(self, skills: List[Dict[str, Any]]) -> str:
+    def _generate_fallback(self, skills: List[Union[Skill, Dict[str, Any]]]) -> str:
         """Generate a simple fallback boolean search"""
-        # Limit to top 4-5 skills for shorter boolean search
-        skill_names = [skill['name'] for skill in skills[:5]]
-        
-        if len(skill_names) == 1:
-            return f'"{skill_names[0]}"'
-        
-        if len(skill_names) == 2:
-            return f'"{skill_names[0]}" AND "{skill_names[1]}"'
-        
-        if len(skill_names) == 3:
-            return f'"{skill_names[0]}" AND "{skill_names[1]}" AND "{skill_names[2]}"'
-        
-        # For 4-5 skills, group them logically
-        primary = skill_names[0]
-        secondary = skill_names[1:3]
-        tertiary = skill_names[3:]
-        
-        if len(tertiary) == 0:
-            # 4 skills: primary AND (secondary1 OR secondary2)
-            secondary_part = ' OR '.join([f'"{skill}"' for skill in secondary])
-            return f'"{primary}" AND ({secondary_part})'
-        else:
-            # 5 skills: primary AND (secondary1 OR secondary2) AND (tertiary1 OR tertiary2)
-            secondary_part = ' OR '.join([f'"{skill}"' for skill in secondary])
-            tertiary_part = ' OR '.join([f'"{skill}"' for skill in tertiary])
-            return f'"{primary}" AND ({secondary_part}) AND ({tertiary_part})'
+        # Limit to the top few skills (limits.boolean_skills) for a shorter boolean search
+        skill_names = [Skill.coerce(skill).name for skill in skills[:active_config().limits['boolean_skills']]]
+        return fallback_query(skill_names)
 
     def validate_boolean_search(self, boolean_search: str) -> Dict[str, Any]:
         """Validate and provide feedback on boolean search quality"""
-        validation = {
-            'is_valid': True,
-            'issues': [],
-            'suggestions': [],
-            'score': 100
-        }
-        
         # Check for common issues
-        if not boolean_search:
-            validation['is_valid'] = False
-            validation['issues'].append('Empty boolean search')
-            validation['score'] = 0
-            return validation
-        
-        # Check for balanced parentheses
-        open_parens = boolean_search.count('(')
-        close_parens = boolean_search.count(')')
-        if open_parens != close_parens:
-            validation['issues'].append('Unbalanced parentheses')
-            validation['score'] -= 20
+        if not boolean_search or not boolean_search.strip():
+            return {'is_valid': False, 'issues': ['Empty boolean search'], 'suggestions': [], 'score': 0}
         
-        # Check for proper AND/OR usage
-        if 'AND' not in boolean_search and 'OR' not in boolean_search:
-            validation['suggestions'].append('Consider using AND/OR operators for better precision')
-            validation['score'] -= 10
-        
-        # Check for quoted terms
-        quoted_terms = re.findall(r'"([^"]+)"', boolean_search)
-        if not quoted_terms:
-            validation['suggestions'].append('Use quotes around multi-word terms')
-            validation['score'] -= 15
-        
-        # Check for location terms (should be avoided)
-        location_terms = ['city', 'state', 'country', 'remote', 'onsite', 'hybrid']
-        for term in location_terms:
-            if term.lower() in boolean_search.lower():
-                validation['issues'].append(f'Location term "{term}" detected - focus on technical skills')
-                validation['score'] -= 25
-        
-        # Ensure score doesn't go below 0
-        validation['score'] = max(0, validation['score'])
-        
-        return validation 
\ No newline at end of file
+        is_valid, issues, suggestions, score, normalized = _assess_query(boolean_search)
+        validation = {
+            'is_valid': is_valid,
+            'issues': list(issues),
+            'suggestions': list(suggestions),
+            'score': score
+        }
+        if normalized is not None:
+            validation['normalized'] = normalized
+        return validation
+
+
+@lru_cache(maxsize=1024)
+def _assess_query(boolean_search: str) -> Tuple[bool, Tuple[str, ...], Tuple[str, ...], int, Optional[str]]:
+    """(is_valid, issues, suggestions, score, normalized query) from the parsed query; memoized per string"""
+    is_valid = True
+    issues = []
+    suggestions = []
+    score = 100
+    
+    # Syntax (balanced parentheses and quotes, operands for every operator)
+    try:
+        query = parse_boolean(boolean_search)
+    except BooleanSyntaxError as e:
+        is_valid = False
+        issues.append(str(e))
+        score -= 20
+        try:
+            query = repair_boolean(boolean_search)
+        except BooleanSyntaxError:
+            return is_valid, tuple(issues), (), score, None
+    
+    nodes = list(walk(query))
+    query_terms = [node for node in nodes if type(node) is Term]
+    
+    # Check for proper AND/OR usage
+    if not any(type(node) is And or type(node) is Or for node in nodes):
+        suggestions.append('Consider using AND/OR operators for better precision')
+        score -= 10
+    
+    # Check for quoted terms
+    if not any(term.quoted for term in query_terms):
+        suggestions.append('Use quotes around multi-word terms')
+        score -= 15
+    
+    # Check for location terms (should be avoided)
+    words = {word for term in query_terms for word in term.key.split()}
+    for term in LOCATION_TERMS:
+        if term in words:
+            issues.append(f'Location term "{term}" detected - focus on technical skills')
+            score -= 25
+    
+    # Repeated terms and nested groups of the same operator
+    normalized = normalize(query)
+    if normalized != query:
+        suggestions.append('Remove repeated terms and redundant grouping')
+    
+    # Ensure score doesn't go below 0
+    return is_valid, tuple(issues), tuple(suggestions), max(0, score), to_string(normalized)
+
+
+def fallback_query(skill_names: List[str]) -> str:
+    """One required skill, then alternatives: "A" AND ("B" OR "C") AND ("D" OR ...)"""
+    if len(skill_names) <= 3:
+        return tiered_query(tuple((name,) for name in skill_names))
+    return tiered_query(((skill_names[0],), tuple(skill_names[1:3]), tuple(skill_names[3:])))
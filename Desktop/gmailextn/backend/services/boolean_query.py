@@ -0,0 +1,355 @@
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Boolean search queries as trees, in the LinkedIn dialect the generators
+# target: quoted phrases, bare words, parentheses, and upper-case NOT, AND
+# and OR (binding in that order). Adjacent terms are an implicit AND.
+
+KEYWORDS = ('AND', 'OR', 'NOT')
+
+# Curly quotes from LLM answers count as plain ones
+_QUOTES = str.maketrans({'“': '"', '”': '"', '„': '"', '‟': '"'})
+# A phrase (closing quote optional), a parenthesis or a bare word; findall() skips the whitespace
+_TOKEN = re.compile(r'"[^"]*"?|[()]|[^\s()"]+')
+# Markdown code fences and a leading "Boolean search:" label around LLM answers
+_FENCE = re.compile(r'^```[^\n]*\n?|\n?```$')
+_LABEL = re.compile(r'^[A-Za-z][\w ]{0,40}:\s+(?=["(A-Za-z])')
+# Characters that force quotes around a term when rendering
+_NEEDS_QUOTES = re.compile(r'[\s()]')
+
+
+class BooleanSyntaxError(ValueError):
+    """A query that does not parse; `position` is the offset of the problem"""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} at {position}")
+        self.position = position
+
+
+class Term:
+    """A word or quoted phrase. Terms compare case- and space-insensitively, as the search does."""
+
+    __slots__ = ('text', 'quoted', 'key')
+
+    def __init__(self, text: str, quoted: bool = True):
+        self.text = ' '.join(text.replace('"', '').split())
+        self.quoted = quoted
+        self.key = self.text.casefold()
+
+    def __eq__(self, other):
+        return type(other) is Term and other.key == self.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"Term({self.text!r})"
+
+
+class Not:
+    __slots__ = ('child',)
+
+    def __init__(self, child: 'Node'):
+        self.child = child
+
+    def __eq__(self, other):
+        return type(other) is Not and other.child == self.child
+
+    def __hash__(self):
+        return hash(('NOT', self.child))
+
+    def __repr__(self):
+        return f"Not({self.child!r})"
+
+
+class _Group:
+    __slots__ = ('children',)
+    op = ''
+
+    def __init__(self, children: Iterable['Node']):
+        self.children = tuple(children)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.children == self.children
+
+    def __hash__(self):
+        return hash((self.op, self.children))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(map(repr, self.children))})"
+
+
+class And(_Group):
+    __slots__ = ()
+    op = 'AND'
+
+
+class Or(_Group):
+    __slots__ = ()
+    op = 'OR'
+
+
+Node = Union[Term, Not, And, Or]
+
+
+def _plain_quotes(text: str) -> str:
+    return text if text.isascii() else text.translate(_QUOTES)
+
+
+def tokenize(text: str) -> List[str]:
+    """The query's tokens: phrases with their quotes, parentheses, operators and words"""
+    return _TOKEN.findall(_plain_quotes(text))
+
+
+def token_offsets(text: str) -> List[int]:
+    """Offset of each token from tokenize(); only needed to report errors"""
+    return [m.start() for m in _TOKEN.finditer(_plain_quotes(text))]
+
+
+class _Parser:
+    """
+    Recursive descent over the token list, one call per parenthesized
+    group. With repair, problems an LLM answer typically has (a missing
+    closing parenthesis or quote, a stray one, a dangling operator, an
+    empty group) are skipped instead of raised.
+    """
+
+    def __init__(self, text: str, repair: bool):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.repair = repair
+        self.i = 0
+
+    def fail(self, message: str, index: Optional[int] = None):
+        if self.repair:
+            return
+        index = self.i if index is None else index
+        offsets = token_offsets(self.text)
+        raise BooleanSyntaxError(message, offsets[index] if index < len(offsets) else len(self.text))
+
+    def parse(self) -> Node:
+        node = self.parse_group()
+        while self.i < len(self.tokens):
+            # Only a stray ')' stops a top-level group early
+            self.fail("Unbalanced parentheses: unexpected ')'")
+            self.i += 1
+            rest = self.parse_group()
+            node = And((node, rest)) if node is not None and rest is not None else node or rest
+        if node is None:
+            self.repair = False
+            self.fail("Empty boolean query")
+        return node
+
+    def parse_group(self) -> Optional[Node]:
+        """OR of ANDs up to a ')' or the end; NOT binds to the next term or group"""
+        tokens = self.tokens
+        count = len(tokens)
+        alternatives = []
+        conjuncts = []
+        negate = False
+        expect_term = False
+        while self.i < count:
+            token = tokens[self.i]
+            first = token[0]
+            if first == ')':
+                break
+            index = self.i
+            self.i += 1
+            if token == 'AND' or token == 'OR':
+                if expect_term or not conjuncts:
+                    self.fail(f"Missing term before {token}", index)
+                if token == 'OR' and conjuncts:
+                    alternatives.append(conjuncts[0] if len(conjuncts) == 1 else And(conjuncts))
+                    conjuncts = []
+                negate = False
+                expect_term = True
+                continue
+            if token == 'NOT':
+                negate = not negate
+                expect_term = True
+                continue
+            if first == '"':
+                if len(token) == 1 or token[-1] != '"':
+                    self.fail("Unterminated quote", index)
+                node = Term(token) if token.strip('" ') else None
+            elif first == '(':
+                node = self.parse_group()
+                if self.i < count:
+                    self.i += 1
+                else:
+                    self.fail("Unbalanced parentheses: '(' is never closed", index)
+                if node is None:
+                    self.fail("Empty parentheses", index)
+            else:
+                node = Term(token, quoted=False)
+            if node is not None:
+                conjuncts.append(Not(node) if negate else node)
+            negate = False
+            expect_term = False
+        if expect_term:
+            self.fail("Missing term at end of group")
+        if conjuncts:
+            alternatives.append(conjuncts[0] if len(conjuncts) == 1 else And(conjuncts))
+        if not alternatives:
+            return None
+        return alternatives[0] if len(alternatives) == 1 else Or(alternatives)
+
+
+@lru_cache(maxsize=1024)
+def parse_boolean(text: str) -> Node:
+    """The tree for a query; BooleanSyntaxError when it is malformed. Trees are immutable, so parses are memoized."""
+    return _Parser(text, repair=False).parse()
+
+
+def repair_boolean(text: str) -> Node:
+    """Like parse_boolean(), but skips over unbalanced parentheses and quotes and dangling operators"""
+    return _Parser(text, repair=True).parse()
+
+
+def query_from_llm(text: str) -> Node:
+    """
+    A model's answer as a normalized tree: code fences and a leading label
+    are dropped, and a malformed query is repaired where possible.
+    BooleanSyntaxError when nothing usable is left, or when the answer has
+    neither quoted terms nor operators (prose rather than a query).
+    """
+    text = _FENCE.sub('', text.strip()).strip()
+    text = _LABEL.sub('', text)
+    if '"' not in _plain_quotes(text) and not {'AND', 'OR'} & set(tokenize(text)):
+        raise BooleanSyntaxError("No quoted terms or AND/OR operators", 0)
+    try:
+        node = parse_boolean(text)
+    except BooleanSyntaxError as e:
+        print(f"DEBUG: Repairing boolean query from model ({e}): {text!r}")
+        node = repair_boolean(text)
+    return normalize(node)
+
+
+def normalize(node: Node) -> Node:
+    """
+    The same query without redundancy: nested groups of the same operator
+    flattened, repeated children dropped (first one kept), one-child groups
+    unwrapped and double negation removed. Child order is kept.
+    """
+    if type(node) is Term:
+        return node
+    if type(node) is Not:
+        child = normalize(node.child)
+        return child.child if type(child) is Not else Not(child)
+    group = type(node)
+    children = []
+    seen = set()
+    for child in node.children:
+        child = normalize(child)
+        for part in (child.children if type(child) is group else (child,)):
+            if part not in seen:
+                seen.add(part)
+                children.append(part)
+    return children[0] if len(children) == 1 else group(children)
+
+
+def canonical(node: Node) -> Node:
+    """normalize() with every group's children sorted, so equivalent queries give equal trees"""
+    node = normalize(node)
+    if type(node) is Term:
+        return node
+    if type(node) is Not:
+        return Not(canonical(node.child))
+    return type(node)(sorted((canonical(child) for child in node.children), key=_key_string))
+
+
+def _key_string(node: Node) -> str:
+    """Rendering with every term quoted and case-folded"""
+    if type(node) is Term:
+        return f'"{node.key}"'
+    if type(node) is Not:
+        return f"NOT ({_key_string(node.child)})"
+    return f"({f' {node.op} '.join(map(_key_string, node.children))})"
+
+
+def cache_key(node: Node) -> str:
+    """A string that is equal for equivalent queries, whatever their order, case, quoting or grouping"""
+    return _key_string(canonical(node))
+
+
+def to_string(node: Node) -> str:
+    """The query text; groups inside other operators are parenthesized"""
+    if type(node) is Term:
+        if node.quoted or node.text in KEYWORDS or _NEEDS_QUOTES.search(node.text):
+            return f'"{node.text}"'
+        return node.text
+    if type(node) is Not:
+        child = node.child
+        return f"NOT ({to_string(child)})" if isinstance(child, _Group) else f"NOT {to_string(child)}"
+    return f" {node.op} ".join(f"({to_string(child)})" if isinstance(child, _Group) else to_string(child)
+                               for child in node.children)
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Every node of the query, parents before children"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        if type(node) is Not:
+            stack.append(node.child)
+        elif type(node) is not Term:
+            stack.extend(reversed(node.children))
+
+
+def all_of(names: Iterable[Union[str, Node]]) -> Node:
+    """AND of skill names (quoted terms) and subqueries"""
+    return _group(And, names)
+
+
+def any_of(names: Iterable[Union[str, Node]]) -> Node:
+    """OR of skill names (quoted terms) and subqueries"""
+    return _group(Or, names)
+
+
+def _group(group, names) -> Node:
+    children = [Term(name) if isinstance(name, str) else name for name in names]
+    return children[0] if len(children) == 1 else group(children)
+
+
+@lru_cache(maxsize=1024)
+def tiered_query(tiers: Tuple[Tuple[str, ...], ...]) -> str:
+    """
+    The query requiring one skill from each tier: skills within a tier are
+    alternatives (OR), tiers are all required (AND). Normalized and
+    rendered; memoized, since generators see the same skill lists often.
+    """
+    return to_string(normalize(all_of(any_of(tier) for tier in tiers if tier)))
+
+
+class QueryCache:
+    """A bounded, thread-safe LRU of rendered queries keyed by cache_key()-based tuples"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            query = self._entries.get(key)
+            if query is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return query
+
+    def put(self, key: Hashable, query: str):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = query
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,141 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+# Record/replay of LLM calls at the provider-client boundary, for
+# deterministic offline benchmarks. FIRKI_CASSETTE names a gzipped JSONL
+# file; FIRKI_CASSETTE_MODE is "record" (call the provider, append every
+# prompt, response and latency) or "replay" (serve the recorded answers,
+# never calling out). Replay sleeps the recorded latency times
+# FIRKI_CASSETTE_LATENCY_SCALE (default 0, i.e. instant).
+CASSETTE_PATH = os.getenv('FIRKI_CASSETTE', '')
+CASSETTE_MODE = os.getenv('FIRKI_CASSETTE_MODE', 'replay')
+CASSETTE_LATENCY_SCALE = float(os.getenv('FIRKI_CASSETTE_LATENCY_SCALE', '0'))
+
+
+class CassetteMiss(RuntimeError):
+    """Replay found no recording for a prompt"""
+
+
+def interaction_key(provider: str, model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{provider}\0{model}\0{prompt}".encode('utf-8')).hexdigest()[:24]
+
+
+class Cassette:
+    """
+    One cassette file. Entries are JSON lines:
+    {"key", "provider", "model", "prompt", "text" or "error", "latency_ms"}.
+    A prompt recorded several times replays its answers in recorded order,
+    then keeps repeating the last one.
+    """
+
+    def __init__(self, path: str, mode: str = 'replay', latency_scale: float = 0.0):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode {mode!r} (expected 'record' or 'replay')")
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._played: Dict[str, int] = defaultdict(int)
+        self._file = None
+        self.hits = self.misses = self.recorded = 0
+        if mode == 'replay':
+            for entry in self._read(path):
+                self._entries[entry['key']].append(entry)
+            print(f"DEBUG: Cassette {path}: {sum(len(e) for e in self._entries.values())} recorded calls loaded")
+
+    @staticmethod
+    def _read(path: str):
+        # A recording cut short (process killed) still replays up to its last flushed entry
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except EOFError:
+            return
+
+    def call(self, provider: str, model: str, prompt: str, fn: Callable[[], str]) -> str:
+        """The provider's answer text for `prompt`; `fn` makes the real call"""
+        key = interaction_key(provider, model, prompt)
+        if self.mode == 'replay':
+            return self._replay(key)
+
+        start = time.perf_counter()
+        entry = {'key': key, 'provider': provider, 'model': model, 'prompt': prompt}
+        try:
+            text = fn()
+            entry['text'] = text
+            return text
+        except Exception as e:
+            entry['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            entry['latency_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            self._append(entry)
+
+    def _replay(self, key: str) -> str:
+        with self._lock:
+            recorded = self._entries.get(key)
+            if not recorded:
+                self.misses += 1
+                raise CassetteMiss(f"no recording for prompt {key} in {self.path}")
+            index = self._played[key]
+            self._played[key] = index + 1
+            self.hits += 1
+        entry = recorded[min(index, len(recorded) - 1)]
+        if self.latency_scale:
+            time.sleep(entry['latency_ms'] / 1000 * self.latency_scale)
+        if 'error' in entry:
+            raise RuntimeError(f"recorded provider error: {entry['error']}")
+        return entry['text']
+
+    def _append(self, entry: Dict[str, Any]):
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, 'at', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            self.recorded += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+@lru_cache(maxsize=1)
+def get_cassette() -> Optional[Cassette]:
+    """The process-wide cassette from FIRKI_CASSETTE, or None when unset"""
+    if not CASSETTE_PATH:
+        return None
+    return Cassette(CASSETTE_PATH, CASSETTE_MODE, CASSETTE_LATENCY_SCALE)
+
+
+class CassetteGeminiModel:
+    """A GenerativeModel whose generate_content() goes through the cassette"""
+
+    def __init__(self, model, model_name: str, cassette: Cassette):
+        self._model = model
+        self.model_name = model_name
+        self._cassette = cassette
+
+    def generate_content(self, prompt):
+        text = self._cassette.call('gemini', self.model_name, prompt,
+                                   lambda: self._model.generate_content(prompt).text)
+        return SimpleNamespace(text=text)
+
+
+def chat_completion_response(content: str):
+    """The attributes callers read from a ChatCompletion response"""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
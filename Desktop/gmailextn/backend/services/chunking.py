@@ -0,0 +1,69 @@
+import os
+from typing import List, Optional
+
+from services.sectionizer import heading_label
+from services.tokens import estimate_tokens
+
+# JDs longer than this are analysed in chunks (map-reduce)
+CHUNK_THRESHOLD_TOKENS = int(os.getenv('FIRKI_CHUNK_THRESHOLD_TOKENS', '3000'))
+# Target size of one chunk, and how much of its tail the next chunk repeats
+CHUNK_TOKENS = int(os.getenv('FIRKI_CHUNK_TOKENS', '1200'))
+CHUNK_OVERLAP_TOKENS = int(os.getenv('FIRKI_CHUNK_OVERLAP_TOKENS', '120'))
+# Longest a chunked analysis waits for its LLM calls before reducing without them
+CHUNK_DEADLINE = float(os.getenv('FIRKI_CHUNK_DEADLINE', '8'))
+
+
+def needs_chunking(text: str, threshold: Optional[int] = None) -> bool:
+    return estimate_tokens(text) > (threshold or CHUNK_THRESHOLD_TOKENS)
+
+
+def split_into_chunks(text: str, chunk_tokens: Optional[int] = None,
+                      overlap_tokens: Optional[int] = None) -> List[str]:
+    """
+    Split text on line boundaries into chunks of about chunk_tokens.
+    Consecutive chunks share their last ~overlap_tokens of lines, so a
+    skill list that straddles a boundary is seen whole at least once. A
+    chunk that starts inside a section repeats that section's heading, so
+    the sectionizer still labels it.
+    """
+    chunk_tokens = chunk_tokens or CHUNK_TOKENS
+    overlap_tokens = CHUNK_OVERLAP_TOKENS if overlap_tokens is None else overlap_tokens
+
+    chunks = []
+    current: List[str] = []
+    current_costs: List[int] = []
+    used = 0
+    heading = None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        cost = estimate_tokens(line) + 1
+
+        if current and used + cost > chunk_tokens:
+            chunks.append('\n'.join(current))
+            # Carry the tail over as overlap
+            tail, tail_used = [], 0
+            for prev, prev_cost in zip(reversed(current), reversed(current_costs)):
+                if tail_used + prev_cost > overlap_tokens:
+                    break
+                tail.insert(0, (prev, prev_cost))
+                tail_used += prev_cost
+            current = [prev for prev, _ in tail]
+            current_costs = [prev_cost for _, prev_cost in tail]
+            used = tail_used
+            if heading and (not current or current[0] != heading):
+                current.insert(0, heading)
+                current_costs.insert(0, estimate_tokens(heading) + 1)
+                used += current_costs[0]
+
+        if heading_label(line):
+            heading = line
+        current.append(line)
+        current_costs.append(cost)
+        used += cost
+
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
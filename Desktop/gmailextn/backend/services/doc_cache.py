@@ -0,0 +1,107 @@
+import hashlib
+import os
+import threading
+from typing import Iterable, Iterator, List, Optional
+
+from spacy.tokens import Doc, DocBin
+
+from services.pipeline_config import note_cache_lookup
+
+# Set to a directory to keep parsed JDs between runs; unset disables the cache
+DOC_CACHE_DIR = os.getenv('FIRKI_DOC_CACHE_DIR', '')
+
+
+class DocCache:
+    """
+    Parsed spaCy docs on disk, keyed by a hash of the text and the pipeline
+    that parsed it. Reanalysing a JD (new prompt, taxonomy update) loads
+    the stored tokens, tags, parse and entities instead of running the
+    model again. Each doc is one compressed DocBin file.
+    """
+
+    def __init__(self, nlp, cache_dir: str):
+        self.nlp = nlp
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        # A different model, version or component list parses differently
+        meta = nlp.meta
+        pipeline = f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}:{','.join(nlp.pipe_names)}"
+        self._pipeline_key = hashlib.sha256(pipeline.encode('utf-8')).hexdigest()[:12]
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, self._pipeline_key, key[:2], key + '.spacy')
+
+    def load(self, text: str) -> Optional[Doc]:
+        """The cached doc for text, or None"""
+        try:
+            with open(self._path(self.key(text)), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            docs = list(DocBin().from_bytes(data).get_docs(self.nlp.vocab))
+        except Exception as e:
+            print(f"DEBUG: Discarding unreadable cached doc: {e}")
+            return None
+        return docs[0] if docs else None
+
+    def store(self, doc: Doc):
+        path = self._path(self.key(doc.text))
+        doc_bin = DocBin(store_user_data=False)
+        doc_bin.add(doc)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(doc_bin.to_bytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A full or read-only disk only costs a re-parse next time
+            print(f"DEBUG: Could not write cached doc: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def parse(self, text: str) -> Doc:
+        """Cached doc for text, parsing and storing it on a miss"""
+        doc = self.load(text)
+        note_cache_lookup(doc is not None)
+        if doc is not None:
+            self.hits += 1
+            return doc
+        self.misses += 1
+        doc = self.nlp(text)
+        self.store(doc)
+        return doc
+
+    def parse_many(self, texts: Iterable[str], batch_size: int = 64, n_process: int = 1,
+                   chunk_size: int = 1024) -> Iterator[Doc]:
+        """Docs for texts in input order; only the misses go through nlp.pipe"""
+        for chunk in _chunks(texts, chunk_size):
+            docs: List[Optional[Doc]] = [self.load(text) for text in chunk]
+            missing = [i for i, doc in enumerate(docs) if doc is None]
+            self.hits += len(chunk) - len(missing)
+            self.misses += len(missing)
+
+            parsed = self.nlp.pipe((chunk[i] for i in missing), batch_size=batch_size, n_process=n_process)
+            for i, doc in zip(missing, parsed):
+                self.store(doc)
+                docs[i] = doc
+            yield from docs
+
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
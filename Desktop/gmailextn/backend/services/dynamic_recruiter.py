@@ -1,8 +1,12 @@
-import google.generativeai as genai
 import json
 import os
 from typing import Dict, List, Any, Optional
 
+from services.boolean_generator import fallback_query
+from services.boolean_query import BooleanSyntaxError, query_from_llm, to_string
+from services.prompt_budget import field_for_prompt, job_text_for_prompt
+from services.providers import configure_gemini, gemini_model
+
 class DynamicRecruiterTool:
     def __init__(self):
         # Configure your AI model
@@ -10,28 +14,31 @@ class DynamicRecruiterTool:
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
         
-        genai.configure(api_key=api_key)
+        configure_gemini(api_key)
         # Try newer model names first, fallback to older ones
         try:
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.model = gemini_model('gemini-2.0-flash-exp')
         except:
             try:
-                self.model = genai.GenerativeModel('gemini-1.5-flash')
+                self.model = gemini_model('gemini-1.5-flash')
             except:
-                self.model = genai.GenerativeModel('gemini-pro')
+                self.model = gemini_model('gemini-pro')
 
     def analyze_job_dynamically(self, job_description: str, job_title: str = "") -> Dict[str, Any]:
         """
         Uses AI to dynamically analyze a job description and generate
         skills, context, and a boolean string.
         """
+        job_title = field_for_prompt('analyze_job_dynamically', job_title)
+        job_text = job_text_for_prompt('analyze_job_dynamically', job_description)
+        
         # Enhanced prompt for better AI understanding
         prompt = f"""
         Analyze the following job description from the perspective of an expert technical recruiter.
         Focus on identifying TECHNICAL skills, tools, technologies, and frameworks that would be relevant for candidate sourcing.
         
         Job Title: {job_title if job_title else "Not specified"}
-        Job Description: "{job_description}"
+        Job Description: "{job_text}"
 
         Think like a recruiter who needs to find candidates on LinkedIn, Indeed, or other platforms.
         Identify skills that are:
@@ -138,26 +145,29 @@ class DynamicRecruiterTool:
         if 'extractionMethod' not in response:
             response['extractionMethod'] = 'ai_dynamic_analysis'
         
+        # Parse the boolean string rather than passing it on as written; an unusable one is
+        # dropped, so callers build their own from the skills
+        response['booleanString'] = self._checked_boolean(response['booleanString'])
+        
         return True
 
+    def _checked_boolean(self, boolean_string: Any) -> str:
+        """The model's boolean string parsed, normalized and re-rendered, or "" when unusable"""
+        if not isinstance(boolean_string, str) or not boolean_string.strip():
+            return ""
+        try:
+            return to_string(query_from_llm(boolean_string))
+        except BooleanSyntaxError as e:
+            print(f"DEBUG: Dropping unusable AI boolean string ({e}): {boolean_string!r}")
+            return ""
+
     def generate_fallback_boolean(self, skills: List[str]) -> str:
         """Generate a fallback boolean search if AI fails"""
         if not skills:
             return ""
         
         # Limit to 4-5 skills
-        skills = skills[:5]
-        
-        if len(skills) == 1:
-            return f'"{skills[0]}"'
-        elif len(skills) == 2:
-            return f'"{skills[0]}" AND "{skills[1]}"'
-        elif len(skills) == 3:
-            return f'"{skills[0]}" AND "{skills[1]}" AND "{skills[2]}"'
-        elif len(skills) == 4:
-            return f'"{skills[0]}" AND ("{skills[1]}" OR "{skills[2]}") AND "{skills[3]}"'
-        else:  # 5 skills
-            return f'"{skills[0]}" AND ("{skills[1]}" OR "{skills[2]}") AND ("{skills[3]}" OR "{skills[4]}")'
+        return fallback_query(skills[:5])
 
 # Example usage and testing
 if __name__ == "__main__":
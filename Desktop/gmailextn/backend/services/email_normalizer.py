@@ -0,0 +1,281 @@
+import os
+import re
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from services import safe_regex
+
+# Set FIRKI_NORMALIZE_EMAIL=0 to analyse raw email content as before
+NORMALIZE_EMAIL = os.getenv('FIRKI_NORMALIZE_EMAIL', '1') != '0'
+
+# If less than this much text sits above the quoted history, the quote is
+# probably the job description itself ("see JD below") and is kept
+MIN_REPLY_CHARS = 200
+
+# Lines after a sign-off that still count as a signature block
+MAX_SIGNATURE_LINES = 8
+
+_HTML_TAG = re.compile(r'<\s*(?:html|body|div|p|br|span|table|blockquote|a)\b', re.IGNORECASE)
+
+_SKIP_TAGS = {'script', 'style', 'head', 'title'}
+_BLOCK_TAGS = {'p', 'div', 'br', 'li', 'ul', 'ol', 'tr', 'table', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+               'blockquote', 'section', 'article', 'header', 'footer', 'hr', 'pre'}
+_VOID_TAGS = {'br', 'hr', 'img', 'meta', 'link', 'input', 'col', 'area', 'base', 'wbr', 'source'}
+# Gmail wraps the sender's signature in this class
+_SIGNATURE_CLASSES = {'gmail_signature'}
+
+_QUOTE_MARK = '\x00>'  # prefix for lines inside <blockquote>
+
+REPLY_ATTRIBUTION = safe_regex.compile(r'^(?:On\s.{0,200}\swrote:|-{2,}\s*Original Message\s*-{2,})$',
+                                       flags=re.IGNORECASE, max_input=300)
+REPLY_ATTRIBUTION_START = safe_regex.compile(r'^On\s.{0,200}$', max_input=300)
+FORWARD_MARKER = safe_regex.compile(r'^(?:-{2,}\s*Forwarded message\s*-{2,}|Begin forwarded message:)$',
+                                    flags=re.IGNORECASE, max_input=300)
+HEADER_FIELD = safe_regex.compile(r'^(?:From|Date|Sent|Subject|To|Cc|Reply-To):\s', flags=re.IGNORECASE,
+                                  max_input=300)
+# The standard "-- " signature delimiter, trailing space included; a bare "--" is often just a separator
+SIGNATURE_DELIMITER = safe_regex.compile(r'^-- $', max_input=10)
+# Plain-text quoting: "> text", ">> text" or a bare ">" (not ">5 years Python")
+TEXT_QUOTE = safe_regex.compile(r'^>(?:[ >]|$)', max_input=10)
+SIGN_OFF = safe_regex.compile(
+    r'^(?:thanks|thank you|regards|best|best regards|kind regards|warm regards|sincerely|cheers)[,!.]?$',
+    flags=re.IGNORECASE, max_input=40)
+FOOTER = safe_regex.compile(
+    r'^(?:confidentiality notice|disclaimer|this e-?mail (?:and any|message|is confidential|may contain)'
+    r'|the information (?:contained )?in this e-?mail|to unsubscribe|unsubscribe|sent from my (?:iphone|android|mobile)'
+    r'|if you (?:are not the intended|received this (?:e-?mail|message) in error))',
+    flags=re.IGNORECASE, max_input=200)
+
+
+class _TextExtractor(HTMLParser):
+    """Incremental HTML -> text lines; drops scripts, styles and Gmail signatures"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._skip_depth = 0
+        self._quote_depth = 0
+        # Open tags, and whether each one started a skipped region
+        self._tag_stack: List[Tuple[str, bool]] = []
+        self._line: List[str] = []
+        self.lines: List[str] = []
+
+    def _flush(self):
+        text = ''.join(self._line)
+        line = text.strip()
+        self._line = []
+        # Keep the trailing space of a "-- " signature delimiter, which marks it apart from a bare "--"
+        if line == '--' and text.endswith(' '):
+            line = '-- '
+        if line:
+            self.lines.append(_QUOTE_MARK + line if self._quote_depth else line)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if tag in _VOID_TAGS:
+            return
+        classes = set((dict(attrs).get('class') or '').split())
+        skipped = tag in _SKIP_TAGS or bool(classes & _SIGNATURE_CLASSES)
+        self._tag_stack.append((tag, skipped))
+        if skipped:
+            self._skip_depth += 1
+        if tag == 'blockquote':
+            self._quote_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _BLOCK_TAGS:
+            self._flush()
+        if not any(open_tag == tag for open_tag, _ in self._tag_stack):
+            return
+        # Close everything opened since, like browsers do for unclosed <p>/<li>
+        while self._tag_stack:
+            open_tag, skipped = self._tag_stack.pop()
+            if skipped:
+                self._skip_depth -= 1
+            if open_tag == 'blockquote':
+                self._quote_depth -= 1
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        # Source newlines inside a paragraph are just wrapping. Edge spaces are kept, since
+        # a chunk boundary can split the text at a space ("building with" + " Kubernetes").
+        self._line.append((' ' if data[:1].isspace() else '') + ' '.join(data.split())
+                          + (' ' if data[-1:].isspace() and data.strip() else ''))
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def _html_lines(chunks: Iterable[str]) -> Iterator[str]:
+    parser = _TextExtractor()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.lines
+        parser.lines = []
+    parser.close()
+    yield from parser.lines
+
+
+def _text_lines(first: str, chunks: Iterator[str]) -> Iterator[str]:
+    pending = first
+    for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split('\n')
+        for line in complete:
+            yield line.rstrip('\r')
+    for line in pending.split('\n'):
+        yield line.rstrip('\r')
+
+
+def raw_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Split streamed email content into lines, converting HTML to text on the way"""
+    chunks = iter(chunks)
+    first = next(chunks, '')
+    if _HTML_TAG.search(first):
+        return _html_lines(_prepend(first, chunks))
+    return _text_lines(first, chunks)
+
+
+def _prepend(first: str, rest: Iterator[str]) -> Iterator[str]:
+    yield first
+    yield from rest
+
+
+def _unquote(line: str) -> str:
+    if line.startswith(_QUOTE_MARK):
+        return line[len(_QUOTE_MARK):]
+    return line.lstrip('> ').strip()
+
+
+def _classify_quotes(lines: Iterable[str]) -> Iterator[Tuple[str, str, bool]]:
+    """
+    (raw line, stripped line, quoted) for each line. <blockquote> text is
+    always quoted; "> " text only in a run of two or more consecutive lines,
+    so a lone "> note" stays content. The first line of a run is held back
+    until the next one shows whether the run continues.
+    """
+    held: Optional[Tuple[str, str]] = None
+    in_run = False
+    for raw in lines:
+        line = raw.strip()
+        if TEXT_QUOTE.match(line):
+            if in_run:
+                yield raw, _unquote(line), True
+            elif held is not None:
+                yield held[0], _unquote(held[1]), True
+                yield raw, _unquote(line), True
+                held = None
+                in_run = True
+            else:
+                held = (raw, line)
+            continue
+        if held is not None:
+            yield held[0], held[1], False
+            held = None
+        in_run = False
+        if line.startswith(_QUOTE_MARK):
+            yield raw, _unquote(line), True
+        else:
+            yield raw, line, False
+    if held is not None:
+        yield held[0], held[1], False
+
+
+def iter_normalized_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Stream the analysable lines of an email: markup stripped, quoted reply
+    history, forwarded-message headers, signatures and legal footers
+    dropped, runs of blank lines collapsed. Only a possible signature block
+    is ever held back, so memory stays bounded however long the thread.
+    """
+    kept_chars = 0
+    blank = True
+    in_forward_header = False
+    # Set once a short reply's quoted text is being kept as the content
+    keep_quoted = False
+    # Lines after a sign-off; dropped if the message ends soon after
+    signature: Optional[List[str]] = None
+    attribution_start: Optional[str] = None
+
+    def emit(line):
+        nonlocal kept_chars, blank
+        if not line:
+            if blank:
+                return
+            blank = True
+        else:
+            blank = False
+            kept_chars += len(line)
+        yield line
+
+    for raw, line, quoted in _classify_quotes(raw_lines(chunks)):
+        # Gmail wraps a long "On <date>, <name> <addr> wrote:" over two lines
+        if attribution_start is not None:
+            joined = f"{attribution_start} {line}"
+            if REPLY_ATTRIBUTION.match(joined):
+                line = joined
+            else:
+                yield from emit(attribution_start)
+            attribution_start = None
+        elif REPLY_ATTRIBUTION_START.match(line) and not REPLY_ATTRIBUTION.match(line) \
+                and len(line) < 120 and not line.endswith(('.', '!', '?')):
+            attribution_start = line
+            continue
+
+        # Quoted history starts. A real reply above it ends the message; a
+        # bare "see below" means the quote is the job description.
+        if REPLY_ATTRIBUTION.match(line):
+            if kept_chars >= MIN_REPLY_CHARS:
+                return
+            keep_quoted = True
+            signature = None
+            continue
+        if quoted and not keep_quoted:
+            if kept_chars >= MIN_REPLY_CHARS:
+                return
+            keep_quoted = True
+
+        if FORWARD_MARKER.match(line):
+            in_forward_header = True
+            continue
+        if in_forward_header:
+            if HEADER_FIELD.match(line) or not line:
+                continue
+            in_forward_header = False
+
+        if FOOTER.match(line):
+            return
+        if signature is not None:
+            signature.append(line)
+            if len(signature) > MAX_SIGNATURE_LINES:
+                # Too long for a signature: it was content after all
+                for held in signature:
+                    yield from emit(held)
+                signature = None
+            continue
+        # A sign-off or "-- " starts a possible signature: dropped if the message ends
+        # within MAX_SIGNATURE_LINES, kept as content otherwise
+        if SIGN_OFF.match(line) or SIGNATURE_DELIMITER.match(raw):
+            signature = [line]
+            continue
+
+        yield from emit(line)
+
+    if attribution_start is not None:
+        yield from emit(attribution_start)
+
+
+def normalize_email(content: str, chunk_size: int = 8192) -> str:
+    """Normalized text of a whole email body (see iter_normalized_lines)"""
+    def chunks():
+        return (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+
+    normalized = '\n'.join(iter_normalized_lines(chunks())).strip()
+    if normalized or not content.strip():
+        return normalized
+    # Everything looked like boilerplate; better to analyse the bare text
+    return '\n'.join(_unquote(line.strip()) for line in raw_lines(chunks())).strip()
@@ -0,0 +1,233 @@
+import hashlib
+import json
+import os
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from services.pipeline_config import PipelineConfig, PipelineRun, get_pipeline_source, merge_config
+
+# A/B experiments over pipeline configs for /api/analyze-jd. Off unless
+# FIRKI_EXPERIMENTS names an experiments file.
+EXPERIMENTS_PATH = os.getenv('FIRKI_EXPERIMENTS', '')
+
+# Upper edges of the latency histogram buckets; one more bucket counts the rest
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+UNITS = ('session', 'content')
+
+
+def content_key(text: str) -> str:
+    """Assignment key for a JD: the same text always lands in the same arm"""
+    return hashlib.sha256(' '.join(text.split()).lower().encode('utf-8')).hexdigest()
+
+
+def unit_key(unit: str, body: Mapping[str, Any], headers: Mapping[str, str]) -> str:
+    """The key a request is bucketed by; session units without a session fall back to the content"""
+    if unit == 'session':
+        session = body.get('session_id') or headers.get('X-Session-Id')
+        if session:
+            return f"session:{session}"
+    return f"content:{content_key(body.get('job_description', ''))}"
+
+
+def skill_agreement(skills: Iterable[str], reference: Iterable[str], key=str.lower) -> float:
+    """Jaccard overlap of two skill name lists, compared through `key`"""
+    a, b = {key(name) for name in skills}, {key(name) for name in reference}
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+class ArmMetrics:
+    """Counters and a fixed-bucket latency histogram for one arm, safe across request threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.llm_calls = 0
+        self.cache_lookups = 0
+        self.cache_hits = 0
+        self.quality_sum = 0.0
+        self.quality_count = 0
+
+    def record(self, latency_ms: float, run: Optional[PipelineRun] = None, quality: Optional[float] = None,
+               error: bool = False):
+        bucket = bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            self.latency_buckets[bucket] += 1
+            self.latency_sum_ms += latency_ms
+            self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+            if run is not None:
+                self.llm_calls += run.llm_calls
+                self.cache_lookups += run.cache_lookups
+                self.cache_hits += run.cache_hits
+            if quality is not None:
+                self.quality_sum += quality
+                self.quality_count += 1
+
+    def _percentile(self, buckets: List[int], q: float) -> Optional[float]:
+        """Upper edge of the bucket holding the q-th percentile (the max for the overflow bucket)"""
+        total = sum(buckets)
+        if not total:
+            return None
+        rank = q / 100 * total
+        seen = 0
+        for i, count in enumerate(buckets):
+            seen += count
+            if count and seen >= rank:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else round(self.latency_max_ms, 1)
+        return round(self.latency_max_ms, 1)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = list(self.latency_buckets)
+            n = self.requests
+            summary = {
+                'requests': n,
+                'errors': self.errors,
+                'llm_calls_per_request': round(self.llm_calls / n, 3) if n else None,
+                'cache_hit_rate': round(self.cache_hits / self.cache_lookups, 3) if self.cache_lookups else None,
+                'quality': {
+                    'ai_agreement_mean': round(self.quality_sum / self.quality_count, 3) if self.quality_count else None,
+                    'scored': self.quality_count,
+                },
+                'latency_ms': {'mean': round(self.latency_sum_ms / n, 1) if n else None},
+            }
+        latency = summary['latency_ms']
+        for q in (50, 95, 99):
+            latency[f"p{q}"] = self._percentile(buckets, q)
+        # A list, since JSON responses sort object keys
+        latency['histogram'] = [{'le': edge, 'count': count}
+                                for edge, count in zip(LATENCY_BUCKETS_MS + (None,), buckets)]
+        return summary
+
+
+class Arm:
+    """
+    One arm: a share of the traffic and its pipeline override (None: the
+    current config as is). The override is merged over the current
+    pipeline config and merged again after a reload, so arms only ever
+    differ by their overrides.
+    """
+
+    def __init__(self, experiment: str, name: str, weight: float, override: Optional[Dict[str, Any]],
+                 base: PipelineConfig):
+        self.experiment = experiment
+        self.name = name
+        self.weight = weight
+        self.override = override
+        self.metrics = ArmMetrics()
+        # (base config, override merged over it); raises ValueError for a bad override
+        self._merged = (base, self._merge(base)) if override else None
+
+    def _merge(self, base: PipelineConfig) -> PipelineConfig:
+        return PipelineConfig(merge_config(base.raw, self.override), f"{self.experiment}.{self.name}")
+
+    def config_for(self, base: PipelineConfig) -> PipelineConfig:
+        """The config this arm runs while `base` is the current pipeline config"""
+        if not self.override:
+            return base
+        merged_base, config = self._merged
+        if merged_base is not base:
+            # Validation is per key, so an override valid over one valid config is valid over any
+            config = self._merge(base)
+            self._merged = (base, config)
+        return config
+
+
+class Experiment:
+    """
+    Weighted arms with sticky assignment: a unit key hashes to a fixed
+    point in [0, 1), so the same session or JD always gets the same arm as
+    long as the arms and weights are unchanged.
+    """
+
+    def __init__(self, raw: Dict[str, Any], base: PipelineConfig):
+        self.name = raw.get('name')
+        if not self.name or not isinstance(self.name, str):
+            raise ValueError("experiments: every experiment needs a name")
+        self.unit = raw.get('unit', 'session')
+        if self.unit not in UNITS:
+            raise ValueError(f"{self.name}.unit must be one of {', '.join(UNITS)}")
+        self.active = bool(raw.get('active', True))
+        self.arms = [self._arm(arm, base) for arm in raw.get('arms') or []]
+        if len(self.arms) < 2:
+            raise ValueError(f"{self.name}: an experiment needs at least two arms")
+        if len({arm.name for arm in self.arms}) != len(self.arms):
+            raise ValueError(f"{self.name}: arm names must be unique")
+        self.total_weight = sum(arm.weight for arm in self.arms)
+
+    def _arm(self, raw: Dict[str, Any], base: PipelineConfig) -> Arm:
+        name = raw.get('name')
+        if not name:
+            raise ValueError(f"{self.name}: every arm needs a name")
+        weight = raw.get('weight', 1)
+        if not isinstance(weight, (int, float)) or weight <= 0:
+            raise ValueError(f"{self.name}.{name}.weight must be a positive number")
+        try:
+            return Arm(self.name, name, float(weight), raw.get('pipeline'), base)
+        except ValueError as e:
+            raise ValueError(f"{self.name}.{name}.pipeline: {e}") from None
+
+    def assign(self, key: str) -> Arm:
+        digest = hashlib.sha256(f"{self.name}:{key}".encode('utf-8')).hexdigest()
+        point = int(digest[:15], 16) / 16 ** 15 * self.total_weight
+        for arm in self.arms:
+            point -= arm.weight
+            if point < 0:
+                return arm
+        return self.arms[-1]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'unit': self.unit,
+            'active': self.active,
+            'arms': {arm.name: {'weight': arm.weight, 'pipeline': f"{self.name}.{arm.name}" if arm.override else 'default',
+                                **arm.metrics.summary()} for arm in self.arms},
+        }
+
+
+class ExperimentRegistry:
+    """The configured experiments; a request joins the first active one"""
+
+    def __init__(self, experiments: List[Experiment], source: str = ''):
+        self.experiments = experiments
+        self.source = source
+        names = [experiment.name for experiment in experiments]
+        if len(set(names)) != len(names):
+            raise ValueError("experiments: names must be unique")
+
+    def assign(self, body: Mapping[str, Any], headers: Mapping[str, str]) -> Optional[Arm]:
+        for experiment in self.experiments:
+            if experiment.active:
+                return experiment.assign(unit_key(experiment.unit, body, headers))
+        return None
+
+    def summary(self, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        return [experiment.summary() for experiment in self.experiments if name is None or experiment.name == name]
+
+
+def load_experiments(path: str, base: Optional[PipelineConfig] = None) -> ExperimentRegistry:
+    """Experiments from `path`; arm overrides are validated over `base` (default: the current pipeline config)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    if base is None:
+        base = get_pipeline_source().current()
+    return ExperimentRegistry([Experiment(experiment, base) for experiment in raw.get('experiments') or []], path)
+
+
+@lru_cache(maxsize=1)
+def get_experiments() -> Optional[ExperimentRegistry]:
+    """The process-wide experiments from FIRKI_EXPERIMENTS, or None when unset"""
+    if not EXPERIMENTS_PATH:
+        return None
+    registry = load_experiments(EXPERIMENTS_PATH)
+    print(f"DEBUG: Experiments loaded from {EXPERIMENTS_PATH}: "
+          f"{[(e.name, [a.name for a in e.arms]) for e in registry.experiments if e.active]}")
+    return registry
@@ -0,0 +1,100 @@
+import contextlib
+import os
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import lru_cache
+
+# cascade: the configured pipeline (services/pipeline_config.py); by default
+#          each strategy in turn, as originally
+# fanout: start the remote strategies together, run the local ones meanwhile
+# local: pattern and keyword strategies only, no network calls
+EXTRACTION_MODE = os.getenv('FIRKI_EXTRACTION_MODE', 'cascade').lower()
+
+# Threads for remote calls. A call that misses its deadline keeps its
+# thread until the provider answers, so leave headroom for stragglers.
+MAX_REMOTE_WORKERS = int(os.getenv('FIRKI_FANOUT_WORKERS', '16'))
+
+# Threads for analysing the roles of a multi-posting email side by side
+MAX_ROLE_WORKERS = int(os.getenv('FIRKI_ROLE_WORKERS', '4'))
+
+
+class FanOutPolicy:
+    """
+    When a fan-out extraction may stop waiting: as soon as the remote
+    strategies have produced `min_ai_skills` distinct skills, or after
+    `ai_deadline` seconds, whichever comes first. On the deadline the
+    local results (plus any partial AI skills) are used instead.
+    """
+
+    __slots__ = ('min_ai_skills', 'ai_deadline')
+
+    def __init__(self, min_ai_skills: int = 3, ai_deadline: float = 1.5):
+        self.min_ai_skills = min_ai_skills
+        self.ai_deadline = ai_deadline
+
+    @classmethod
+    def from_env(cls) -> 'FanOutPolicy':
+        return cls(
+            min_ai_skills=int(os.getenv('FIRKI_FANOUT_MIN_AI_SKILLS', '3')),
+            ai_deadline=float(os.getenv('FIRKI_FANOUT_AI_DEADLINE', '1.5')),
+        )
+
+    def satisfied(self, ai_skill_count: int) -> bool:
+        return ai_skill_count >= self.min_ai_skills
+
+    def __repr__(self):
+        return f"FanOutPolicy(min_ai_skills={self.min_ai_skills}, ai_deadline={self.ai_deadline})"
+
+
+class InlineExecutor(Executor):
+    """Runs each submitted call at once, in the submitting thread; the futures come back done"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class _Inline(threading.local):
+    # Class default: an unset thread-local attribute costs ~1 us per read (AttributeError)
+    executor = None
+
+
+_inline = _Inline()
+
+
+@contextlib.contextmanager
+def run_inline():
+    """
+    Inside the block, get_executor() runs this thread's strategy calls
+    itself, one after another, so all of their CPU time is this thread's
+    """
+    previous = _inline.executor
+    _inline.executor = InlineExecutor()
+    try:
+        yield
+    finally:
+        _inline.executor = previous
+
+
+def get_executor() -> Executor:
+    """Process-wide pool for remote strategy calls, created on first use (inline inside run_inline())"""
+    return _inline.executor or _remote_pool()
+
+
+@lru_cache(maxsize=1)
+def _remote_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=MAX_REMOTE_WORKERS, thread_name_prefix='firki-fanout')
+
+
+@lru_cache(maxsize=1)
+def get_role_executor() -> ThreadPoolExecutor:
+    """
+    Pool for per-role analyses. Separate from get_executor() because each
+    role submits its own remote calls there; sharing one pool could leave
+    every worker waiting on calls that have no thread to run on.
+    """
+    return ThreadPoolExecutor(max_workers=MAX_ROLE_WORKERS, thread_name_prefix='firki-role')
@@ -1,6 +1,11 @@
-import re
 from typing import Dict, List, Tuple
 
+from services import safe_regex
+from services.taxonomy import get_taxonomy
+
+# Job signals sit near the top of an email; don't scan quoted history forever
+MAX_SCAN_CHARS = 20000
+
 class JobEmailDetector:
     """
     Lightweight service to detect if an email is job-related
@@ -47,8 +52,8 @@ class JobEmailDetector:
             r'client\s+need',
             r'client\s+summary',
             r'key\s+details:',
-            r'looking\s+for\s+.*\s+developer',
-            r'looking\s+for\s+.*\s+engineer',
+            r'looking\s+for\s+.{0,120}?\s+developer',
+            r'looking\s+for\s+.{0,120}?\s+engineer',
             r'currently\s+looking\s+for',
             r'support\s+our\s+client',
             r'software\s+engineer',
@@ -61,14 +66,22 @@ class JobEmailDetector:
         self.subject_patterns = [
             r'job\s+opportunity',
             r'position\s+available',
-            r'hiring\s+.*\s+developer',
-            r'hiring\s+.*\s+engineer',
+            r'hiring\s+.{0,120}?\s+developer',
+            r'hiring\s+.{0,120}?\s+engineer',
             r'new\s+role',
             r'career\s+opportunity',
             r'job\s+opening',
             r'vacancy',
             r'position\s+opening'
         ]
+        
+        # Skills whose mention signals a tech job email (React, Node.js, AWS, ...)
+        self.taxonomy = get_taxonomy()
+        self.signal_skills = set(self.taxonomy.ids_with_flag('email_signal'))
+        
+        # Compile once; RE2-backed and input-bounded where available
+        self._job_regexes = [(p, safe_regex.compile(p, max_input=MAX_SCAN_CHARS)) for p in self.job_patterns]
+        self._subject_regexes = [(p, safe_regex.compile(p, max_input=MAX_SCAN_CHARS)) for p in self.subject_patterns]
     
     def is_job_email(self, email_content: str, subject: str = "", sender: str = "") -> Tuple[bool, float, Dict]:
         """
@@ -102,8 +115,8 @@ class JobEmailDetector:
                 details['keyword_matches'].append(keyword)
         
         # Check for job patterns
-        for pattern in self.job_patterns:
-            if re.search(pattern, email_lower):
+        for pattern, regex in self._job_regexes:
+            if regex.search(email_lower):
                 # Extra high weight for the most specific job indicators
                 if pattern in [r'minimum\s+qualifications', r'must-have', r'job\s+description', r'what\s+you\s+will\s+bring', r'pay\s+rate', r'bill\s+rate', r'role\s+details:', r'interview\s+type:']:
                     score += 15.0
@@ -112,8 +125,8 @@ class JobEmailDetector:
                 details['pattern_matches'].append(pattern)
         
         # Check subject line
-        for pattern in self.subject_patterns:
-            if re.search(pattern, subject_lower):
+        for pattern, regex in self._subject_regexes:
+            if regex.search(subject_lower):
                 score += 8.0
                 details['subject_matches'].append(pattern)
         
@@ -154,11 +167,12 @@ class JobEmailDetector:
             details['pattern_matches'].append('software_engineer')
         
         # Check for technical skills mentioned
-        tech_skills = ['react', 'python', 'java', 'javascript', 'aws', 'docker', 'kubernetes', 'sql', 'node.js', 'angular', 'vue', 'shopify', 'salesforce']
-        tech_count = sum(1 for skill in tech_skills if skill in email_lower)
+        tech_skills = [skill_id for skill_id in self.taxonomy.find_in_text(email_content[:MAX_SCAN_CHARS])
+                       if skill_id in self.signal_skills]
+        tech_count = len(tech_skills)
         if tech_count >= 2:
             score += tech_count * 2.0
-            details['keyword_matches'].extend([skill for skill in tech_skills if skill in email_lower])
+            details['keyword_matches'].extend(tech_skills)
         
         # Normalize score
         confidence = min(score / max_score, 1.0)
@@ -191,7 +205,7 @@ class JobEmailDetector:
         ]
         
         for pattern in title_patterns:
-            match = re.search(pattern, email_lower)
+            match = safe_regex.search(pattern, email_lower, max_input=MAX_SCAN_CHARS)
             if match:
                 context['job_title'] = match.group(1).strip().title()
                 break
@@ -200,11 +214,11 @@ class JobEmailDetector:
         company_patterns = [
             r'client:\s*([^\n]+)',
             r'company:\s*([^\n]+)',
-            r'client\s+summary.*?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
+            r'client\s+summary.{0,200}?([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,4})'
         ]
         
         for pattern in company_patterns:
-            match = re.search(pattern, email_lower)
+            match = safe_regex.search(pattern, email_lower, max_input=MAX_SCAN_CHARS)
             if match:
                 context['company'] = match.group(1).strip()
                 break
@@ -218,7 +232,7 @@ class JobEmailDetector:
         ]
         
         for pattern in location_patterns:
-            match = re.search(pattern, email_lower)
+            match = safe_regex.search(pattern, email_lower, max_input=MAX_SCAN_CHARS)
             if match:
                 context['location'] = match.group(1).strip() if match.groups() else pattern
                 break
@@ -231,7 +245,7 @@ class JobEmailDetector:
         ]
         
         for pattern in duration_patterns:
-            match = re.search(pattern, email_lower)
+            match = safe_regex.search(pattern, email_lower, max_input=MAX_SCAN_CHARS)
             if match:
                 context['duration'] = match.group(1).strip()
                 break
@@ -244,7 +258,7 @@ class JobEmailDetector:
         ]
         
         for pattern in rate_patterns:
-            match = re.search(pattern, email_lower)
+            match = safe_regex.search(pattern, email_lower, max_input=MAX_SCAN_CHARS)
             if match:
                 context['rate'] = match.group(1).strip()
                 break
@@ -0,0 +1,253 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from email import message_from_bytes
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from services.email_normalizer import normalize_email
+from services.skill_record import skills_to_dicts
+
+# Messages bigger than this (attachments) are cut before parsing
+MAX_MESSAGE_BYTES = int(os.getenv('FIRKI_INGEST_MAX_MESSAGE_BYTES', str(2 * 1024 * 1024)))
+
+# Where a mailbox read resumes: byte offset into an mbox, or the last .eml name
+Position = Union[int, str]
+
+
+def iter_mbox(path: str, start: int = 0) -> Iterator[Tuple[int, bytes]]:
+    """
+    (end offset, raw message) for each message of an mbox, read line by
+    line from byte offset `start`. Only one message is held at a time.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        lines = []
+        size = 0
+        previous_blank = True
+        for line in f:
+            if line.startswith(b'From ') and previous_blank and lines:
+                yield offset, b''.join(lines)
+                lines, size = [], 0
+            offset += len(line)
+            previous_blank = not line.strip()
+            if line.startswith(b'From ') and not lines:
+                continue
+            if size < MAX_MESSAGE_BYTES:
+                # mboxrd escapes body lines starting "From " as ">From "
+                if line.startswith(b'>') and line.lstrip(b'>').startswith(b'From '):
+                    line = line[1:]
+                lines.append(line)
+                size += len(line)
+        if lines:
+            yield offset, b''.join(lines)
+
+
+def iter_eml_dir(path: str, after: Optional[str] = None) -> Iterator[Tuple[str, bytes]]:
+    """(file name, raw message) for each .eml file in name order, after `after`"""
+    names = sorted(entry.name for entry in os.scandir(path) if entry.is_file() and entry.name.endswith('.eml'))
+    for name in names:
+        if after is not None and name <= after:
+            continue
+        with open(os.path.join(path, name), 'rb') as f:
+            yield name, f.read(MAX_MESSAGE_BYTES)
+
+
+def _header(msg, name: str) -> str:
+    value = msg.get(name)
+    if value is None:
+        return ''
+    try:
+        return str(make_header(decode_header(value)))
+    except (LookupError, ValueError, HeaderParseError):
+        return str(value)
+
+
+def _body_part(msg):
+    """First inline text/plain part, else first text/html part"""
+    html = None
+    for part in msg.walk():
+        if part.is_multipart() or part.get_content_maintype() != 'text':
+            continue
+        if (part.get('Content-Disposition') or '').lower().startswith('attachment'):
+            continue
+        if part.get_content_subtype() == 'plain':
+            return part
+        if part.get_content_subtype() == 'html' and html is None:
+            html = part
+    return html
+
+
+def parse_message(raw: bytes) -> Dict[str, str]:
+    """
+    Headers and body text (plain preferred, else HTML) of a raw message.
+    Uses the compat32 parser: the default policy's header objects cost
+    more than the rest of the pipeline put together.
+    """
+    msg = message_from_bytes(raw)
+    body = _body_part(msg)
+    text = ''
+    if body is not None:
+        payload = body.get_payload(decode=True) or b''
+        try:
+            text = payload.decode(body.get_content_charset() or 'utf-8', errors='replace')
+        except LookupError:
+            # Unknown charset name
+            text = payload.decode('utf-8', errors='replace')
+    return {
+        'message_id': (msg.get('Message-ID') or '').strip(),
+        'date': _header(msg, 'Date'),
+        'subject': _header(msg, 'Subject'),
+        'sender': _header(msg, 'From'),
+        'body': text,
+    }
+
+
+class MailboxIngest:
+    """
+    Streams an mbox file or a directory of .eml files through job email
+    detection and sends only job emails to skill extraction on a thread
+    pool. Results are written as JSONL in mailbox order.
+
+    Memory stays bounded: messages are read one at a time and at most
+    `workers * 2` are in flight. Every `checkpoint_every` messages the
+    output is flushed and the read position and output size are saved, so
+    an interrupted run resumes where the last checkpoint left off.
+    """
+
+    def __init__(self, source: str, output_path: str, extractor, detector, workers: int = 4,
+                 checkpoint_path: Optional[str] = None, checkpoint_every: int = 100):
+        self.source = source
+        self.output_path = output_path
+        self.extractor = extractor
+        self.detector = detector
+        self.workers = workers
+        self.checkpoint_path = checkpoint_path or output_path + '.checkpoint'
+        self.checkpoint_every = checkpoint_every
+        self.stats = {'messages': 0, 'job_emails': 0, 'errors': 0}
+
+    def _messages(self, position: Optional[Position]) -> Iterator[Tuple[Position, bytes]]:
+        if os.path.isdir(self.source):
+            return iter_eml_dir(self.source, position)
+        return iter_mbox(self.source, position or 0)
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if checkpoint.get('source') != os.path.abspath(self.source):
+            print(f"DEBUG: Ignoring checkpoint for another source: {checkpoint.get('source')}")
+            return None
+        try:
+            output_size = os.path.getsize(self.output_path)
+        except OSError:
+            output_size = -1
+        if output_size < checkpoint['output_offset']:
+            # Resuming truncates the output to the offset, which would pad it with NUL bytes
+            print(f"DEBUG: Ignoring checkpoint, {self.output_path} is missing or shorter than it records")
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, position: Position, output_offset: int):
+        checkpoint = {
+            'source': os.path.abspath(self.source),
+            'position': position,
+            'output_offset': output_offset,
+            'stats': self.stats,
+        }
+        tmp_path = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _analyze(self, position: Position, message: Dict[str, str], content: str,
+                 confidence: float) -> Dict[str, Any]:
+        """Worker: context and skills for one job email"""
+        record = {
+            'id': message['message_id'] or str(position),
+            'position': position,
+            'date': message['date'],
+            'subject': message['subject'],
+            'sender': message['sender'],
+            'confidence': confidence,
+        }
+        try:
+            context = self.detector.get_job_context(content)
+            skills = self.extractor.extract_skills(content, context.get('job_title', ''))
+            record.update({
+                'context': context,
+                'skills': skills_to_dicts(skills),
+                'extraction_method': self.extractor.last_method_used,
+            })
+        except Exception as e:
+            print(f"Error analyzing message {record['id']}: {e}")
+            record['error'] = str(e)
+        return record
+
+    def run(self, resume: bool = True) -> Dict[str, int]:
+        checkpoint = self.load_checkpoint() if resume else None
+        position = None
+        if checkpoint:
+            position = checkpoint['position']
+            self.stats.update(checkpoint.get('stats', {}))
+            # Drop lines written after the checkpoint; they are redone
+            with open(self.output_path, 'a+b') as f:
+                f.truncate(checkpoint['output_offset'])
+            print(f"DEBUG: Resuming {self.source} from {position!r} ({self.stats['messages']} messages done)")
+        mode = 'ab' if checkpoint else 'wb'
+
+        pending = deque()
+        since_checkpoint = 0
+        with open(self.output_path, mode) as out, \
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='firki-ingest') as executor:
+
+            def write_oldest():
+                nonlocal position, since_checkpoint
+                position, future = pending.popleft()
+                if future is not None:
+                    record = future.result()
+                    if 'error' in record:
+                        self.stats['errors'] += 1
+                    else:
+                        self.stats['job_emails'] += 1
+                    out.write(json.dumps(record).encode('utf-8') + b'\n')
+                self.stats['messages'] += 1
+                since_checkpoint += 1
+                if since_checkpoint >= self.checkpoint_every:
+                    out.flush()
+                    os.fsync(out.fileno())
+                    self._save_checkpoint(position, out.tell())
+                    since_checkpoint = 0
+
+            for message_position, raw in self._messages(position):
+                future = None
+                try:
+                    message = parse_message(raw)
+                    content = normalize_email(message['body'])
+                    is_job, confidence, _ = self.detector.is_job_email(content, message['subject'], message['sender'])
+                    if is_job:
+                        future = executor.submit(self._analyze, message_position, message, content, confidence)
+                except Exception as e:
+                    print(f"Error reading message at {message_position!r}: {e}")
+                    # Written out like any failed analysis, so nothing is dropped silently
+                    future = Future()
+                    future.set_result({'id': str(message_position), 'position': message_position, 'error': str(e)})
+                pending.append((message_position, future))
+
+                # Results leave in mailbox order; never more than 2x workers queued
+                while pending and (len(pending) >= self.workers * 2
+                                   or pending[0][1] is None or pending[0][1].done()):
+                    write_oldest()
+
+            while pending:
+                write_oldest()
+            out.flush()
+            if position is not None:
+                self._save_checkpoint(position, out.tell())
+
+        return self.stats
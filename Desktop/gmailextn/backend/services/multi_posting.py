@@ -0,0 +1,216 @@
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from services import safe_regex
+from services.fanout import get_role_executor
+from services.pipeline_config import active_run, run_pinned
+from services.sectionizer import LOGISTICS_FIELD, heading_label
+
+# Agency emails rarely list more roles than this; the rest are not analysed
+MAX_POSTINGS = int(os.getenv('FIRKI_MAX_POSTINGS', '10'))
+
+# "Position: Java Developer", "Role 2 - Data Engineer", "3) Job Title: SRE"
+ROLE_HEADER = safe_regex.compile(
+    r'^(?:#?\d+[.)]\s*)?(?P<keyword>position|role|job title|title|opening)\s*(?:#?\d+)?\s*[:\-–]\s*(?P<title>\S.*)$',
+    flags=re.IGNORECASE,
+    max_input=200,
+)
+
+MAX_TITLE_CHARS = 80
+# Content lines (requirements, bullets) a role needs of its own to count as a separate posting
+MIN_BODY_LINES = 2
+_LIST_MARKERS = ('-', '*', '•', '–', '>')
+
+
+class Posting:
+    """One role found in a (possibly multi-role) email"""
+
+    __slots__ = ('title', 'text')
+
+    def __init__(self, title: str, text: str):
+        self.title = title
+        self.text = text
+
+    def __repr__(self):
+        return f"Posting(title={self.title!r}, chars={len(self.text)})"
+
+
+def _role_header(line: str) -> Optional[Tuple[str, str]]:
+    """(keyword, title) of a "Position: <title>" style line"""
+    match = ROLE_HEADER.match(line)
+    if not match or heading_label(line):
+        return None
+    return match.group('keyword').lower(), match.group('title').strip()
+
+
+def _is_content(line: str) -> bool:
+    """A line that says something about the job (not a header or field)"""
+    return not (_role_header(line) or heading_label(line) or LOGISTICS_FIELD.match(line))
+
+
+def _looks_like_title(line: str) -> bool:
+    return (len(line) <= MAX_TITLE_CHARS and not line.startswith(_LIST_MARKERS) and not line.endswith('.')
+            and not heading_label(line) and not LOGISTICS_FIELD.match(line))
+
+
+def _distinct(titles: List[str]) -> bool:
+    keys = [title.casefold() for title in titles]
+    return all(keys) and len(set(keys)) == len(keys)
+
+
+def _header_starts(lines: List[str]) -> List[int]:
+    """
+    Lines opening a role via an explicit header: the most frequent header
+    keyword, repeated with a different title each time. Other keywords are
+    fields of the current role ("Title: Java Developer" followed by
+    "Position: must be US citizen").
+    """
+    by_keyword: Dict[str, List[Tuple[int, str]]] = {}
+    for i, line in enumerate(lines):
+        header = _role_header(line)
+        if header:
+            by_keyword.setdefault(header[0], []).append((i, header[1]))
+    if not by_keyword:
+        return []
+    headers = max(by_keyword.values(), key=len)
+    if len(headers) < 2 or not _distinct([title for _, title in headers]):
+        return []
+    return [i for i, _ in headers]
+
+
+def _structure_starts(lines: List[str]) -> List[int]:
+    """
+    Roles without explicit headers: the document's first section heading
+    recurs once per role, each time under a different title line. Each
+    role starts at its title. A heading that recurs without a title above
+    it (a second "Requirements:" in one JD) is not a new role.
+    """
+    headings = [(i, line.lower()) for i, line in enumerate(lines) if heading_label(line)]
+    if not headings:
+        return []
+    first = headings[0][1]
+    starts = []
+    for i, heading in headings:
+        if heading != first:
+            continue
+        if i == 0 or not _looks_like_title(lines[i - 1]) or (starts and i - 1 <= starts[-1]):
+            return []
+        starts.append(i - 1)
+    if not _distinct([lines[i] for i in starts]):
+        return []
+    return starts
+
+
+def _has_body(role_lines: List[str]) -> bool:
+    """Whether a role (title line first) has requirements of its own, not just fields"""
+    return sum(1 for line in role_lines[1:] if _is_content(line)) >= MIN_BODY_LINES
+
+
+def split_postings(text: str) -> List[Posting]:
+    """
+    Split an email listing several open roles into one Posting per role.
+    Role boundaries are a Position:/Role:/Job Title: header repeated with
+    different titles, or else a repeated section structure under different
+    titles; every role needs a requirements body of its own. Field lines
+    before the first role (Client:, Location:) are shared and copied into
+    every role. Anything else comes back as a single untitled Posting.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+    starts = _header_starts(lines)
+    titled_by_header = len(starts) >= 2
+    if not titled_by_header:
+        starts = _structure_starts(lines)
+    if len(starts) < 2 or not all(_has_body(lines[start:end])
+                                  for start, end in zip(starts, starts[1:] + [len(lines)])):
+        return [Posting('', text)]
+
+    if len(starts) > MAX_POSTINGS:
+        print(f"DEBUG: {len(starts)} postings found, analysing the first {MAX_POSTINGS}")
+        starts = starts[:MAX_POSTINGS]
+
+    shared = [line for line in lines[:starts[0]] if LOGISTICS_FIELD.match(line)]
+    postings = []
+    for n, start in enumerate(starts):
+        end = starts[n + 1] if n + 1 < len(starts) else len(lines)
+        role_lines = lines[start:end]
+        if titled_by_header:
+            title = _role_header(role_lines[0])[1]
+        else:
+            title = role_lines[0]
+        postings.append(Posting(title, '\n'.join(role_lines[:1] + shared + role_lines[1:])))
+
+    print(f"DEBUG: Split email into {len(postings)} postings: {[p.title for p in postings]}")
+    return postings
+
+
+def analyze_posting(job_description: str, job_title: str, extractor, boolean_generator) -> Dict[str, Any]:
+    """
+    Skills, dynamic analysis and boolean string for one posting, under the
+    caller's pinned pipeline config. The same pipeline serves single- and
+    multi-role requests.
+    """
+    extract_start = time.perf_counter()
+    skills = extractor.extract_skills(job_description, job_title)
+    extract_ms = (time.perf_counter() - extract_start) * 1000
+    # Same thread as the extraction, so this is this posting's method
+    extraction_method = extractor.last_method_used
+    ai_context = ""
+    ai_boolean = ""
+    ai_questions = []
+    ai_skills = None
+
+    try:
+        from services.dynamic_recruiter import DynamicRecruiterTool
+        dynamic_tool = DynamicRecruiterTool()
+        ai_result = dynamic_tool.analyze_job_dynamically(job_description, job_title)
+
+        if ai_result.get('extractionMethod') == 'ai_dynamic_analysis':
+            ai_context = ai_result.get('keySkillContext', '')
+            ai_boolean = ai_result.get('booleanString', '')
+            ai_questions = ai_result.get('aiQuestions', [])
+            ai_skills = [skill.get('name', '') for skill in ai_result.get('skills', [])]
+    except Exception as e:
+        print(f"Dynamic recruiter tool failed: {e}")
+
+    boolean_search = ai_boolean or boolean_generator.generate_boolean_search(skills, job_title)
+
+    return {
+        'job_title': job_title,
+        'text': job_description,
+        'skills': skills,
+        'extract_ms': extract_ms,
+        'extraction_method': extraction_method,
+        'ai_context': ai_context,
+        'ai_boolean': ai_boolean,
+        'ai_questions': ai_questions,
+        'ai_skills': ai_skills,
+        'boolean_search': boolean_search,
+    }
+
+
+def _analyze_role(posting: Posting, extractor, boolean_generator, detector) -> Dict[str, Any]:
+    context = detector.get_job_context(posting.text)
+    job_title = posting.title or context.get('job_title', '')
+    try:
+        result = analyze_posting(posting.text, job_title, extractor, boolean_generator)
+    except Exception as e:
+        print(f"Error analyzing posting '{job_title}': {e}")
+        return {'job_title': job_title, 'context': context, 'error': str(e)}
+    result['context'] = context
+    return result
+
+
+def analyze_postings(postings: List[Posting], extractor, boolean_generator, detector) -> List[Dict[str, Any]]:
+    """
+    analyze_posting() for each role plus its context, concurrently, in
+    posting order. Roles run under the caller's pinned PipelineRun; a
+    failed role is {'job_title', 'context', 'error'}.
+    """
+    executor = get_role_executor()
+    run = active_run()
+    futures = [executor.submit(run_pinned, run, _analyze_role, posting, extractor, boolean_generator, detector)
+               for posting in postings]
+    return [future.result() for future in futures]
@@ -0,0 +1,281 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from services.skill_record import SkillSource
+
+# The extraction pipeline (stage order, parallel groups, early exits,
+# timeouts), per-source confidences and result limits. The shipped file
+# reproduces the original cascade; FIRKI_PIPELINE_CONFIG names a file whose
+# sections are merged over it.
+DEFAULT_PIPELINE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'pipeline.json')
+PIPELINE_CONFIG_PATH = os.getenv('FIRKI_PIPELINE_CONFIG', '')
+# Seconds between checks of the config file for changes
+PIPELINE_RELOAD_INTERVAL = float(os.getenv('FIRKI_PIPELINE_RELOAD_INTERVAL', '2'))
+
+REMOTE_STRATEGIES = ('ai_dynamic_analysis', 'gemini_ai', 'openai_ai')
+LOCAL_STRATEGIES = ('intelligent_patterns', 'basic_extraction', 'nlp')
+BOOLEAN_STRATEGIES = ('gemini', 'openai', 'rules')
+LIMITS = ('final_skills', 'ai_skills', 'boolean_skills')
+
+
+class Stage:
+    """
+    One pipeline step: its strategies run together (remote ones on the
+    fan-out pool), and the pipeline returns early once the skills found so
+    far reach min_skills. Remote calls still pending after `timeout`
+    seconds are dropped.
+    """
+
+    __slots__ = ('strategies', 'min_skills', 'timeout')
+
+    def __init__(self, strategies: Tuple[str, ...], min_skills: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        self.strategies = strategies
+        self.min_skills = min_skills
+        self.timeout = timeout
+
+    @property
+    def remote(self) -> Tuple[str, ...]:
+        return tuple(s for s in self.strategies if s in REMOTE_STRATEGIES)
+
+    @property
+    def local(self) -> Tuple[str, ...]:
+        return tuple(s for s in self.strategies if s not in REMOTE_STRATEGIES)
+
+    def __repr__(self):
+        return f"Stage({'+'.join(self.strategies)}, min_skills={self.min_skills}, timeout={self.timeout})"
+
+
+class PipelineConfig:
+    """A validated pipeline config. Never mutated; a reload builds a new one."""
+
+    def __init__(self, raw: Dict[str, Any], source: str = ''):
+        self.source = source
+        # What it was built from, for configs merged over this one (experiment arms)
+        self.raw = raw
+        extraction = raw.get('extraction') or {}
+        self.stages = tuple(self._stage(i, stage) for i, stage in enumerate(extraction.get('stages') or []))
+        if not self.stages:
+            raise ValueError("extraction.stages must list at least one stage")
+        # Past this many seconds, stages with remote strategies are skipped
+        self.deadline = _optional_number(extraction.get('deadline'), 'extraction.deadline')
+
+        self.confidence = {}
+        for label, value in (raw.get('confidence') or {}).items():
+            if label.upper() not in SkillSource.__members__:
+                raise ValueError(f"confidence: unknown skill source {label!r}")
+            if not isinstance(value, (int, float)) or not 0 <= value <= 1:
+                raise ValueError(f"confidence.{label} must be a number between 0 and 1")
+            self.confidence[label] = float(value)
+
+        limits = raw.get('limits') or {}
+        self.limits = {}
+        for name in LIMITS:
+            value = limits.get(name)
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"limits.{name} must be a positive integer")
+            self.limits[name] = value
+
+        self.boolean_strategies = tuple((raw.get('boolean') or {}).get('strategies') or ())
+        unknown = [s for s in self.boolean_strategies if s not in BOOLEAN_STRATEGIES]
+        if unknown or not self.boolean_strategies:
+            raise ValueError(f"boolean.strategies must be a non-empty list of {', '.join(BOOLEAN_STRATEGIES)}")
+
+    @staticmethod
+    def _stage(index: int, raw: Dict[str, Any]) -> Stage:
+        where = f"extraction.stages[{index}]"
+        strategies = tuple(raw.get('strategies') or ())
+        if not strategies:
+            raise ValueError(f"{where}.strategies must not be empty")
+        unknown = [s for s in strategies if s not in REMOTE_STRATEGIES + LOCAL_STRATEGIES]
+        if unknown:
+            raise ValueError(f"{where}: unknown strategies {unknown}")
+        min_skills = (raw.get('exit_when') or {}).get('min_skills')
+        if min_skills is not None and (not isinstance(min_skills, int) or min_skills < 1):
+            raise ValueError(f"{where}.exit_when.min_skills must be a positive integer")
+        return Stage(strategies, min_skills, _optional_number(raw.get('timeout'), f"{where}.timeout"))
+
+    def confidence_for(self, source: SkillSource) -> float:
+        return self.confidence[source.label]
+
+
+def _optional_number(value, where: str) -> Optional[float]:
+    if value is None:
+        return None
+    if not isinstance(value, (int, float)) or value <= 0:
+        raise ValueError(f"{where} must be a positive number of seconds")
+    return float(value)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def merge_config(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Sections of `override` merged key by key over `base` (lists such as stages are replaced)"""
+    merged = dict(base)
+    for section, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(section), dict):
+            merged[section] = {**base[section], **value}
+        else:
+            merged[section] = value
+    return merged
+
+
+def load_pipeline_raw(path: str = '') -> Dict[str, Any]:
+    """The shipped config as a dict, with the file at `path` (if any) merged over it"""
+    raw = _read_json(DEFAULT_PIPELINE_PATH)
+    if path:
+        raw = merge_config(raw, _read_json(path))
+    return raw
+
+
+def load_pipeline_config(path: str = '') -> PipelineConfig:
+    return PipelineConfig(load_pipeline_raw(path), path or DEFAULT_PIPELINE_PATH)
+
+
+class PipelineConfigSource:
+    """
+    The current PipelineConfig. A background thread checks its file every
+    reload_interval seconds and, when it changed, builds and validates a
+    complete new config before swapping it in with one assignment; readers
+    see either the old or the new config, never a mix. An invalid file is
+    reported and the previous config kept.
+    """
+
+    def __init__(self, path: str = '', reload_interval: float = PIPELINE_RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._watched = path or DEFAULT_PIPELINE_PATH
+        self._stamp = self._file_stamp()
+        self._config = load_pipeline_config(path)
+        self.reloads = 0
+        if reload_interval > 0:
+            watcher = threading.Thread(target=self._watch, name='pipeline-config', daemon=True)
+            watcher.start()
+
+    def current(self) -> PipelineConfig:
+        return self._config
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self._watched)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _watch(self):
+        while True:
+            time.sleep(self.reload_interval)
+            self.check()
+
+    def check(self) -> bool:
+        """Reload if the file changed; True when a new config was swapped in"""
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        try:
+            config = load_pipeline_config(self.path)
+        except (OSError, ValueError) as e:
+            print(f"DEBUG: Pipeline config {self._watched} not reloaded, keeping the previous one: {e}")
+            return False
+        self._config = config
+        self.reloads += 1
+        print(f"DEBUG: Pipeline config reloaded from {self._watched}: {list(config.stages)}")
+        return True
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_source() -> PipelineConfigSource:
+    """Process-wide config source for FIRKI_PIPELINE_CONFIG"""
+    return PipelineConfigSource(PIPELINE_CONFIG_PATH)
+
+
+class PipelineRun:
+    """
+    The config one extraction or request runs with, plus what it cost:
+    real provider calls made (not cassette replays) and lookups/hits in
+    the caches the run's own work goes through, the doc cache and the
+    boolean query cache (for experiment metrics). Shared by the request
+    thread and the pool tasks it submits.
+    """
+
+    __slots__ = ('config', 'llm_calls', 'cache_lookups', 'cache_hits', '_lock')
+
+    def __init__(self, config: PipelineConfig):
+        self.config = config
+        self.llm_calls = 0
+        self.cache_lookups = 0
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+
+    def note_llm_call(self):
+        with self._lock:
+            self.llm_calls += 1
+
+    def note_cache_lookup(self, hit: bool):
+        with self._lock:
+            self.cache_lookups += 1
+            self.cache_hits += hit
+
+
+class _Pinned(threading.local):
+    # Class default: an unset thread-local attribute costs ~1 us per read (AttributeError)
+    run = None
+
+
+_pinned = _Pinned()
+
+
+def active_config() -> PipelineConfig:
+    """The config pinned to this thread by pinned(), else the current one"""
+    run = _pinned.run
+    return run.config if run is not None else get_pipeline_source().current()
+
+
+def active_run() -> Optional[PipelineRun]:
+    """The PipelineRun pinned to this thread, if any"""
+    return _pinned.run
+
+
+@contextlib.contextmanager
+def pinned(config: PipelineConfig, run: Optional[PipelineRun] = None):
+    """
+    Use `config` for everything this thread does inside the block. Nested
+    blocks with the same config keep the outer PipelineRun and its counters.
+    """
+    previous = _pinned.run
+    if run is None:
+        run = previous if previous is not None and previous.config is config else PipelineRun(config)
+    _pinned.run = run
+    try:
+        yield config
+    finally:
+        _pinned.run = previous
+
+
+def run_pinned(run: Optional[PipelineRun], fn, *args):
+    """fn(*args) with `run` pinned (if any); for work handed to other threads"""
+    if run is None:
+        return fn(*args)
+    with pinned(run.config, run):
+        return fn(*args)
+
+
+def note_llm_call():
+    run = _pinned.run
+    if run is not None:
+        run.note_llm_call()
+
+
+def note_cache_lookup(hit: bool):
+    run = _pinned.run
+    if run is not None:
+        run.note_cache_lookup(hit)
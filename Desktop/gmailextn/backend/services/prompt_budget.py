@@ -0,0 +1,107 @@
+import os
+from typing import List, Optional, Tuple
+
+from services import safe_regex
+from services.sectionizer import (LOGISTICS, OVERVIEW, REQUIREMENTS, RESPONSIBILITIES, ROLE_DETAILS, TECH_STACK,
+                                  sectionize)
+from services.taxonomy import get_taxonomy
+from services.tokens import estimate_tokens
+
+# Token budget for the job description embedded in an extraction/analysis prompt
+JD_TOKEN_BUDGET = int(os.getenv('FIRKI_PROMPT_JD_TOKENS', '1500'))
+# Token budget for short fields (job title, skill names) in other prompts
+FIELD_TOKEN_BUDGET = int(os.getenv('FIRKI_PROMPT_FIELD_TOKENS', '200'))
+
+# How much a line is worth keeping, by section
+SECTION_VALUE = {
+    TECH_STACK: 5,
+    REQUIREMENTS: 4,
+    ROLE_DETAILS: 3,
+    RESPONSIBILITIES: 2,
+    OVERVIEW: 1,
+    LOGISTICS: 0,
+}
+TECH_MENTION_VALUE = 2
+BULLET_VALUE = 1
+
+_BULLET = safe_regex.compile(r'^(?:[•*\-–]|\d+[.)])\s', max_input=10)
+
+
+def _line_value(label: str, line: str) -> int:
+    value = SECTION_VALUE.get(label, 1)
+    if get_taxonomy().find_in_text(line):
+        value += TECH_MENTION_VALUE
+    if _BULLET.match(line):
+        value += BULLET_VALUE
+    return value
+
+
+def _truncate(text: str, budget: int) -> str:
+    """Leading words of text that fit in budget tokens"""
+    words = []
+    used = 0
+    for word in text.split():
+        cost = estimate_tokens(word)
+        if used + cost > budget:
+            break
+        words.append(word)
+        used += cost
+    return ' '.join(words)
+
+
+def compact_lines(lines: List[Tuple[str, str]], budget: int) -> str:
+    """
+    Keep the most valuable (label, line) pairs that fit in budget tokens,
+    in their original order. Ties go to the earlier line.
+    """
+    costs = [estimate_tokens(line) + 1 for _, line in lines]
+    if sum(costs) <= budget:
+        return '\n'.join(line for _, line in lines)
+
+    ranked = sorted(range(len(lines)), key=lambda i: (-_line_value(*lines[i]), i))
+    keep = set()
+    used = 0
+    for i in ranked:
+        if used + costs[i] <= budget:
+            keep.add(i)
+            used += costs[i]
+    if not keep and lines:
+        # A single line longer than the whole budget: keep its start
+        return _truncate(lines[ranked[0]][1], budget)
+    return '\n'.join(line for i, (_, line) in enumerate(lines) if i in keep)
+
+
+def job_text_for_prompt(prompt_name: str, job_description: str, budget: Optional[int] = None) -> str:
+    """
+    The part of a JD worth sending to an LLM. A JD within the prompt's
+    token budget is sent unchanged; a longer one is cut to its content
+    sections, compacted to the budget. Logs the compaction ratio.
+    """
+    budget = budget or JD_TOKEN_BUDGET
+    original_tokens = estimate_tokens(job_description)
+    if original_tokens <= budget:
+        return job_description
+
+    sections = sectionize(job_description)
+    wanted = set(SECTION_VALUE) - {LOGISTICS, OVERVIEW}
+    if not sections.has_content_sections():
+        wanted.add(OVERVIEW)
+    lines = [(label, line) for label, line in sections.iter_lines() if label in wanted]
+
+    text = compact_lines(lines, budget)
+
+    prompt_tokens = estimate_tokens(text)
+    ratio = prompt_tokens / original_tokens
+    print(f"DEBUG: Prompt '{prompt_name}' JD compacted {original_tokens} -> {prompt_tokens} tokens "
+          f"({ratio:.0%}, budget {budget})")
+    return text
+
+
+def field_for_prompt(prompt_name: str, value: str, budget: Optional[int] = None) -> str:
+    """A short prompt field (title, skill list) cut to its token budget"""
+    budget = budget or FIELD_TOKEN_BUDGET
+    if estimate_tokens(value) <= budget:
+        return value
+    truncated = _truncate(value, budget)
+    print(f"DEBUG: Prompt '{prompt_name}' field truncated {estimate_tokens(value)} -> {estimate_tokens(truncated)} tokens")
+    return truncated
@@ -0,0 +1,60 @@
+import os
+
+import google.generativeai as genai
+import openai
+
+from services.cassette import CassetteGeminiModel, chat_completion_response, get_cassette
+from services.pipeline_config import note_llm_call
+
+# Send provider calls somewhere other than the real APIs, e.g. the stub
+# server in benchmarks/stub_llm_server.py. Unset means the real endpoints.
+GEMINI_ENDPOINT = os.getenv('FIRKI_GEMINI_ENDPOINT', '')
+OPENAI_BASE_URL = os.getenv('FIRKI_OPENAI_BASE_URL', '')
+
+
+def configure_gemini(api_key):
+    """genai.configure(), over REST to FIRKI_GEMINI_ENDPOINT when set"""
+    if GEMINI_ENDPOINT:
+        genai.configure(api_key=api_key, transport='rest', client_options={'api_endpoint': GEMINI_ENDPOINT})
+    else:
+        genai.configure(api_key=api_key)
+
+
+def configure_openai(api_key):
+    openai.api_key = api_key
+    if OPENAI_BASE_URL:
+        # api_base for the 0.x client, base_url for 1.x
+        openai.api_base = OPENAI_BASE_URL
+        openai.base_url = OPENAI_BASE_URL
+
+
+class CountedGeminiModel:
+    """A GenerativeModel whose generate_content() calls count toward the active PipelineRun; wraps the real model only"""
+
+    def __init__(self, model):
+        self._model = model
+
+    def generate_content(self, prompt):
+        note_llm_call()
+        return self._model.generate_content(prompt)
+
+
+def gemini_model(model_name):
+    """genai.GenerativeModel, recorded or replayed when FIRKI_CASSETTE is set; replays are not counted as calls"""
+    model = CountedGeminiModel(genai.GenerativeModel(model_name))
+    cassette = get_cassette()
+    return CassetteGeminiModel(model, model_name, cassette) if cassette else model
+
+
+def chat_completion(model, messages, **kwargs):
+    """openai.ChatCompletion.create, recorded or replayed when FIRKI_CASSETTE is set; replays are not counted as calls"""
+    def create():
+        note_llm_call()
+        return openai.ChatCompletion.create(model=model, messages=messages, **kwargs)
+
+    cassette = get_cassette()
+    if not cassette:
+        return create()
+    prompt = '\n'.join(message['content'] for message in messages)
+    content = cassette.call('openai', model, prompt, lambda: create().choices[0].message.content)
+    return chat_completion_response(content)
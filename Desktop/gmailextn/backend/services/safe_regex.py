@@ -0,0 +1,89 @@
+import os
+import re
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
+
+# Optional linear-time backend (pip install google-re2). RE2 never backtracks,
+# so a long forwarded thread can't blow up a scan; `re` is used when it's
+# missing or when a pattern needs a feature RE2 doesn't support.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# auto: RE2 when installed, re otherwise. Set FIRKI_REGEX_ENGINE=re to opt out.
+REGEX_ENGINE = os.getenv('FIRKI_REGEX_ENGINE', 'auto').lower()
+
+# Characters of input a single pattern is allowed to scan
+DEFAULT_MAX_INPUT = int(os.getenv('FIRKI_REGEX_MAX_INPUT', '50000'))
+
+_INLINE_FLAGS = [
+    (re.IGNORECASE, 'i'),
+    (re.MULTILINE, 'm'),
+    (re.DOTALL, 's'),
+]
+
+
+def re2_available() -> bool:
+    """Whether patterns will be compiled with the RE2 backend"""
+    return re2 is not None and REGEX_ENGINE != 're'
+
+
+class BoundedPattern:
+    """
+    A compiled pattern that only ever scans the first `max_input`
+    characters of its input, backed by RE2 when available.
+    """
+
+    __slots__ = ('pattern', 'flags', 'max_input', 'engine', '_compiled')
+
+    def __init__(self, pattern: str, flags: int = 0, max_input: Optional[int] = None):
+        self.pattern = pattern
+        self.flags = flags
+        self.max_input = max_input or DEFAULT_MAX_INPUT
+        self._compiled = None
+        self.engine = 're'
+
+        if re2_available():
+            inline = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+            try:
+                self._compiled = re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+                self.engine = 're2'
+            except Exception:
+                # Lookarounds, backreferences, etc. - fall back to re
+                self._compiled = None
+
+        if self._compiled is None:
+            self._compiled = re.compile(pattern, flags)
+
+    def _bound(self, text: str) -> str:
+        return text if len(text) <= self.max_input else text[:self.max_input]
+
+    def search(self, text: str):
+        return self._compiled.search(self._bound(text))
+
+    def match(self, text: str):
+        return self._compiled.match(self._bound(text))
+
+    def findall(self, text: str) -> List[Any]:
+        return self._compiled.findall(self._bound(text))
+
+    def finditer(self, text: str) -> Iterator:
+        return self._compiled.finditer(self._bound(text))
+
+    def __repr__(self):
+        return f"BoundedPattern({self.pattern!r}, engine={self.engine!r}, max_input={self.max_input})"
+
+
+@lru_cache(maxsize=512)
+def compile(pattern: str, flags: int = 0, max_input: Optional[int] = None) -> BoundedPattern:
+    """Compile (and cache) a bounded pattern"""
+    return BoundedPattern(pattern, flags, max_input)
+
+
+def search(pattern: str, text: str, flags: int = 0, max_input: Optional[int] = None):
+    return compile(pattern, flags, max_input).search(text)
+
+
+def findall(pattern: str, text: str, flags: int = 0, max_input: Optional[int] = None) -> List[Any]:
+    return compile(pattern, flags, max_input).findall(text)
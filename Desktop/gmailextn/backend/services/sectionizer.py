@@ -0,0 +1,134 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from services import safe_regex
+
+TECH_STACK = 'tech_stack'
+REQUIREMENTS = 'requirements'
+RESPONSIBILITIES = 'responsibilities'
+ROLE_DETAILS = 'role_details'
+LOGISTICS = 'logistics'
+# Text before the first heading (titles, client blurbs)
+OVERVIEW = 'overview'
+
+# Sections that describe the work itself, i.e. where skills are
+CONTENT_SECTIONS = (TECH_STACK, REQUIREMENTS, RESPONSIBILITIES, ROLE_DETAILS)
+# What pattern scans read by default: everything but logistics. The overview
+# often holds the only skill list ("Looking for a React/Node dev ...").
+SCAN_SECTIONS = CONTENT_SECTIONS + (OVERVIEW,)
+SECTION_ORDER = CONTENT_SECTIONS + (LOGISTICS, OVERVIEW)
+
+# Heading keywords, checked in order (first match wins)
+HEADING_KEYWORDS: List[Tuple[str, Tuple[str, ...]]] = [
+    (TECH_STACK, ('tech stack', 'technology stack', 'technologies', 'tech environment', 'tools', 'stack')),
+    (RESPONSIBILITIES, ('responsibilit', "what you'll do", 'what you will do', 'duties', 'day to day', 'day-to-day')),
+    (REQUIREMENTS, ('requirement', 'qualification', 'must have', 'nice to have', 'what you bring',
+                    "what we're looking for", 'skills', 'preferred', 'experience')),
+    (ROLE_DETAILS, ('role details', 'about the role', 'the role', 'position details', 'job details',
+                    'role summary', 'job summary')),
+    (LOGISTICS, ('logistics', 'interview', 'compensation', 'benefits', 'location', 'schedule', 'rate')),
+]
+
+# "Location: Remote", "Bill Rate: 60/hr", "Interview Process - Prescreen, ..."
+# Logistics lines are pulled out wherever they appear.
+LOGISTICS_FIELD = safe_regex.compile(
+    r'^(?:location|duration|bill rate|pay rate|rate|salary|compensation|(?:part[- ]?time |full[- ]?time )?hours'
+    r'|interview[a-z ]{0,20}|start date|end date|client|contract(?: length)?|work authorization|visa'
+    r'|position|job id|req(?:uisition)?(?: id| #)?)\s*[:\-–]',
+    flags=re.IGNORECASE,
+    max_input=200,
+)
+
+MAX_HEADING_CHARS = 60
+# Bullet and numbered list items ("- AWS", "* CI/CD", "2) SQL") are content, never headings
+LIST_MARKER = re.compile(r'^(?:[-*•·▪◦►–—+]|\d{1,2}[.)])\s*')
+
+
+def heading_label(line: str) -> Optional[str]:
+    """Section label if the line is a heading ("Requirements:", "RESPONSIBILITIES"), else None"""
+    if len(line) > MAX_HEADING_CHARS or ',' in line or LIST_MARKER.match(line):
+        return None
+    colon = line.endswith(':')
+    if colon:
+        title = line[:-1]
+    elif line.isupper() and len(line.split()) <= 5:
+        title = line
+    else:
+        return None
+
+    title = title.lower()
+    for label, keywords in HEADING_KEYWORDS:
+        if any(keyword in title for keyword in keywords):
+            return label
+    if not colon:
+        # An all-caps line without a heading keyword ("AWS", "SQL SERVER") is content
+        return None
+    # "Who you are:", "Nice extras:" - still about the job
+    return ROLE_DETAILS
+
+
+class Sections:
+    """
+    A job description split into labeled sections. Lines keep document
+    order; `text()` joins the ones in the sections a strategy cares about.
+    """
+
+    __slots__ = ('source', '_lines', '_labels')
+
+    def __init__(self, source: str, lines: List[Tuple[str, str]]):
+        self.source = source
+        self._lines = lines
+        self._labels = {label for label, _ in lines}
+
+    def labels(self) -> List[str]:
+        return [label for label in SECTION_ORDER if label in self._labels]
+
+    def iter_lines(self) -> Iterator[Tuple[str, str]]:
+        """(label, line) pairs in document order"""
+        return iter(self._lines)
+
+    def get(self, label: str) -> str:
+        return self.text((label,))
+
+    def has_content_sections(self) -> bool:
+        return any(label in self._labels for label in CONTENT_SECTIONS)
+
+    def text(self, labels: Iterable[str] = SCAN_SECTIONS) -> str:
+        """
+        Text of the given sections (by default everything but logistics).
+        Unstructured JDs (no recognised content headings) fall back to the
+        overview so nothing is lost.
+        """
+        wanted = set(labels)
+        if not self.has_content_sections():
+            wanted.add(OVERVIEW)
+        return '\n'.join(line for label, line in self._lines if label in wanted)
+
+    def __repr__(self):
+        sizes = ', '.join(f"{label}={len(self.get(label))}" for label in self.labels())
+        return f"Sections({sizes})"
+
+
+@lru_cache(maxsize=256)
+def sectionize(job_description: str) -> Sections:
+    """
+    Split a JD or recruiter email into labeled sections in one pass. Cached,
+    so every strategy run on the same text shares one split.
+    """
+    lines: List[Tuple[str, str]] = []
+    current = OVERVIEW
+
+    for raw_line in job_description.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        label = heading_label(line)
+        if label:
+            current = label
+            continue
+
+        lines.append((LOGISTICS if LOGISTICS_FIELD.match(line) else current, line))
+
+    return Sections(job_description, lines)
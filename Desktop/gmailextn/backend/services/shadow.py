@@ -0,0 +1,156 @@
+import copy
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from services.fanout import run_inline
+from services.skill_record import Skill
+
+# Shadow runs of an alternate extraction pipeline on live /api/analyze-jd
+# inputs, after the response is sent. Off unless FIRKI_SHADOW_SAMPLE > 0.
+SHADOW_SAMPLE = float(os.getenv('FIRKI_SHADOW_SAMPLE', '0'))
+# Extraction mode of the alternate pipeline (local, cascade or fanout)
+SHADOW_MODE = os.getenv('FIRKI_SHADOW_MODE', 'local').lower()
+# Share of one CPU the shadow worker may use, averaged over its jobs
+SHADOW_CPU_BUDGET = float(os.getenv('FIRKI_SHADOW_CPU_BUDGET', '0.1'))
+# Shadow jobs waiting for the worker; beyond this, samples are dropped
+SHADOW_QUEUE_SIZE = int(os.getenv('FIRKI_SHADOW_QUEUE_SIZE', '8'))
+# Results kept for the agreement and latency summary
+SHADOW_WINDOW = 1000
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))], 2)
+
+
+class ShadowRunner:
+    """
+    One background worker running the alternate pipeline on sampled
+    inputs. Jobs run entirely on the worker thread (fanout and cascade
+    stages run inline, not on the shared pool), so the worker's thread
+    CPU time is all the shadow work. After each job the worker sleeps
+    long enough that, averaged over jobs, it uses at most cpu_budget of
+    one core. This is an average, not a cap: a long job still holds a
+    core (and competes for the GIL) for as long as it runs, and is paid
+    for by a longer pause afterwards.
+    """
+
+    def __init__(self, extractor, mode: str = SHADOW_MODE, sample: float = SHADOW_SAMPLE,
+                 cpu_budget: float = SHADOW_CPU_BUDGET, queue_size: int = SHADOW_QUEUE_SIZE):
+        # A shallow copy shares the taxonomy, spaCy pipeline and caches, with its own mode
+        self.extractor = copy.copy(extractor)
+        self.extractor.extraction_mode = mode
+        self.mode = mode
+        self.sample = sample
+        self.cpu_budget = min(max(cpu_budget, 0.01), 1.0)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._results = deque(maxlen=SHADOW_WINDOW)
+        self.counts = {'sampled': 0, 'dropped': 0, 'completed': 0, 'failed': 0}
+        self.cpu_seconds = 0.0
+        self.throttle_seconds = 0.0
+        self._worker = threading.Thread(target=self._run, name='shadow-pipeline', daemon=True)
+        self._worker.start()
+
+    def should_shadow(self) -> bool:
+        return random.random() < self.sample
+
+    def submit(self, job_description: str, job_title: str, primary_skills: List[Skill],
+               primary_method: str, primary_ms: float):
+        """Queue a shadow run; called once the primary response has been sent"""
+        with self._lock:
+            self.counts['sampled'] += 1
+        try:
+            self._queue.put_nowait((job_description, job_title, [s.name for s in primary_skills],
+                                    primary_method, primary_ms))
+        except queue.Full:
+            with self._lock:
+                self.counts['dropped'] += 1
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            cpu_start = time.thread_time()
+            try:
+                self._shadow(*job)
+            except Exception as e:
+                print(f"DEBUG: Shadow pipeline failed: {e}")
+                with self._lock:
+                    self.counts['failed'] += 1
+            cpu = time.thread_time() - cpu_start
+            # Idle for cpu * (1/budget - 1): this job's CPU share becomes at most the budget
+            pause = cpu * (1 / self.cpu_budget - 1)
+            with self._lock:
+                self.cpu_seconds += cpu
+                self.throttle_seconds += pause
+            time.sleep(pause)
+
+    def _shadow(self, job_description, job_title, primary_names, primary_method, primary_ms):
+        start = time.perf_counter()
+        # Inline, so shadow strategies never take pool threads the serving requests need
+        with run_inline():
+            skills = self.extractor.extract_skills(job_description, job_title)
+        shadow_ms = (time.perf_counter() - start) * 1000
+
+        taxonomy = self.extractor.taxonomy
+        primary = [taxonomy.canonical_key(name) for name in primary_names]
+        shadow = [taxonomy.canonical_key(skill.name) for skill in skills]
+        union = set(primary) | set(shadow)
+        result = {
+            'jaccard': len(set(primary) & set(shadow)) / len(union) if union else 1.0,
+            'exact': set(primary) == set(shadow),
+            'top1': bool(primary and shadow and primary[0] == shadow[0]),
+            'primary_ms': primary_ms,
+            'shadow_ms': shadow_ms,
+            'primary_method': primary_method,
+        }
+        with self._lock:
+            self.counts['completed'] += 1
+            self._results.append(result)
+        print(f"DEBUG: Shadow {self.mode}: jaccard {result['jaccard']:.2f}, "
+              f"{shadow_ms:.0f} ms vs primary {primary_ms:.0f} ms")
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            results = list(self._results)
+            counts = dict(self.counts)
+            cpu_seconds, throttle_seconds = self.cpu_seconds, self.throttle_seconds
+        deltas = [r['shadow_ms'] - r['primary_ms'] for r in results]
+        n = len(results)
+        return {
+            'mode': self.mode,
+            'sample': self.sample,
+            'cpu_budget': self.cpu_budget,
+            'counts': counts,
+            'queued': self._queue.qsize(),
+            'window': n,
+            'agreement': {
+                'jaccard_mean': round(sum(r['jaccard'] for r in results) / n, 3) if n else None,
+                'exact_rate': round(sum(r['exact'] for r in results) / n, 3) if n else None,
+                'top1_rate': round(sum(r['top1'] for r in results) / n, 3) if n else None,
+            },
+            'latency_ms': {
+                'primary_p50': _percentile([r['primary_ms'] for r in results], 50),
+                'shadow_p50': _percentile([r['shadow_ms'] for r in results], 50),
+                'delta_p50': _percentile(deltas, 50),
+                'delta_p95': _percentile(deltas, 95),
+            },
+            'cpu_seconds': round(cpu_seconds, 2),
+            'throttle_seconds': round(throttle_seconds, 2),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_shadow_runner(extractor) -> Optional[ShadowRunner]:
+    """The process-wide shadow runner for `extractor`, or None when FIRKI_SHADOW_SAMPLE is 0"""
+    if SHADOW_SAMPLE <= 0:
+        return None
+    return ShadowRunner(extractor)
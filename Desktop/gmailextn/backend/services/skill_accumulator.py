@@ -0,0 +1,65 @@
+import heapq
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from services.skill_record import Skill, SkillSource
+from services.taxonomy import SkillTaxonomy, get_taxonomy
+
+
+class SkillAccumulator:
+    """
+    Ordered set of extracted skills keyed by canonical name.
+
+    Insertion is O(1) and insensitive to case and aliases (React/react,
+    NodeJS/Node.js). A repeated skill keeps its best confidence and
+    remembers every strategy that found it.
+    """
+
+    def __init__(self, taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy or get_taxonomy()
+        self._entries: Dict[str, Tuple[int, Skill]] = {}
+        self._sequence = count()
+
+    def add(self, name: str, confidence: float, source: Union[SkillSource, str], sources: int = 0) -> bool:
+        """Add a skill; returns True if it wasn't already present"""
+        key = self.taxonomy.canonical_key(name)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            skill = Skill(self.taxonomy.canonical_name(name), confidence, source, sources)
+            self._entries[key] = (next(self._sequence), skill)
+            return True
+
+        skill = entry[1]
+        source = SkillSource.parse(source)
+        if confidence > skill.confidence:
+            skill.confidence = confidence
+            skill.source = source
+        skill.sources |= source | sources
+        return False
+
+    def add_skill(self, skill: Union[Skill, Dict[str, Any]]) -> bool:
+        skill = Skill.coerce(skill)
+        return self.add(skill.name, skill.confidence, skill.source, skill.sources)
+
+    def extend(self, skills: Iterable[Union[Skill, Dict[str, Any]]]):
+        for skill in skills:
+            self.add_skill(skill)
+
+    def __contains__(self, name: str) -> bool:
+        return self.taxonomy.canonical_key(name) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self) -> List[str]:
+        return [skill.name for _, skill in self._entries.values()]
+
+    def to_list(self) -> List[Skill]:
+        """All skills in first-seen order"""
+        return [skill for _, skill in self._entries.values()]
+
+    def top(self, k: int) -> List[Skill]:
+        """The k most confident skills; ties keep first-seen order"""
+        best = heapq.nlargest(k, self._entries.values(), key=lambda e: (e[1].confidence, -e[0]))
+        return [skill for _, skill in best]
@@ -0,0 +1,151 @@
+import re
+from functools import lru_cache
+
+
+# Common non-technical terms that are clearly not skills
+NON_TECHNICAL = frozenset({
+    'we', 'the', 'this', 'that', 'these', 'those', 'required', 'experience',
+    'years', 'plus', 'level', 'certification', 'process', 'prescreen',
+    'network', 'enterprise', 'identify', 'develop', 'evaluate', 'coordinate',
+    'facilitate', 'manage', 'design', 'implement', 'analyze', 'assess',
+    'cth', 'asap', 'usc', 'poc', 'sme', 'hr', 'hcm', 'analyst',
+    'interview', 'phone', 'email', 'resume', 'cover letter', 'application',
+    'position', 'role', 'job', 'career', 'opportunity', 'company', 'team',
+    'department', 'division', 'organization', 'business', 'industry', 'sector',
+    'market', 'customer', 'client', 'user', 'stakeholder', 'partner',
+    'vendor', 'supplier', 'contractor', 'consultant', 'advisor', 'expert',
+    'specialist', 'professional', 'practitioner', 'practicing', 'working',
+    'collaborating', 'communicating', 'presenting', 'reporting', 'documenting',
+    'planning', 'organizing', 'coordinating', 'scheduling', 'prioritizing',
+    'problem solving', 'critical thinking', 'analytical thinking', 'creative thinking',
+    'strategic thinking', 'systems thinking', 'design thinking', 'lean thinking',
+    'agile thinking', 'scrum thinking', 'kanban thinking', 'devops thinking',
+    'cloud thinking', 'security thinking', 'compliance thinking', 'governance thinking',
+    'responsive', 'including', 'focus', 'role', 'description', 'duration', 'location',
+    'client', 'remote', 'month', 'front', 'end', 'script', 'developer', 'need',
+    'flexible', 'insurance', 'minutes', 'ladder', 'life', 'implementation', 'component',
+    'emphasis', 'strong', 'migration', 'quickly', 'existing', 'codebase', 'processes',
+    'contribute', 'tasks', 'evolving', 'tech', 'stack', 'assist', 'deliver', 'features',
+    'improvements', 'senior', 'onboarding', 'meaningful', 'contributions', 'ramp',
+    'both', 'closely', 'team', 'new', 'existing', 'quick', 'meaningful'
+})
+
+# Terms that start with common non-technical words
+NON_TECHNICAL_STARTS = ('we ', 'the ', 'this ', 'that ', 'these ', 'those ', 'a ', 'an ')
+
+# Generic action words that don't represent skills
+ACTION_WORDS = frozenset({
+    'identify', 'develop', 'evaluate', 'coordinate', 'facilitate',
+    'manage', 'design', 'implement', 'analyze', 'assess', 'review',
+    'plan', 'execute', 'monitor', 'maintain', 'support', 'provide',
+    'assist', 'help', 'guide', 'train', 'mentor', 'coach', 'teach',
+    'learn', 'study', 'research', 'investigate', 'examine', 'inspect',
+    'test', 'validate', 'verify', 'confirm', 'check', 'review', 'audit'
+})
+
+# Email/header fragments
+REJECT_FRAGMENTS = ('@', 'http', 'www', '.com', '.org')
+
+# Punctuation that suggests a phrase rather than a skill
+REJECT_CHARS = frozenset('-:;()[]{}')
+
+# Technical indicators (these are clearly technical)
+TECHNICAL_INDICATORS = (
+    'api', 'sdk', 'framework', 'library', 'tool', 'platform', 'system',
+    'database', 'cloud', 'automation', 'configuration', 'deployment',
+    'monitoring', 'logging', 'testing', 'ci/cd', 'devops', 'infrastructure',
+    'frontend', 'backend', 'fullstack', 'mobile', 'web', 'desktop',
+    'server', 'client', 'network', 'security', 'data', 'analytics',
+    'machine learning', 'ai', 'artificial intelligence', 'ml', 'deep learning',
+    'blockchain', 'cryptocurrency', 'iot', 'internet of things'
+)
+
+# Programming languages and technologies
+TECH_TERMS = (
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
+    'php', 'ruby', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql',
+    'html', 'css', 'sass', 'less', 'react', 'angular', 'vue', 'node',
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'linux', 'windows',
+    'macos', 'git', 'jenkins', 'terraform', 'ansible', 'puppet', 'chef',
+    'next.js', 'nextjs', 'clojure', 'clojurescript', 'frontend', 'backend'
+)
+
+# Words that make a phrase technical
+TECHNICAL_WORDS = (
+    'code', 'programming', 'development', 'engineering', 'architecture',
+    'design', 'testing', 'deployment', 'infrastructure', 'platform',
+    'framework', 'library', 'tool', 'system', 'database', 'api',
+    'cloud', 'automation', 'monitoring', 'security', 'network',
+    'data', 'analytics', 'machine learning', 'ai', 'blockchain'
+)
+
+
+def _build_automaton(*tables) -> re.Pattern:
+    """One alternation over every accepting substring, longest first"""
+    terms = sorted({term for table in tables for term in table}, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+
+# Any of these substrings marks a candidate as technical
+TECHNICAL_AUTOMATON = _build_automaton(TECHNICAL_INDICATORS, TECH_TERMS, TECHNICAL_WORDS)
+
+# Certification acronyms (CCNA, AWS, SDN, ...)
+ACRONYM_PATTERN = re.compile(r'^[A-Z]{2,6}$')
+
+
+class TechnicalSkillClassifier:
+    """
+    Table-driven check for whether a candidate string is a technical skill.
+    Tables are frozen at import time and decisions are memoized in a bounded
+    LRU keyed by the raw candidate, since pattern strategies see the same
+    handful of names over and over.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self._cached_classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def is_technical(self, skill: str) -> bool:
+        return self._cached_classify(skill)
+
+    def cache_info(self):
+        return self._cached_classify.cache_info()
+
+    def cache_clear(self):
+        self._cached_classify.cache_clear()
+
+    @staticmethod
+    def _classify(skill: str) -> bool:
+        skill_lower = skill.lower().strip()
+
+        # Reject very short or very long terms
+        if len(skill_lower) < 2 or len(skill_lower) > 30:
+            return False
+
+        if skill_lower in NON_TECHNICAL or skill_lower in ACTION_WORDS:
+            return False
+
+        if skill_lower.startswith(NON_TECHNICAL_STARTS):
+            return False
+
+        if any(fragment in skill_lower for fragment in REJECT_FRAGMENTS):
+            return False
+
+        # Reject descriptive phrases (more than three words)
+        if len(skill_lower.split()) > 3:
+            return False
+
+        if not REJECT_CHARS.isdisjoint(skill):
+            return False
+
+        if TECHNICAL_AUTOMATON.search(skill_lower):
+            return True
+
+        if ACRONYM_PATTERN.match(skill):
+            return True
+
+        # Default to rejecting if it doesn't clearly look like a technical skill
+        return False
+
+
+# Shared by every SkillExtractor so the cache warms across requests
+default_classifier = TechnicalSkillClassifier()
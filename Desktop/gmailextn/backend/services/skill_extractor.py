@@ -1,12 +1,26 @@
 import re
 import nltk
-from typing import List, Dict, Any
-import openai
-import google.generativeai as genai
+from typing import Iterable, Iterator, List, Optional
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
 from textblob import TextBlob
 import spacy
 
+from services import safe_regex
+from services.chunking import CHUNK_DEADLINE, needs_chunking, split_into_chunks
+from services.doc_cache import DOC_CACHE_DIR, DocCache
+from services.fanout import EXTRACTION_MODE, FanOutPolicy, get_executor
+from services.skill_accumulator import SkillAccumulator
+from services.skill_classifier import default_classifier
+from services.pipeline_config import active_config, active_run, pinned, run_pinned
+from services.prompt_budget import field_for_prompt, job_text_for_prompt
+from services.providers import chat_completion, configure_gemini, configure_openai, gemini_model
+from services.sectionizer import REQUIREMENTS, ROLE_DETAILS, TECH_STACK, sectionize
+from services.skill_record import Skill, SkillSource
+from services.taxonomy import get_taxonomy
+
 # Download required NLTK data
 try:
     nltk.data.find('tokenizers/punkt')
@@ -18,31 +32,67 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
+# NLP skills only come from doc.ents and doc.noun_chunks (tok2vec, tagger,
+# attribute_ruler, parser, ner); these components are never read
+NLP_EXCLUDED_COMPONENTS = ['lemmatizer', 'senter', 'textcat', 'textcat_multilabel', 'spancat']
+
+# nlp.pipe settings for extract_skills_nlp_batch()
+NLP_BATCH_SIZE = int(os.getenv('FIRKI_NLP_BATCH_SIZE', '64'))
+NLP_PROCESSES = int(os.getenv('FIRKI_NLP_PROCESSES', '1'))
+
+# Pipeline strategy names (services/data/pipeline.json) and the methods
+# behind them, looked up per call so a patched method is honoured
+PIPELINE_STRATEGY_METHODS = {
+    'ai_dynamic_analysis': '_extract_with_dynamic_analysis',
+    'gemini_ai': '_extract_with_gemini',
+    'openai_ai': '_extract_with_openai',
+    'nlp': '_extract_with_nlp',
+    'intelligent_patterns': '_extract_intelligent_patterns',
+    'basic_extraction': '_basic_skill_extraction',
+}
+
 class SkillExtractor:
     def __init__(self):
-        self.last_method_used = "fallback"
+        # Per thread, so concurrent requests/roles each read their own method
+        self._method_state = threading.local()
+        self.skill_classifier = default_classifier
+        self.taxonomy = get_taxonomy()
+        self.extraction_mode = EXTRACTION_MODE
+        self.fanout_policy = FanOutPolicy.from_env()
+        
+        # Remote strategies the fan-out mode starts together, labelled with
+        # the method name reported when their results are used
+        self.remote_strategies = [
+            ("ai_dynamic_analysis", self._extract_with_dynamic_analysis),
+            ("gemini_ai", self._extract_with_gemini),
+            ("openai_ai", self._extract_with_openai),
+        ]
         
         # Initialize OpenAI
-        openai.api_key = os.getenv('OPENAI_API_KEY')
+        configure_openai(os.getenv('OPENAI_API_KEY'))
         
         # Initialize Gemini
-        genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
-        self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        configure_gemini(os.getenv('GEMINI_API_KEY'))
+        self.gemini_model = gemini_model('gemini-2.0-flash-exp')
         
-        # Load spaCy model
+        # Load spaCy model (without components _extract_with_nlp never reads)
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=NLP_EXCLUDED_COMPONENTS)
         except OSError:
             # If model not found, download it
             os.system("python -m spacy download en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=NLP_EXCLUDED_COMPONENTS)
+        
+        # Parsed docs on disk, so reanalysing a JD skips the model
+        self.doc_cache = DocCache(self.nlp, DOC_CACHE_DIR) if DOC_CACHE_DIR else None
         
-        # Technical skill patterns
+        # Technical skill patterns (word runs are bounded - skills are at most
+        # a few words long, and an unbounded run backtracks quadratically)
         self.technical_patterns = [
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Developer|Engineer|Architect|Analyst|Specialist|Consultant)\b',
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Framework|Library|Tool|Platform|System|Database)\b',
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:API|SDK|CLI|GUI|ORM|CMS)\b',
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Cloud|Service|Infrastructure|Pipeline|Workflow)\b'
+            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}\s+(?:Developer|Engineer|Architect|Analyst|Specialist|Consultant)\b',
+            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}\s+(?:Framework|Library|Tool|Platform|System|Database)\b',
+            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}\s+(?:API|SDK|CLI|GUI|ORM|CMS)\b',
+            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3}\s+(?:Cloud|Service|Infrastructure|Pipeline|Workflow)\b'
         ]
         
         # Common technical terms to avoid
@@ -51,140 +101,274 @@ class SkillExtractor:
             'critical thinking', 'time management', 'project management', 'collaboration',
             'adaptability', 'flexibility', 'attention to detail', 'organization'
         }
-        
-        # Job title skill mapping
-        self.job_title_skills = {
-            'workday': ['Workday', 'HCM', 'HRIS', 'Data Conversion', 'Data Migration'],
-            'salesforce': ['Salesforce', 'Apex', 'Lightning', 'SOQL', 'Visualforce'],
-            'react': ['React', 'JavaScript', 'TypeScript', 'HTML', 'CSS'],
-            'python': ['Python', 'Django', 'Flask', 'Pandas', 'NumPy'],
-            'java': ['Java', 'Spring', 'Hibernate', 'Maven', 'JUnit'],
-            'devops': ['Docker', 'Kubernetes', 'Jenkins', 'AWS', 'CI/CD'],
-            'data': ['SQL', 'Python', 'R', 'Tableau', 'Power BI'],
-            'aws': ['AWS', 'EC2', 'S3', 'Lambda', 'CloudFormation']
-        }
 
-    def extract_skills(self, job_description: str, job_title: str = "") -> List[Dict[str, Any]]:
+    @property
+    def last_method_used(self) -> str:
+        """Strategy behind this thread's latest extract_skills() result"""
+        return getattr(self._method_state, 'method', "fallback")
+
+    @last_method_used.setter
+    def last_method_used(self, method: str):
+        self._method_state.method = method
+
+    def extract_skills(self, job_description: str, job_title: str = "") -> List[Skill]:
         """Extract skills using AI-first approach with intelligent fallbacks"""
+        # One config for the whole extraction, even if it is reloaded meanwhile
+        with pinned(active_config()) as config:
+            if self.extraction_mode == 'local':
+                return self._extract_skills_local(job_description)
+            if needs_chunking(job_description):
+                return self._extract_skills_chunked(job_description, job_title)
+            if self.extraction_mode == 'fanout':
+                return self._extract_skills_fanout(job_description, job_title)
+            return self._extract_skills_pipeline(config, job_description, job_title)
+
+    def _run_strategy(self, name: str, job_description: str, job_title: str) -> List[Skill]:
+        method = getattr(self, PIPELINE_STRATEGY_METHODS[name])
+        if name in ('intelligent_patterns', 'basic_extraction'):
+            return method(job_description)
+        return method(job_description, job_title)
+
+    def _extract_skills_pipeline(self, config, job_description: str, job_title: str) -> List[Skill]:
+        """Run the configured stages in order, returning as soon as a stage's exit condition holds"""
         print(f"DEBUG: Starting AI-first skill extraction for job title: '{job_title}'")
         print(f"DEBUG: Job description length: {len(job_description)}")
+        started = time.perf_counter()
+        
+        skills = SkillAccumulator(self.taxonomy)
+        method = "fallback"
+        for stage in config.stages:
+            if stage.remote and config.deadline and time.perf_counter() - started >= config.deadline:
+                print(f"DEBUG: Skipping {stage}: pipeline deadline of {config.deadline}s passed")
+                continue
+            exit_method, last_method = self._run_stage(config, stage, skills, job_description, job_title)
+            method = last_method or method
+            if exit_method:
+                self.last_method_used = exit_method
+                final_skills = skills.top(config.limits['final_skills'])
+                print(f"DEBUG: Returning {len(final_skills)} {exit_method} skills: {[s.name for s in final_skills]}")
+                return final_skills
         
-        skills = []
-        
-        # STRATEGY 1: AI Dynamic Analysis (Primary - Most Intelligent)
-        try:
-            from services.dynamic_recruiter import DynamicRecruiterTool
-            dynamic_tool = DynamicRecruiterTool()
-            ai_result = dynamic_tool.analyze_job_dynamically(job_description, job_title)
-            
-            if ai_result.get('extractionMethod') == 'ai_dynamic_analysis' and ai_result.get('skills'):
-                ai_skills = ai_result['skills']
-                print(f"DEBUG: AI dynamic analysis found {len(ai_skills)} skills: {[s.get('name', '') for s in ai_skills]}")
-                
-                # Convert AI skills to our format
-                for skill in ai_skills:
-                    if skill.get('name') and skill.get('name') not in [s['name'] for s in skills]:
-                        skills.append({
-                            'name': skill['name'],
-                            'confidence': 0.95,  # Highest confidence for AI
-                            'source': 'ai_dynamic_analysis'
-                        })
-                
-                self.last_method_used = "ai_dynamic_analysis"
-                print(f"DEBUG: Successfully extracted {len(skills)} skills using AI dynamic analysis")
-                
-                # If AI found enough skills, return them
-                if len(skills) >= 3:
-                    final_skills = self._deduplicate_and_rank(skills)
-                    print(f"DEBUG: Returning {len(final_skills)} AI-extracted skills: {[s['name'] for s in final_skills]}")
-                    return final_skills
-                    
-        except Exception as e:
-            print(f"DEBUG: AI dynamic analysis failed: {e}")
-        
-        # STRATEGY 2: AI Models (Secondary - Still Intelligent)
-        if len(skills) < 3:
+        self.last_method_used = method
+        return self._finalize(skills)
+
+    def _run_stage(self, config, stage, skills: SkillAccumulator, job_description: str, job_title: str):
+        """
+        Add one stage's results to `skills`. Returns (the strategy whose
+        results met the exit condition or None, the last strategy that ran).
+        """
+        def finished(name, result):
+            print(f"DEBUG: {name} found {len(result)} skills: {[s.name for s in result]}")
+            skills.extend(result)
+            return bool(stage.min_skills and len(skills) >= stage.min_skills)
+        
+        # A lone strategy without a timeout runs right here; otherwise the
+        # remote strategies go to the fan-out pool and local ones run meanwhile
+        concurrent = len(stage.strategies) > 1 or stage.timeout is not None
+        executor = get_executor()
+        pending = {
+            executor.submit(run_pinned, active_run(), self._run_strategy, name, job_description, job_title): name
+            for name in (stage.remote if concurrent else ())
+        }
+        last_method = None
+        for name in stage.strategies:
+            if name in pending.values():
+                continue
             try:
-                # Try Gemini first
-                ai_skills = self._extract_with_gemini(job_description, job_title)
-                print(f"DEBUG: Gemini found {len(ai_skills)} skills: {[s['name'] for s in ai_skills]}")
-                
-                for skill in ai_skills:
-                    if skill['name'] not in [s['name'] for s in skills]:
-                        skills.append(skill)
-                
-                if len(skills) >= 3:
-                    self.last_method_used = "gemini_ai"
-                    final_skills = self._deduplicate_and_rank(skills)
-                    print(f"DEBUG: Returning {len(final_skills)} Gemini-extracted skills: {[s['name'] for s in final_skills]}")
-                    return final_skills
-                    
+                result = self._run_strategy(name, job_description, job_title)
             except Exception as e:
-                print(f"DEBUG: Gemini extraction failed: {e}")
+                print(f"DEBUG: {name} failed: {e}")
+                continue
+            last_method = name
+            if finished(name, result):
+                self._cancel(pending)
+                return name, name
+        
+        deadline = time.perf_counter() + stage.timeout if stage.timeout else None
+        while pending:
+            timeout = None if deadline is None else deadline - time.perf_counter()
+            if timeout is not None and timeout <= 0:
+                break
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"DEBUG: {name} failed: {e}")
+                    continue
+                last_method = name
+                if finished(name, result):
+                    self._cancel(pending)
+                    return name, name
+        if pending:
+            print(f"DEBUG: {stage} timed out waiting for {sorted(pending.values())}")
+            self._cancel(pending)
+        return None, last_method
+
+    @staticmethod
+    def _cancel(pending):
+        for future in pending:
+            # Not started yet -> never started; already running -> result is ignored
+            future.cancel()
+
+    def _extract_skills_fanout(self, job_description: str, job_title: str) -> List[Skill]:
+        """Run remote and local strategies concurrently; stop once the fan-out policy is met"""
+        print(f"DEBUG: Starting fan-out skill extraction for job title: '{job_title}' ({self.fanout_policy})")
+        started = time.perf_counter()
+        deadline = started + self.fanout_policy.ai_deadline
+        
+        config = active_config()
+        executor = get_executor()
+        pending = {
+            executor.submit(run_pinned, active_run(), strategy, job_description, job_title): method
+            for method, strategy in self.remote_strategies
+        }
         
-        if len(skills) < 3:
-            try:
-                # Try OpenAI next
-                ai_skills = self._extract_with_openai(job_description, job_title)
-                print(f"DEBUG: OpenAI found {len(ai_skills)} skills: {[s['name'] for s in ai_skills]}")
-                
-                for skill in ai_skills:
-                    if skill['name'] not in [s['name'] for s in skills]:
-                        skills.append(skill)
+        # Local strategies are CPU-bound and take milliseconds, so they run
+        # here while the remote calls are in flight
+        pattern_skills = self._extract_intelligent_patterns(job_description)
+        keyword_skills = self._keyword_skills(job_description)
+        
+        ai_skills = SkillAccumulator(self.taxonomy)
+        while pending:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                method = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"DEBUG: {method} failed: {e}")
+                    continue
+                print(f"DEBUG: {method} found {len(result)} skills after {(time.perf_counter() - started) * 1000:.0f} ms")
+                ai_skills.extend(result)
                 
-                if len(skills) >= 3:
-                    self.last_method_used = "openai_ai"
-                    final_skills = self._deduplicate_and_rank(skills)
-                    print(f"DEBUG: Returning {len(final_skills)} OpenAI-extracted skills: {[s['name'] for s in final_skills]}")
+                if self.fanout_policy.satisfied(len(ai_skills)):
+                    self.last_method_used = method
+                    final_skills = ai_skills.top(config.limits['final_skills'])
+                    print(f"DEBUG: Returning {len(final_skills)} {method} skills: {[s.name for s in final_skills]}")
                     return final_skills
-                    
+        
+        for future in pending:
+            # Not started yet -> never started; already running -> result is ignored
+            future.cancel()
+        if pending:
+            print(f"DEBUG: Fan-out gave up on {sorted(pending.values())} after {(time.perf_counter() - started) * 1000:.0f} ms")
+        
+        # Same precedence as the cascade: partial AI + patterns, then basic
+        skills = ai_skills
+        skills.extend(pattern_skills)
+        if len(skills) >= 3:
+            self.last_method_used = "intelligent_patterns"
+            return skills.top(config.limits['final_skills'])
+        
+        # The basic strategy's results: keyword matches plus the patterns already added
+        skills.extend(keyword_skills)
+        self.last_method_used = "basic_extraction"
+        return self._finalize(skills)
+
+    def _extract_skills_local(self, job_description: str) -> List[Skill]:
+        """Pattern and keyword strategies only; never calls a provider"""
+        skills = SkillAccumulator(self.taxonomy)
+        # Patterns, then keyword matches (the basic strategy minus its repeat of the pattern pass)
+        skills.extend(self._extract_intelligent_patterns(job_description))
+        skills.extend(self._keyword_skills(job_description))
+        self.last_method_used = "local"
+        return self._finalize(skills)
+
+    def _extract_skills_chunked(self, job_description: str, job_title: str) -> List[Skill]:
+        """Map-reduce for very long JDs: extract from overlapping chunks concurrently, then dedupe/rank"""
+        chunks = split_into_chunks(job_description)
+        print(f"DEBUG: Chunked extraction: {len(job_description)} chars -> {len(chunks)} chunks")
+        started = time.perf_counter()
+        
+        # Map: one LLM call per chunk, all in flight at once
+        deadline = started + CHUNK_DEADLINE
+        executor = get_executor()
+        futures = [executor.submit(run_pinned, active_run(), self._extract_chunk_with_ai, chunk, job_title, deadline)
+                   for chunk in chunks]
+        
+        # Local strategies run on each chunk here while the LLM calls are out
+        skills = SkillAccumulator(self.taxonomy)
+        for chunk in chunks:
+            skills.extend(self._extract_intelligent_patterns(chunk))
+            skills.extend(self._keyword_skills(chunk))
+        
+        # Reduce: canonical dedupe keeps each skill's best confidence
+        done, not_done = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+        for future in not_done:
+            # Queued chunks never start. A provider call already in flight can't be
+            # interrupted: it runs to completion on the pool and its result is dropped,
+            # but the chunk makes no further calls past the deadline.
+            future.cancel()
+        ai_chunks = 0
+        for future in done:
+            try:
+                chunk_skills = future.result()
             except Exception as e:
-                print(f"DEBUG: OpenAI extraction failed: {e}")
-        
-        # STRATEGY 3: Intelligent Pattern Matching (Fallback - Only if AI fails)
-        if len(skills) < 3:
-            print(f"DEBUG: AI methods failed, falling back to intelligent pattern matching")
-            pattern_skills = self._extract_intelligent_patterns(job_description)
-            print(f"DEBUG: Intelligent pattern extraction found {len(pattern_skills)} skills: {[s['name'] for s in pattern_skills]}")
-            
-            for skill in pattern_skills:
-                if skill['name'] not in [s['name'] for s in skills]:
-                    skills.append(skill)
-            
-            if len(skills) >= 3:
-                self.last_method_used = "intelligent_patterns"
-                final_skills = self._deduplicate_and_rank(skills)
-                print(f"DEBUG: Returning {len(final_skills)} pattern-extracted skills: {[s['name'] for s in final_skills]}")
-                return final_skills
+                print(f"DEBUG: Chunk extraction failed: {e}")
+                continue
+            if chunk_skills:
+                ai_chunks += 1
+                skills.extend(chunk_skills)
+        
+        self.last_method_used = "chunked_ai" if ai_chunks else "chunked_local"
+        print(f"DEBUG: Chunked extraction: {ai_chunks}/{len(chunks)} chunks answered by AI, "
+              f"{len(not_done)} timed out, {(time.perf_counter() - started) * 1000:.0f} ms")
+        return self._finalize(skills)
+
+    def _extract_chunk_with_ai(self, chunk: str, job_title: str, deadline: float = float('inf')) -> List[Skill]:
+        """LLM skills for one chunk: Gemini, falling back to OpenAI. No call starts after `deadline` (perf_counter)."""
+        if time.perf_counter() >= deadline:
+            return []
+        try:
+            return self._extract_with_gemini(chunk, job_title)
+        except Exception as e:
+            print(f"DEBUG: Gemini chunk extraction failed: {e}")
+        if time.perf_counter() >= deadline:
+            return []
+        return self._extract_with_openai(chunk, job_title)
+
+    def _finalize(self, skills: SkillAccumulator) -> List[Skill]:
+        """Drop generic phrases and keep the most confident skills"""
+        filtered = self._filter_generic_skills(skills.to_list())
+        print(f"DEBUG: Final filtering result: {[s.name for s in filtered]}")
         
-        # STRATEGY 4: Basic Extraction (Last Resort - Only if everything else fails)
-        if len(skills) < 3:
-            print(f"DEBUG: All methods failed, using basic extraction as last resort")
-            basic_skills = self._basic_skill_extraction(job_description)
-            print(f"DEBUG: Basic extraction found {len(basic_skills)} skills: {[s['name'] for s in basic_skills]}")
-            
-            for skill in basic_skills:
-                if skill['name'] not in [s['name'] for s in skills]:
-                    skills.append(skill)
-            
-            self.last_method_used = "basic_extraction"
-        
-        # Final processing
-        skills = self._filter_generic_skills(skills)
-        print(f"DEBUG: Final filtering result: {[s['name'] for s in skills]}")
-        
-        final_skills = self._deduplicate_and_rank(skills)
-        print(f"DEBUG: Final result: {len(final_skills)} skills using method '{self.last_method_used}': {[s['name'] for s in final_skills]}")
+        final_skills = self._deduplicate_and_rank(filtered)
+        print(f"DEBUG: Final result: {len(final_skills)} skills using method '{self.last_method_used}': {[s.name for s in final_skills]}")
         
         return final_skills
 
-    def _extract_with_gemini(self, job_description: str, job_title: str) -> List[Dict[str, Any]]:
+    def _extract_with_dynamic_analysis(self, job_description: str, job_title: str) -> List[Skill]:
+        """Extract skills using the dynamic recruiter tool's full AI analysis"""
+        from services.dynamic_recruiter import DynamicRecruiterTool
+        dynamic_tool = DynamicRecruiterTool()
+        ai_result = dynamic_tool.analyze_job_dynamically(job_description, job_title)
+        
+        if ai_result.get('extractionMethod') != 'ai_dynamic_analysis':
+            return []
+        
+        # Highest confidence for AI
+        confidence = active_config().confidence['ai_dynamic_analysis']
+        return [
+            Skill(skill['name'], confidence, SkillSource.AI_DYNAMIC_ANALYSIS)
+            for skill in ai_result.get('skills', [])
+            if skill.get('name')
+        ]
+
+    def _extract_with_gemini(self, job_description: str, job_title: str) -> List[Skill]:
         """Extract skills using Google Gemini AI"""
+        job_title = field_for_prompt('extract_with_gemini', job_title)
+        job_text = job_text_for_prompt('extract_with_gemini', job_description)
+        
         prompt = f"""
         Extract ONLY technical skills, technologies, tools, and programming languages from this job description.
         
         Job Title: {job_title}
-        Job Description: {job_description}
+        Job Description: {job_text}
         
         IMPORTANT: Extract ONLY individual technical skills, not phrases or sentences.
         
@@ -206,25 +390,25 @@ class SkillExtractor:
         response = self.gemini_model.generate_content(prompt)
         skills_text = response.text.strip()
         
+        config = active_config()
         skills = []
         for line in skills_text.split('\n'):
             skill = line.strip().strip('- ').strip('* ').strip('• ')
             if skill and len(skill) > 2 and self._is_technical_skill(skill):
-                skills.append({
-                    'name': skill,
-                    'confidence': 0.9,
-                    'source': 'gemini'
-                })
+                skills.append(Skill(skill, config.confidence['gemini'], SkillSource.GEMINI))
         
-        return skills[:7]  # Limit to 7 skills
+        return skills[:config.limits['ai_skills']]
 
-    def _extract_with_openai(self, job_description: str, job_title: str) -> List[Dict[str, Any]]:
+    def _extract_with_openai(self, job_description: str, job_title: str) -> List[Skill]:
         """Extract skills using OpenAI"""
+        job_title = field_for_prompt('extract_with_openai', job_title)
+        job_text = job_text_for_prompt('extract_with_openai', job_description)
+        
         prompt = f"""
         Extract ONLY technical skills, technologies, tools, and programming languages from this job description.
         
         Job Title: {job_title}
-        Job Description: {job_description}
+        Job Description: {job_text}
         
         IMPORTANT: Extract ONLY individual technical skills, not phrases or sentences.
         
@@ -243,7 +427,7 @@ class SkillExtractor:
         Focus on specific technologies, tools, frameworks, and technical competencies.
         """
         
-        response = openai.ChatCompletion.create(
+        response = chat_completion(
             model="gpt-3.5-turbo",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=200,
@@ -252,21 +436,40 @@ class SkillExtractor:
         
         skills_text = response.choices[0].message.content.strip()
         
+        config = active_config()
         skills = []
         for line in skills_text.split('\n'):
             skill = line.strip().strip('- ').strip('* ').strip('• ')
             if skill and len(skill) > 2 and self._is_technical_skill(skill):
-                skills.append({
-                    'name': skill,
-                    'confidence': 0.85,
-                    'source': 'openai'
-                })
+                skills.append(Skill(skill, config.confidence['openai'], SkillSource.OPENAI))
         
-        return skills[:7]
+        return skills[:config.limits['ai_skills']]
 
-    def _extract_with_nlp(self, job_description: str, job_title: str) -> List[Dict[str, Any]]:
+    def _extract_with_nlp(self, job_description: str, job_title: str) -> List[Skill]:
         """Extract skills using NLP techniques"""
-        doc = self.nlp(job_description)
+        doc = self.doc_cache.parse(job_description) if self.doc_cache else self.nlp(job_description)
+        return self._skills_from_doc(doc)
+
+    def extract_skills_nlp_batch(self, job_descriptions: Iterable[str], batch_size: Optional[int] = None,
+                                 n_process: Optional[int] = None) -> Iterator[List[Skill]]:
+        """
+        NLP skills for many job descriptions via nlp.pipe; yields one list per
+        input, in order. Only the NLP strategy: batch_analyze.py and mailbox
+        ingest run the full extraction per record and do not use it.
+        """
+        pipe = self.doc_cache.parse_many if self.doc_cache else self.nlp.pipe
+        docs = pipe(
+            job_descriptions,
+            batch_size=batch_size or NLP_BATCH_SIZE,
+            n_process=n_process or NLP_PROCESSES,
+        )
+        for doc in docs:
+            yield self._skills_from_doc(doc)
+
+    def _skills_from_doc(self, doc) -> List[Skill]:
+        """Skills from a parsed spaCy doc (entities, noun chunks, technical patterns)"""
+        job_description = doc.text
+        confidence = active_config().confidence
         
         # Extract noun phrases and named entities
         skills = []
@@ -276,104 +479,65 @@ class SkillExtractor:
             if ent.label_ in ['ORG', 'PRODUCT', 'GPE']:
                 skill_name = ent.text.strip()
                 if self._is_technical_skill(skill_name):
-                    skills.append({
-                        'name': skill_name,
-                        'confidence': 0.7,
-                        'source': 'nlp_ner'
-                    })
-        
-        # Noun phrases
-        for chunk in doc.noun_chunks:
+                    skills.append(Skill(skill_name, confidence['nlp_ner'], SkillSource.NLP_NER))
+        
+        # Noun phrases (need the parser; skipped if it was excluded)
+        noun_chunks = doc.noun_chunks if doc.has_annotation("DEP") else []
+        for chunk in noun_chunks:
             skill_name = chunk.text.strip()
             if self._is_technical_skill(skill_name):
-                skills.append({
-                    'name': skill_name,
-                    'confidence': 0.6,
-                    'source': 'nlp_chunks'
-                })
+                skills.append(Skill(skill_name, confidence['nlp_chunks'], SkillSource.NLP_CHUNKS))
         
         # Pattern matching
         for pattern in self.technical_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+            matches = safe_regex.findall(pattern, job_description, re.IGNORECASE)
             for match in matches:
                 if self._is_technical_skill(match):
-                    skills.append({
-                        'name': match,
-                        'confidence': 0.8,
-                        'source': 'nlp_patterns'
-                    })
+                    skills.append(Skill(match, confidence['nlp_patterns'], SkillSource.NLP_PATTERNS))
         
         return skills
 
-    def _extract_from_job_title(self, job_title: str) -> List[Dict[str, Any]]:
+    def _extract_from_job_title(self, job_title: str) -> List[Skill]:
         """Extract skills inferred from job title"""
         if not job_title:
             return []
         
-        job_title_lower = job_title.lower()
+        confidence = active_config().confidence
         skills = []
         
-        for platform, platform_skills in self.job_title_skills.items():
-            if platform in job_title_lower:
-                for skill in platform_skills:
-                    skills.append({
-                        'name': skill,
-                        'confidence': 0.9,
-                        'source': 'job_title_inference'
-                    })
+        for skill in self.taxonomy.title_skills(job_title):
+            skills.append(Skill(skill, confidence['job_title_inference'], SkillSource.JOB_TITLE_INFERENCE))
         
         return skills
 
-    def _basic_skill_extraction(self, job_description: str) -> List[Dict[str, Any]]:
+    def _basic_skill_extraction(self, job_description: str) -> List[Skill]:
         """Basic keyword-based skill extraction"""
-        # Common technical terms
-        technical_keywords = [
-            'Python', 'Java', 'JavaScript', 'React', 'Angular', 'Vue', 'Node.js',
-            'SQL', 'MongoDB', 'PostgreSQL', 'MySQL', 'AWS', 'Azure', 'GCP',
-            'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitHub', 'JIRA',
-            'Agile', 'Scrum', 'CI/CD', 'REST API', 'GraphQL', 'Microservices',
-            # Frontend and Web Development
-            'TypeScript', 'Shopify', 'Contentful', 'Hydrogen', 'Next.js', 'Gatsby',
-            'HTML', 'CSS', 'SASS', 'LESS', 'Webpack', 'Babel', 'ES6',
-            # Backend and DevOps
-            'NodeJS', 'Express', 'MongoDB', 'PostgreSQL', 'Redis', 'Elasticsearch',
-            'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Heroku', 'Vercel',
-            # Tools and Platforms
-            'Git', 'GitHub', 'GitLab', 'Jira', 'Confluence', 'Atlassian',
-            'Slack', 'Discord', 'Trello', 'Asana', 'Notion',
-            # Network and automation skills
-            'Ansible', 'Nornir', 'Terraform', 'Puppet', 'Chef', 'Salt',
-            'NETCONF', 'RESTCONF', 'YANG', 'OpenConfig', 'gNMI', 'gRPC',
-            'Cisco', 'Juniper', 'Arista', 'F5', 'Load Balancer', 'Load Balancers',
-            'Linux', 'Unix', 'Windows Server', 'VMware', 'Hyper-V', 'KVM',
-            'ServiceNow', 'Splunk', 'GitLab', 'LogicMonitor', 'Nagios', 'Zabbix',
-            'CCNA', 'CCNP', 'CCIE', 'DevNet', 'Network Automation', 'SDN',
-            'Network Programmability', 'Network Infrastructure', 'Network Security',
-            # Additional skills from the job description
-            'SD-WAN', 'Nautobot', 'Netbox', 'Microsoft Visio', 'Load Balancers'
-        ]
-        
-        skills = []
-        
-        # Extract skills from technical keywords
-        for keyword in technical_keywords:
-            if keyword.lower() in job_description.lower():
-                skills.append({
-                    'name': keyword,
-                    'confidence': 0.5,
-                    'source': 'keyword_match'
-                })
+        skills = self._keyword_skills(job_description)
         
         # Extract skills from specific patterns in the job description
         skills.extend(self._extract_intelligent_patterns(job_description))
         
         return skills
+
+    def _keyword_skills(self, job_description: str) -> List[Skill]:
+        """Skills mentioned by any taxonomy alias (NodeJS/Node.js/...), anywhere in the JD"""
+        confidence = active_config().confidence
+        return [Skill(self.taxonomy.name_for(skill_id), confidence['keyword_match'], SkillSource.KEYWORD_MATCH)
+                for skill_id in self.taxonomy.find_in_text(job_description)]
     
 
 
-    def _extract_intelligent_patterns(self, job_description: str) -> List[Dict[str, Any]]:
+    def _extract_intelligent_patterns(self, job_description: str) -> List[Skill]:
         """Extract skills using truly intelligent, non-hardcoded patterns"""
-        skills = []
+        confidence = active_config().confidence
+        skills = SkillAccumulator(self.taxonomy)
+        
+        # Each strategy only scans the sections it can match in, never the
+        # pay rates, interview slots and client blurbs
+        sections = sectionize(job_description)
+        content_text = sections.text()
+        stack_text = sections.text((TECH_STACK, ROLE_DETAILS, REQUIREMENTS))
+        requirements_text = sections.text((REQUIREMENTS, ROLE_DETAILS))
         
         # Strategy 1: Look for specific technology mentions in context
         # Only extract when technologies are clearly mentioned as requirements
@@ -384,20 +548,13 @@ class SkillExtractor:
             r'(?:React|TypeScript|JavaScript|Node\.js|NodeJS|Shopify|AWS|Docker|Git|Jira|Atlassian|Contentful|Hydrogen)',
         ]
         
-        import re
         for pattern in tech_context_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+            matches = safe_regex.findall(pattern, content_text, re.IGNORECASE)
             for match in matches:
                 skill = match.strip()
                 # Only accept if it looks like a real technical skill
-                if (skill and len(skill) > 2 and 
-                    self._is_technical_skill(skill) and
-                    skill not in [s['name'] for s in skills]):
-                    skills.append({
-                        'name': skill,
-                        'confidence': 0.8,
-                        'source': 'tech_context'
-                    })
+                if skill and len(skill) > 2 and self._is_technical_skill(skill):
+                    skills.add(skill, confidence['tech_context'], SkillSource.TECH_CONTEXT)
         
         # Strategy 2: Look for specific technology mentions in role descriptions
         # Extract from patterns like "Frontend: React, TypeScript" 
@@ -406,19 +563,13 @@ class SkillExtractor:
         ]
         
         for pattern in role_tech_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+            matches = safe_regex.findall(pattern, stack_text, re.IGNORECASE)
             for match in matches:
                 # Split by commas and extract individual skills
                 skill_list = [s.strip() for s in match.split(',')]
                 for skill in skill_list:
-                    if (skill and len(skill) > 2 and 
-                        self._is_technical_skill(skill) and
-                        skill not in [s['name'] for s in skills]):
-                        skills.append({
-                            'name': skill,
-                            'confidence': 0.7,
-                            'source': 'role_tech'
-                        })
+                    if skill and len(skill) > 2 and self._is_technical_skill(skill):
+                        skills.add(skill, confidence['role_tech'], SkillSource.ROLE_TECH)
         
         # Strategy 3: Look for years of experience with specific technologies
         # Only extract the technology part, not the years
@@ -428,43 +579,33 @@ class SkillExtractor:
         ]
         
         for pattern in year_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+            matches = safe_regex.findall(pattern, requirements_text, re.IGNORECASE)
             for match in matches:
                 if isinstance(match, tuple) and len(match) == 2:
                     years, skill = match
                     skill = skill.strip()
-                    if (skill and len(skill) > 2 and 
-                        self._is_technical_skill(skill) and
-                        skill not in [s['name'] for s in skills]):
-                        skills.append({
-                            'name': skill,
-                            'confidence': 0.7,
-                            'source': 'years_experience'
-                        })
+                    if skill and len(skill) > 2 and self._is_technical_skill(skill):
+                        skills.add(skill, confidence['years_experience'], SkillSource.YEARS_EXPERIENCE)
         
         # Strategy 4: Look for specific technology mentions in bullet points
         # Only extract when technologies are clearly mentioned
+        # (bullet bodies are capped so a runaway line can't backtrack forever)
         bullet_tech_patterns = [
-            r'•\s*([^•\n]*?(?:React|TypeScript|Clojure|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD)[^•\n]*)',
-            r'\*\s*([^*\n]*?(?:React|TypeScript|Clojure|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD)[^*\n]*)',
-            r'-\s*([^-\n]*?(?:React|TypeScript|Clojure|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD)[^-\n]*)',
+            r'•\s*([^•\n]{0,300}?(?:React|TypeScript|Clojure|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD)[^•\n]{0,300})',
+            r'\*\s*([^*\n]{0,300}?(?:React|TypeScript|Clojure|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD)[^*\n]{0,300})',
+            r'-\s*([^-\n]{0,300}?(?:React|TypeScript|Clojure|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD)[^-\n]{0,300})',
         ]
         
         for pattern in bullet_tech_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+            matches = safe_regex.findall(pattern, content_text, re.IGNORECASE)
             for match in matches:
                 text = match.strip()
                 if text and len(text) > 5:
                     # Extract only the technology names from the bullet point
-                    tech_names = re.findall(r'(?:React|TypeScript|Clojure|ClojureScript|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD|Next\.js|Nextjs|Frontend|Backend)', text, re.IGNORECASE)
+                    tech_names = safe_regex.findall(r'(?:React|TypeScript|Clojure|ClojureScript|JavaScript|Python|Java|AWS|Docker|Kubernetes|Git|CI/CD|Next\.js|Nextjs|Frontend|Backend)', text, re.IGNORECASE)
                     for tech_name in tech_names:
-                        if (tech_name and 
-                            tech_name not in [s['name'] for s in skills]):
-                            skills.append({
-                                'name': tech_name,
-                                'confidence': 0.6,
-                                'source': 'bullet_tech'
-                            })
+                        if tech_name:
+                            skills.add(tech_name, confidence['bullet_tech'], SkillSource.BULLET_TECH)
         
         # Strategy 5: Look for specific technology mentions in the text
         # Extract individual technology names that are clearly mentioned
@@ -473,17 +614,12 @@ class SkillExtractor:
         ]
         
         for pattern in direct_tech_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
+            matches = safe_regex.findall(pattern, content_text, re.IGNORECASE)
             for match in matches:
-                if (match and 
-                    match not in [s['name'] for s in skills]):
-                    skills.append({
-                        'name': match,
-                        'confidence': 0.9,
-                        'source': 'direct_tech'
-                    })
+                if match:
+                    skills.add(match, confidence['direct_tech'], SkillSource.DIRECT_TECH)
         
-        return skills
+        return skills.to_list()
     
     def _extract_tech_terms_from_text(self, text: str) -> List[str]:
         """This method is deprecated and no longer used"""
@@ -491,120 +627,9 @@ class SkillExtractor:
 
     def _is_technical_skill(self, skill: str) -> bool:
         """Intelligently check if a skill is actually technical"""
-        skill_lower = skill.lower().strip()
-        
-        # Reject very short or very long terms
-        if len(skill_lower) < 2 or len(skill_lower) > 30:
-            return False
-        
-        # Reject common non-technical terms that are clearly not skills
-        non_technical = {
-            'we', 'the', 'this', 'that', 'these', 'those', 'required', 'experience',
-            'years', 'plus', 'level', 'certification', 'process', 'prescreen',
-            'network', 'enterprise', 'identify', 'develop', 'evaluate', 'coordinate',
-            'facilitate', 'manage', 'design', 'implement', 'analyze', 'assess',
-            'cth', 'asap', 'usc', 'poc', 'sme', 'hr', 'hcm', 'analyst',
-            'interview', 'phone', 'email', 'resume', 'cover letter', 'application',
-            'position', 'role', 'job', 'career', 'opportunity', 'company', 'team',
-            'department', 'division', 'organization', 'business', 'industry', 'sector',
-            'market', 'customer', 'client', 'user', 'stakeholder', 'partner',
-            'vendor', 'supplier', 'contractor', 'consultant', 'advisor', 'expert',
-            'specialist', 'professional', 'practitioner', 'practicing', 'working',
-            'collaborating', 'communicating', 'presenting', 'reporting', 'documenting',
-            'planning', 'organizing', 'coordinating', 'scheduling', 'prioritizing',
-            'problem solving', 'critical thinking', 'analytical thinking', 'creative thinking',
-            'strategic thinking', 'systems thinking', 'design thinking', 'lean thinking',
-            'agile thinking', 'scrum thinking', 'kanban thinking', 'devops thinking',
-            'cloud thinking', 'security thinking', 'compliance thinking', 'governance thinking',
-            'responsive', 'including', 'focus', 'role', 'description', 'duration', 'location',
-            'client', 'remote', 'month', 'front', 'end', 'script', 'developer', 'need',
-            'flexible', 'insurance', 'minutes', 'ladder', 'life', 'implementation', 'component',
-            'emphasis', 'strong', 'migration', 'quickly', 'existing', 'codebase', 'processes',
-            'contribute', 'tasks', 'evolving', 'tech', 'stack', 'assist', 'deliver', 'features',
-            'improvements', 'senior', 'onboarding', 'meaningful', 'contributions', 'ramp',
-            'both', 'closely', 'team', 'new', 'existing', 'quick', 'meaningful'
-        }
-        
-        if skill_lower in non_technical:
-            return False
-        
-        # Reject terms that start with common non-technical words
-        non_technical_starts = ['we ', 'the ', 'this ', 'that ', 'these ', 'those ', 'a ', 'an ', 'the ']
-        if any(skill_lower.startswith(start) for start in non_technical_starts):
-            return False
-        
-        # Reject generic action words that don't represent skills
-        action_words = {
-            'identify', 'develop', 'evaluate', 'coordinate', 'facilitate',
-            'manage', 'design', 'implement', 'analyze', 'assess', 'review',
-            'plan', 'execute', 'monitor', 'maintain', 'support', 'provide',
-            'assist', 'help', 'guide', 'train', 'mentor', 'coach', 'teach',
-            'learn', 'study', 'research', 'investigate', 'examine', 'inspect',
-            'test', 'validate', 'verify', 'confirm', 'check', 'review', 'audit'
-        }
-        
-        if skill_lower in action_words:
-            return False
-        
-        # Reject email/header patterns
-        if any(pattern in skill_lower for pattern in ['@', 'http', 'www', '.com', '.org']):
-            return False
-        
-        # Reject if it looks like a descriptive phrase (contains multiple words that form a sentence)
-        if len(skill_lower.split()) > 3:
-            return False
-        
-        # Reject if it contains punctuation that suggests it's not a skill
-        if any(char in skill for char in ['-', ':', ';', '(', ')', '[', ']', '{', '}']):
-            return False
-        
-        # Accept technical indicators (these are clearly technical)
-        technical_indicators = [
-            'api', 'sdk', 'framework', 'library', 'tool', 'platform', 'system',
-            'database', 'cloud', 'automation', 'configuration', 'deployment',
-            'monitoring', 'logging', 'testing', 'ci/cd', 'devops', 'infrastructure',
-            'frontend', 'backend', 'fullstack', 'mobile', 'web', 'desktop',
-            'server', 'client', 'network', 'security', 'data', 'analytics',
-            'machine learning', 'ai', 'artificial intelligence', 'ml', 'deep learning',
-            'blockchain', 'cryptocurrency', 'iot', 'internet of things'
-        ]
-        
-        if any(indicator in skill_lower for indicator in technical_indicators):
-            return True
-        
-        # Accept programming languages and technologies (these are clearly technical)
-        tech_terms = [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
-            'php', 'ruby', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql',
-            'html', 'css', 'sass', 'less', 'react', 'angular', 'vue', 'node',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'linux', 'windows',
-            'macos', 'git', 'jenkins', 'terraform', 'ansible', 'puppet', 'chef',
-            'next.js', 'nextjs', 'clojure', 'clojurescript', 'frontend', 'backend'
-        ]
-        
-        if any(term in skill_lower for term in tech_terms):
-            return True
-        
-        # Accept certification acronyms (these are clearly technical)
-        if re.match(r'^[A-Z]{2,6}$', skill):
-            return True
-        
-        # Accept skills that contain technical words
-        technical_words = [
-            'code', 'programming', 'development', 'engineering', 'architecture',
-            'design', 'testing', 'deployment', 'infrastructure', 'platform',
-            'framework', 'library', 'tool', 'system', 'database', 'api',
-            'cloud', 'automation', 'monitoring', 'security', 'network',
-            'data', 'analytics', 'machine learning', 'ai', 'blockchain'
-        ]
-        
-        if any(word in skill_lower for word in technical_words):
-            return True
-        
-        # Default to rejecting if it doesn't clearly look like a technical skill
-        return False
+        return self.skill_classifier.is_technical(skill)
 
-    def _filter_generic_skills(self, skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _filter_generic_skills(self, skills: List[Skill]) -> List[Skill]:
         """Post-processes extracted skills to remove generic action verbs and phrases."""
         generic_verbs = {
             'develop', 'evaluate', 'identify', 'analyze', 'implement', 'design',
@@ -616,29 +641,24 @@ class SkillExtractor:
         
         filtered_skills = []
         for skill in skills:
-            skill_name = skill['name'].lower()
+            skill_name = skill.name.lower()
             if skill_name not in generic_verbs:
                 filtered_skills.append(skill)
         
         return filtered_skills
 
-    def _deduplicate_and_rank(self, skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_and_rank(self, skills: List[Skill]) -> List[Skill]:
         """Remove duplicates and rank by confidence"""
-        seen = set()
-        unique_skills = []
+        # Aliases of one skill (NodeJS, Node.js, node) collapse to one entry
+        unique_skills = SkillAccumulator(self.taxonomy)
+        unique_skills.extend(skills)
         
-        for skill in skills:
-            skill_name = skill['name'].lower()
-            if skill_name not in seen:
-                seen.add(skill_name)
-                unique_skills.append(skill)
-        
-        # Sort by confidence and limit to 5
-        unique_skills.sort(key=lambda x: x['confidence'], reverse=True)
-        return unique_skills[:5] 
+        # Rank by confidence and keep the configured number
+        return unique_skills.top(active_config().limits['final_skills'])
     
-    def _extract_fallback_skills(self, job_description: str) -> List[Dict[str, Any]]:
+    def _extract_fallback_skills(self, job_description: str) -> List[Skill]:
         """Fallback method to ensure we always extract some technical skills"""
+        confidence = active_config().confidence
         skills = []
         
         # Look for common technical terms that might be missed
@@ -654,10 +674,6 @@ class SkillExtractor:
                 # Only add if it's in a technical context
                 context_words = ['experience', 'knowledge', 'familiarity', 'proficiency', 'expertise']
                 if any(context_word in job_description.lower() for context_word in context_words):
-                    skills.append({
-                        'name': keyword.title(),
-                        'confidence': 0.4,
-                        'source': 'fallback'
-                    })
+                    skills.append(Skill(keyword.title(), confidence['fallback'], SkillSource.FALLBACK))
         
         return skills 
\ No newline at end of file
@@ -0,0 +1,97 @@
+import sys
+from enum import IntFlag
+from typing import Any, Dict, List, Union
+
+
+class SkillSource(IntFlag):
+    """Strategy that produced a skill. Flags, so merged sources fit in one int."""
+    OTHER = 1 << 0
+    AI_DYNAMIC_ANALYSIS = 1 << 1
+    AI_ANALYSIS = 1 << 2
+    GEMINI = 1 << 3
+    OPENAI = 1 << 4
+    NLP_NER = 1 << 5
+    NLP_CHUNKS = 1 << 6
+    NLP_PATTERNS = 1 << 7
+    JOB_TITLE_INFERENCE = 1 << 8
+    KEYWORD_MATCH = 1 << 9
+    TECH_CONTEXT = 1 << 10
+    ROLE_TECH = 1 << 11
+    YEARS_EXPERIENCE = 1 << 12
+    BULLET_TECH = 1 << 13
+    DIRECT_TECH = 1 << 14
+    FALLBACK = 1 << 15
+
+    @property
+    def label(self) -> str:
+        """Wire name used in API responses ('ai_dynamic_analysis', 'direct_tech', ...)"""
+        return self.name.lower()
+
+    @classmethod
+    def parse(cls, value: Union['SkillSource', str]) -> 'SkillSource':
+        if isinstance(value, cls):
+            return value
+        return _SOURCE_BY_LABEL.get(value, cls.OTHER)
+
+    @classmethod
+    def labels(cls, mask: int) -> List[str]:
+        return [source.label for source in _SINGLE_SOURCES if mask & source]
+
+
+_SINGLE_SOURCES = list(SkillSource.__members__.values())
+_SOURCE_BY_LABEL = {source.label: source for source in _SINGLE_SOURCES}
+
+
+class Skill:
+    """
+    Compact record for one extracted skill. Names are interned and sources
+    are enum-coded, so thousands of these in a batch or cache share their
+    strings; convert with to_dict() only at the API edge.
+    """
+
+    __slots__ = ('name', 'confidence', 'source', 'sources')
+
+    def __init__(self, name: str, confidence: float, source: Union[SkillSource, str], sources: int = 0):
+        self.name = sys.intern(name)
+        self.confidence = confidence
+        self.source = SkillSource.parse(source)
+        self.sources = sources | self.source
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Skill':
+        sources = 0
+        for label in data.get('sources', ()):
+            sources |= SkillSource.parse(label)
+        return cls(data['name'], data.get('confidence', 0.0), data.get('source', 'other'), sources)
+
+    @classmethod
+    def coerce(cls, value: Union['Skill', Dict[str, Any]]) -> 'Skill':
+        """Accept either a record or the JSON-style dict callers used to pass"""
+        return value if isinstance(value, cls) else cls.from_dict(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'confidence': self.confidence,
+            'source': self.source.label,
+            'sources': SkillSource.labels(self.sources),
+        }
+
+    def _key(self):
+        return self.name, self.confidence, self.source, self.sources
+
+    def __eq__(self, other):
+        if not isinstance(other, Skill):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        # Same fields as __eq__; don't change a record while it is in a set or dict
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"Skill({self.name!r}, {self.confidence}, {self.source.label!r})"
+
+
+def skills_to_dicts(skills: List[Skill]) -> List[Dict[str, Any]]:
+    return [skill.to_dict() for skill in skills]
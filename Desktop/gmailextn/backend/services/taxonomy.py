@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+TAXONOMY_PATH = os.path.join(DATA_DIR, 'skill_taxonomy.json')
+ARTIFACT_PATH = os.path.join(DATA_DIR, 'skill_taxonomy.compiled.pickle')
+
+# Bumped whenever the compiled layout changes so stale artifacts are rebuilt
+COMPILED_FORMAT = 1
+
+# Alias tokens: "Node.js" -> node, js; "CI/CD" -> ci, cd; "C++" -> c++
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+# Terminal marker in the trie (never a valid token)
+_END = ''
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_alias(text: str) -> str:
+    """Hash-index key: "NodeJS", "Node.js" and "node js" all become "nodejs" """
+    return ''.join(tokenize(text))
+
+
+def compile_taxonomy(source: Dict[str, Any], source_digest: str = '') -> Dict[str, Any]:
+    """Compile the taxonomy data file into plain dicts for fast lookup"""
+    skills = {}
+    alias_index = {}
+    trie = {}
+
+    for entry in source['skills']:
+        skill_id = entry['id']
+        if skill_id in skills:
+            raise ValueError(f"Duplicate skill id in taxonomy: {skill_id}")
+
+        skills[skill_id] = {
+            'id': skill_id,
+            'name': entry['name'],
+            'category': entry.get('category', ''),
+            'context': entry.get('context'),
+            'context_from': entry.get('context_from'),
+            'email_signal': entry.get('email_signal', False),
+        }
+
+        lookup_only = {normalize_alias(alias) for alias in entry.get('lookup_aliases', [])}
+        for alias in [entry['name']] + entry.get('aliases', []) + entry.get('lookup_aliases', []):
+            key = normalize_alias(alias)
+            if not key:
+                continue
+            owner = alias_index.setdefault(key, skill_id)
+            if owner != skill_id:
+                raise ValueError(f"Alias '{alias}' maps to both {owner} and {skill_id}")
+
+            # Lookup-only aliases ("Go", "R", "Node") resolve exact names but
+            # are too ambiguous to match in free text
+            if key in lookup_only:
+                continue
+            node = trie
+            for token in tokenize(alias):
+                node = node.setdefault(token, {})
+            node[_END] = skill_id
+
+    for skill in skills.values():
+        parent = skill['context_from']
+        if parent and parent not in skills:
+            raise ValueError(f"{skill['id']} takes context from unknown skill {parent}")
+
+    job_titles = []
+    for title in source.get('job_titles', []):
+        for skill_id in title.get('skills', []):
+            if skill_id not in skills:
+                raise ValueError(f"Job title '{title['match']}' references unknown skill {skill_id}")
+        job_titles.append({
+            'match': title['match'].lower(),
+            'skills': list(title.get('skills', [])),
+            'boolean': title.get('boolean'),
+        })
+
+    return {
+        'format': COMPILED_FORMAT,
+        'version': source.get('version', 1),
+        'source_digest': source_digest,
+        'skills': skills,
+        'alias_index': alias_index,
+        'trie': trie,
+        'job_titles': job_titles,
+    }
+
+
+def _read_source(path: str) -> Tuple[Dict[str, Any], str]:
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return json.loads(raw), hashlib.sha256(raw).hexdigest()
+
+
+def _write_artifact(compiled: Dict[str, Any], artifact_path: str):
+    # A temp file per writer: workers compiling at once never replace the artifact with another's partial write
+    tmp_path = f"{artifact_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, artifact_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def build_artifact(source_path: str = TAXONOMY_PATH, artifact_path: str = ARTIFACT_PATH) -> Dict[str, Any]:
+    """Compile the taxonomy and write the fast-loading artifact"""
+    source, digest = _read_source(source_path)
+    compiled = compile_taxonomy(source, digest)
+    _write_artifact(compiled, artifact_path)
+    return compiled
+
+
+def load_compiled(source_path: str = TAXONOMY_PATH, artifact_path: str = ARTIFACT_PATH) -> Dict[str, Any]:
+    """Load the compiled artifact if it matches the data file, else compile it"""
+    source, digest = _read_source(source_path)
+
+    try:
+        with open(artifact_path, 'rb') as f:
+            compiled = pickle.load(f)
+        if compiled.get('format') == COMPILED_FORMAT and compiled.get('source_digest') == digest:
+            return compiled
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        pass
+
+    compiled = compile_taxonomy(source, digest)
+    try:
+        _write_artifact(compiled, artifact_path)
+    except OSError as e:
+        # Read-only deploys still work, they just compile on every start
+        print(f"DEBUG: Could not write taxonomy artifact: {e}")
+    return compiled
+
+
+class SkillTaxonomy:
+    """
+    Canonical skill IDs with an alias hash index (exact name lookups) and a
+    token trie (scanning free text for mentions). Shared by the extractor,
+    boolean generator, context analyzer and job email detector.
+    """
+
+    def __init__(self, compiled: Dict[str, Any]):
+        self.version = compiled['version']
+        self.skills = compiled['skills']
+        self._alias_index = compiled['alias_index']
+        self._trie = compiled['trie']
+        self._job_titles = compiled['job_titles']
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Canonical skill id for a name or alias, or None if unknown"""
+        return self._alias_index.get(normalize_alias(name))
+
+    def canonical_key(self, name: str) -> str:
+        """Dedupe key: the canonical id when known, the normalized name otherwise"""
+        key = normalize_alias(name)
+        return self._alias_index.get(key) or key or name.lower().strip()
+
+    def canonical_name(self, name: str) -> str:
+        skill_id = self.resolve(name)
+        return self.skills[skill_id]['name'] if skill_id else name
+
+    def name_for(self, skill_id: str) -> str:
+        return self.skills[skill_id]['name']
+
+    def iter_mentions(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (skill_id, start, end) for each longest alias match in text"""
+        tokens = [(m.group(), m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text.lower())]
+        i = 0
+        while i < len(tokens):
+            node = self._trie
+            match_id, match_end = None, i
+            j = i
+            while j < len(tokens) and tokens[j][0] in node:
+                node = node[tokens[j][0]]
+                j += 1
+                if _END in node:
+                    match_id, match_end = node[_END], j
+            if match_id:
+                yield match_id, tokens[i][1], tokens[match_end - 1][2]
+                i = match_end
+            else:
+                i += 1
+
+    def find_in_text(self, text: str) -> List[str]:
+        """Distinct skill ids mentioned in text, in order of first mention"""
+        seen = {}
+        for skill_id, _, _ in self.iter_mentions(text):
+            seen.setdefault(skill_id, None)
+        return list(seen)
+
+    def ids_with_flag(self, flag: str) -> List[str]:
+        return [skill_id for skill_id, skill in self.skills.items() if skill.get(flag)]
+
+    def context_for(self, name: str) -> Optional[Dict[str, Any]]:
+        """Interview context for a skill name, via the skill itself or any skill it mentions"""
+        candidates = [self.resolve(name)] + self.find_in_text(name)
+        for skill_id in candidates:
+            while skill_id:
+                skill = self.skills[skill_id]
+                if skill['context']:
+                    return skill['context']
+                skill_id = skill['context_from']
+        return None
+
+    def contexts(self) -> Dict[str, Dict[str, Any]]:
+        return {skill_id: skill['context'] for skill_id, skill in self.skills.items() if skill['context']}
+
+    def title_skills(self, job_title: str) -> List[str]:
+        """Skill names implied by a job title (e.g. "Workday" -> HCM, HRIS, ...)"""
+        job_title_lower = job_title.lower()
+        names = []
+        for title in self._job_titles:
+            if title['skills'] and title['match'] in job_title_lower:
+                names.extend(self.name_for(skill_id) for skill_id in title['skills'])
+        return names
+
+    def title_booleans(self) -> Dict[str, str]:
+        """Hand-tuned boolean strings for common job titles, most specific first"""
+        return {title['match']: title['boolean'] for title in self._job_titles if title['boolean']}
+
+
+@lru_cache(maxsize=1)
+def get_taxonomy() -> SkillTaxonomy:
+    """Process-wide taxonomy, loaded once"""
+    return SkillTaxonomy(load_compiled())
+
+
+if __name__ == "__main__":
+    # Build step: python -m services.taxonomy build
+    if len(sys.argv) > 1 and sys.argv[1] == 'build':
+        compiled = build_artifact()
+        print(f"Compiled {len(compiled['skills'])} skills / {len(compiled['alias_index'])} aliases -> {ARTIFACT_PATH}")
+    else:
+        print("Usage: python -m services.taxonomy build")
@@ -0,0 +1,34 @@
+import re
+from typing import Optional
+
+# Optional exact counts (pip install tiktoken). Gemini and OpenAI tokenizers
+# differ anyway, so the heuristic below is close enough for budgeting.
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Words, numbers and individual punctuation marks
+_PIECES = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+_encoding: Optional[object] = None
+
+
+def _tiktoken_encoding():
+    global _encoding
+    if _encoding is None:
+        _encoding = tiktoken.get_encoding('cl100k_base')
+    return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate LLM token count for text"""
+    if not text:
+        return 0
+    if tiktoken is not None:
+        return len(_tiktoken_encoding().encode(text))
+    # BPE vocabularies split long words: roughly one token per 4 letters
+    count = 0
+    for piece in _PIECES.findall(text):
+        count += 1 + (len(piece) - 1) // 4 if piece[0].isalpha() else 1
+    return count
@@ -0,0 +1,203 @@
+import atexit
+import glob
+import gzip
+import hashlib
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+# Sampled capture of API traffic for replay against another build
+# (replay_traffic.py). Off unless FIRKI_CAPTURE_DIR is set.
+CAPTURE_DIR = os.getenv('FIRKI_CAPTURE_DIR', '')
+# Fraction of requests captured
+CAPTURE_SAMPLE = float(os.getenv('FIRKI_CAPTURE_SAMPLE', '0.01'))
+# Replace email addresses, phone numbers and URLs in captured requests and replies
+CAPTURE_REDACT = os.getenv('FIRKI_CAPTURE_REDACT', '1') != '0'
+# Fields (at any depth) stored only as a salted hash
+CAPTURE_HASH_FIELDS = [f.strip() for f in os.getenv('FIRKI_CAPTURE_HASH_FIELDS', 'sender').split(',') if f.strip()]
+CAPTURE_SALT = os.getenv('FIRKI_CAPTURE_SALT', '')
+# Rotate after this many uncompressed bytes; keep this many files
+CAPTURE_MAX_BYTES = int(os.getenv('FIRKI_CAPTURE_MAX_BYTES', str(64 * 1024 * 1024)))
+CAPTURE_KEEP_FILES = int(os.getenv('FIRKI_CAPTURE_KEEP_FILES', '10'))
+# Records waiting for the writer; beyond this, captures are dropped
+CAPTURE_QUEUE_SIZE = 1000
+
+CAPTURED_ENDPOINTS = ('/api/analyze-jd', '/api/detect-job-email', '/analytics')
+
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+_PHONE = re.compile(r'(?<!\w)\+?\d[\d ().-]{7,}\d(?!\w)')
+_URL = re.compile(r'https?://\S+', re.IGNORECASE)
+
+
+def redact_text(text: str) -> str:
+    text = _URL.sub('<url>', text)
+    text = _EMAIL.sub('<email>', text)
+    return _PHONE.sub('<phone>', text)
+
+
+def hash_value(value: str, salt: str = '') -> str:
+    return 'sha256:' + hashlib.sha256(f"{salt}{value}".encode('utf-8')).hexdigest()[:16]
+
+
+def sanitize(value: Any, redact: bool = True, hash_fields: List[str] = (), salt: str = '') -> Any:
+    """
+    A copy of a JSON request or response body with string values of
+    hash_fields keys hashed and all other strings redacted, at any depth
+    of nested objects and lists.
+    """
+    if isinstance(value, dict):
+        return {field: hash_value(item, salt) if field in hash_fields and isinstance(item, str)
+                else sanitize(item, redact, hash_fields, salt)
+                for field, item in value.items()}
+    if isinstance(value, list):
+        return [sanitize(item, redact, hash_fields, salt) for item in value]
+    if redact and isinstance(value, str):
+        return redact_text(value)
+    return value
+
+
+class CaptureLog:
+    """
+    Gzipped JSONL capture files in one directory, written by a background
+    thread so requests never wait on disk. A new file is started every
+    max_bytes (uncompressed); only the newest keep_files are kept. Several
+    processes can share the directory: file names carry the pid, and each
+    log only prunes the files it wrote itself.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = CAPTURE_MAX_BYTES, keep_files: int = CAPTURE_KEEP_FILES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.keep_files = keep_files
+        self.dropped = 0
+        self.written = 0
+        self._queue = queue.Queue(maxsize=CAPTURE_QUEUE_SIZE)
+        self._file = None
+        self._file_bytes = 0
+        self._files: List[str] = []
+        os.makedirs(directory, exist_ok=True)
+        self._writer = threading.Thread(target=self._write_loop, name='traffic-capture', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def submit(self, record: Dict[str, Any]):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self, timeout: float = 5.0):
+        """Wait until everything submitted so far is on disk"""
+        done = threading.Event()
+        self._queue.put(done, timeout=timeout)
+        done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Write what is queued, finish the current file and stop the writer"""
+        if self._writer.is_alive():
+            self._queue.put(None, timeout=timeout)
+            self._writer.join(timeout)
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+            if isinstance(item, threading.Event):
+                if self._file is not None:
+                    self._file.flush()
+                item.set()
+                continue
+            try:
+                self._write(json.dumps(item, ensure_ascii=False, separators=(',', ':')) + '\n')
+            except Exception as e:
+                print(f"DEBUG: Traffic capture write failed: {e}")
+
+    def _write(self, line: str):
+        if self._file is None or self._file_bytes >= self.max_bytes:
+            self._rotate()
+        self._file.write(line)
+        self._file_bytes += len(line)
+        self.written += 1
+        # Flush once the queue drains, so a live capture directory can be replayed
+        if self._queue.empty():
+            self._file.flush()
+
+    def _rotate(self):
+        if self._file is not None:
+            self._file.close()
+        # Timestamp first, so capture_files() still lists every process's files oldest first
+        name = f"capture-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{os.getpid()}.jsonl.gz"
+        path = os.path.join(self.directory, name)
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._file_bytes = 0
+        self._files.append(path)
+        while len(self._files) > self.keep_files:
+            try:
+                os.remove(self._files.pop(0))
+            except OSError:
+                pass
+
+
+class TrafficCapture:
+    """Decides which requests to capture and sanitizes them for the log"""
+
+    def __init__(self, log: CaptureLog, sample: float = CAPTURE_SAMPLE, redact: bool = CAPTURE_REDACT,
+                 hash_fields: List[str] = CAPTURE_HASH_FIELDS, salt: str = CAPTURE_SALT):
+        self.log = log
+        self.sample = sample
+        self.redact = redact
+        self.hash_fields = list(hash_fields)
+        self.salt = salt
+
+    def should_capture(self, path: str) -> bool:
+        return path in CAPTURED_ENDPOINTS and random.random() < self.sample
+
+    def record(self, path: str, body: Any, status: int, response: Any, latency_ms: float):
+        self.log.submit({
+            'ts': time.time(),
+            'endpoint': path,
+            'request': sanitize(body, self.redact, self.hash_fields, self.salt),
+            'status': status,
+            'response': sanitize(response, self.redact, self.hash_fields, self.salt),
+            'latency_ms': round(latency_ms, 1),
+        })
+
+
+@lru_cache(maxsize=1)
+def get_traffic_capture() -> Optional[TrafficCapture]:
+    """The process-wide capture from FIRKI_CAPTURE_DIR, or None when unset"""
+    if not CAPTURE_DIR or CAPTURE_SAMPLE <= 0:
+        return None
+    return TrafficCapture(CaptureLog(CAPTURE_DIR))
+
+
+def capture_files(path: str) -> List[str]:
+    """Capture files at `path` (a file or a capture directory), oldest first"""
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, 'capture-*.jsonl.gz')))
+    return [path]
+
+
+def read_captures(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """Captured records from files or capture directories, in file order"""
+    for path in paths:
+        for file_path in capture_files(path):
+            try:
+                with gzip.open(file_path, 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+            except EOFError:
+                # The file being written, or cut short by a kill: keep what was flushed
+                continue
@@ -49,7 +49,7 @@ def test_boolean_generation():
         {'name': 'SQL', 'confidence': 0.7, 'source': 'test'}
     ]
     
-    boolean_search = generator.generate_search(test_skills, "Workday Data Conversion Specialist")
+    boolean_search = generator.generate_boolean_search(test_skills, "Workday Data Conversion Specialist")
     print(f"Skills: {[s['name'] for s in test_skills]}")
     print(f"Boolean Search: {boolean_search}")
     
@@ -104,7 +104,7 @@ def test_fallback_functionality():
     print(f"Fallback Method: {extractor.last_method_used}")
     
     # Test boolean generation
-    boolean_search = generator.generate_search(skills, "React Developer")
+    boolean_search = generator.generate_boolean_search(skills, "React Developer")
     print(f"Fallback Boolean: {boolean_search}")
     
     # Test context analysis